@@ -0,0 +1,191 @@
+"""
+통화 세션 API 엔드포인트
+하나의 통화를 여러 조각(텍스트/음성)으로 나누어 보내고 통화 단위로 누적 분석합니다.
+조각마다 새로 들어온 부분만 보내면 되므로 전체 대화를 매번 다시 보낼 필요가 없습니다.
+"""
+
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
+from loguru import logger
+from starlette.concurrency import run_in_threadpool
+
+from api.dependencies import (
+    get_language_packs, get_loaded_speech_analyzer, get_session_manager, get_speech_analyzer,
+    analysis_stats, rate_limiter
+)
+from api.responses import FastJSONResponse, compact_session
+from api.scheduling import get_client_id, scheduled, take_reservation
+from config import settings
+from services.call_session import (
+    CallSessionError, CallSessionExists, CallSessionManager, CallSessionNotFound
+)
+from services.language_packs import LanguagePackNotFound, LanguagePacks
+from services.speech_analyzer import SpeechAnalyzer
+
+
+router = APIRouter(prefix="/api/voice/sessions", tags=["call-sessions"])
+
+
+@router.post("")
+async def create_session(
+    call_id: Optional[str] = None,
+    language: Optional[str] = None,
+    session_manager: CallSessionManager = Depends(get_session_manager),
+    language_packs: LanguagePacks = Depends(get_language_packs)
+) -> Dict[str, Any]:
+    """
+    통화 세션을 시작합니다.
+
+    Args:
+        call_id: 통화 ID (없으면 서버에서 생성)
+        language: 통화 언어 (ko, en, zh 등, 없으면 기본 언어 - 세션 동안 유지)
+
+    Returns:
+        Dict: 세션 상태
+    """
+    try:
+        session = session_manager.create(call_id, language_packs.resolve(language))
+    except LanguagePackNotFound as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except CallSessionExists as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    logger.info(f"통화 세션 시작: {session['call_id']}")
+    return {"success": True, "session": session}
+
+
+@router.post("/{call_id}/append")
+async def append_text(
+    request: Request,
+    call_id: str,
+    text: str,
+    compact: bool = False,
+    session_manager: CallSessionManager = Depends(get_session_manager)
+) -> Dict[str, Any]:
+    """
+    통화 세션에 텍스트 조각을 추가합니다.
+
+    Args:
+        call_id: 통화 ID
+        text: 새로 들어온 텍스트 조각
+        compact: 권장사항을 문구 대신 ID로 받을지 여부 (문구는 /api/voice/messages)
+
+    Returns:
+        Dict: 누적 분석 결과
+    """
+    if not text or not text.strip():
+        raise HTTPException(status_code=400, detail="분석할 텍스트가 비어있습니다.")
+
+    # 실시간 통화 분석은 스케줄러의 최우선(streaming) 등급
+    async with scheduled("streaming", request):
+        result = await _append(session_manager, call_id, text)
+    return _session_response(result, compact)
+
+
+@router.post("/{call_id}/append-audio")
+async def append_audio(
+    request: Request,
+    call_id: str,
+    audio_file: UploadFile = File(..., description="추가할 음성 조각"),
+    compact: bool = False,
+    session_manager: CallSessionManager = Depends(get_session_manager),
+    speech_analyzer: SpeechAnalyzer = Depends(get_speech_analyzer),
+    language_packs: LanguagePacks = Depends(get_language_packs)
+) -> Dict[str, Any]:
+    """
+    통화 세션에 음성 조각을 추가합니다 (텍스트로 변환 후 누적 분석).
+
+    Args:
+        call_id: 통화 ID
+        audio_file: 음성 조각 파일
+        compact: 권장사항을 문구 대신 ID로 받을지 여부
+
+    Returns:
+        Dict: 누적 분석 결과
+    """
+    # 음성 인식 전에 세션 존재 여부와 인식 언어를 먼저 확인
+    try:
+        speech_language = language_packs.speech_language(session_manager.get(call_id)["language"])
+    except CallSessionNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    if audio_file.size is not None and audio_file.size > settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024:
+        raise HTTPException(status_code=400,
+                            detail=f"파일 크기가 너무 큽니다. 최대 {settings.MAX_UPLOAD_SIZE_MB}MB까지 지원합니다.")
+
+    async with scheduled("streaming", request):
+        speech_result = await run_in_threadpool(speech_analyzer.audio_to_text, audio_file.file, call_id,
+                                                speech_language)
+        rate_limiter.settle(get_client_id(request), "audio", take_reservation(request),
+                            speech_result.get("duration") or 0)
+        analysis_stats.record_recognition(speech_result["success"],
+                                          speech_result.get("input_error", False))
+        analysis_stats.record_audio_preprocessing(speech_result.get("preprocessing"))
+        if not speech_result["success"]:
+            raise HTTPException(status_code=400 if speech_result.get("input_error") else 500,
+                                detail=f"음성 인식 실패: {speech_result['error']}")
+
+        if not speech_result["text"].strip():
+            # 인식된 말이 없는 조각은 세션 상태만 반환
+            return _session_response(
+                {"success": True, "recognized_text": "", "session": session_manager.get(call_id)}, compact
+            )
+
+        result = await _append(session_manager, call_id, speech_result["text"])
+    result["recognized_text"] = speech_result["text"]
+    return _session_response(result, compact)
+
+
+@router.get("/{call_id}")
+async def get_session(
+    call_id: str,
+    compact: bool = False,
+    session_manager: CallSessionManager = Depends(get_session_manager)
+) -> Dict[str, Any]:
+    """통화 세션의 현재 누적 분석 결과를 반환합니다."""
+    try:
+        return _session_response({"success": True, "session": session_manager.get(call_id)}, compact)
+    except CallSessionNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.post("/{call_id}/close")
+async def close_session(
+    call_id: str,
+    compact: bool = False,
+    session_manager: CallSessionManager = Depends(get_session_manager)
+) -> Dict[str, Any]:
+    """통화 세션을 종료하고 최종 분석 결과를 반환합니다."""
+    try:
+        session = session_manager.close(call_id)
+    except CallSessionNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    # 통화별 배경 소음 보정값 정리 (음성 조각을 받은 적이 있는 경우)
+    speech_analyzer = get_loaded_speech_analyzer()
+    if speech_analyzer is not None:
+        speech_analyzer.forget_source(call_id)
+
+    logger.info(f"통화 세션 종료: {call_id}, 위험도: {session['risk_score']:.2f}")
+    return _session_response({"success": True, "session": session}, compact)
+
+
+async def _append(session_manager: CallSessionManager, call_id: str, text: str) -> Dict[str, Any]:
+    """조각을 별도 스레드에서 분석해 세션에 추가합니다."""
+    try:
+        session = await run_in_threadpool(session_manager.append, call_id, text)
+    except CallSessionNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except CallSessionError as e:
+        logger.error(f"통화 세션 분석 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"통화 세션 분석 중 오류가 발생했습니다: {str(e)}")
+
+    return {"success": True, "session": session}
+
+
+def _session_response(result: Dict[str, Any], compact: bool) -> FastJSONResponse:
+    """세션 응답 (압축 응답이면 권장사항 문구를 빼고 ID만 남김)"""
+    if compact:
+        result = {**result, "session": compact_session(result["session"])}
+    return FastJSONResponse(result)
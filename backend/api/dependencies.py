@@ -0,0 +1,297 @@
+"""
+API 의존성 모듈
+서비스 인스턴스를 처음 필요할 때 생성하고, 서버 시작 시 미리 준비(warm-up)합니다.
+"""
+
+import asyncio
+import threading
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from config import settings
+from services.analysis_stats import AnalysisStats
+from services.call_session import CallSessionManager
+from services.detector_export import ExportCache
+from services.fraud_detector import FraudDetector
+from services.job_queue import JobHandler, JobQueue
+from services.language_packs import LanguagePacks
+from services.load_shedder import LoadShedder
+from services.noise_floor import NoiseCalibrationCache
+from services.rate_limiter import RateLimiter
+from services.reputation_store import ReputationStore
+from services.scheduler import PriorityScheduler
+from services.shadow import ShadowEvaluator, create_shadow_evaluator
+from services.single_flight import SingleFlight
+from services.speech_analyzer import SpeechAnalyzer
+from services.worker_pool import AnalysisWorkerPool
+
+
+_lock = threading.Lock()
+_fraud_detector: Optional[FraudDetector] = None
+_language_packs: Optional[LanguagePacks] = None
+_speech_analyzer: Optional[SpeechAnalyzer] = None
+_analysis_pool: Optional[AnalysisWorkerPool] = None
+_session_manager: Optional[CallSessionManager] = None
+_shadow_evaluator: Optional[ShadowEvaluator] = None
+_shadow_loaded = False
+_job_queue: Optional[JobQueue] = None
+
+# 작업 종류별 처리 함수 (API 모듈이 register_job_handler로 등록)
+_job_handlers: Dict[str, JobHandler] = {}
+
+# warm-up 완료 여부 (준비 상태 확인에서 대기)
+_ready_event: Optional[asyncio.Event] = None
+
+# 통계 집계기와 부하 차단기 (생성 비용이 작아 바로 생성)
+analysis_stats = AnalysisStats(min_events=settings.READY_MIN_EVENTS)
+load_shedder = LoadShedder(settings.MAX_IN_FLIGHT_REQUESTS, settings.MAX_QUEUE_DEPTH)
+
+# 작업 스케줄러 (우선순위 등급별 대기열, 이벤트 루프에서 사용)
+scheduler = PriorityScheduler(
+    settings.SCHEDULER_CONCURRENCY,
+    reserved_slots=settings.SCHEDULER_RESERVED_SLOTS,
+    max_queue=settings.SCHEDULER_MAX_QUEUE,
+    deadlines_ms=settings.SCHEDULER_DEADLINES_MS,
+    client_weights=settings.SCHEDULER_CLIENT_WEIGHTS
+)
+
+# 같은 음성 파일의 동시 분석 합치기 (텍스트는 분석 워커 풀에서 합침)
+audio_flights = SingleFlight()
+
+# 언어별 탐지기 내보내기 바이트/다이제스트 (탐지기 인스턴스가 같으면 다시 직렬화하지 않음)
+detector_exports = ExportCache()
+
+# 클라이언트별 요청 한도 (text: 요청 수, audio: 음성 초)
+rate_limiter = RateLimiter(
+    {
+        "text": (settings.RATE_LIMIT_TEXT_PER_MINUTE, settings.RATE_LIMIT_TEXT_BURST),
+        "audio": (settings.RATE_LIMIT_AUDIO_SECONDS_PER_MINUTE, settings.RATE_LIMIT_AUDIO_BURST_SECONDS)
+    },
+    max_clients=settings.RATE_LIMIT_MAX_CLIENTS,
+    store_path=settings.RATE_LIMIT_STORE_PATH
+)
+
+
+def create_fraud_detector(scoring_rules_path: Optional[str] = None,
+                          language_pack: Optional[Dict[str, Any]] = None,
+                          reputation_store: Optional[ReputationStore] = None) -> FraudDetector:
+    """
+    설정값으로 새 사기 탐지기를 만듭니다 (서버 밖의 도구에서도 같은 설정을 쓰도록).
+
+    Args:
+        scoring_rules_path: 규칙 파일 경로 (없으면 settings.SCORING_RULES_PATH)
+        language_pack: 언어 팩 (없으면 기본 한국어)
+        reputation_store: 평판 저장소 (없으면 settings.REPUTATION_DB_PATH로 새로 열기)
+    """
+    return FraudDetector(
+        reputation_store=reputation_store or ReputationStore.open_if_exists(settings.REPUTATION_DB_PATH),
+        scoring_rules=_read_scoring_rules(scoring_rules_path or settings.SCORING_RULES_PATH),
+        suspicion_threshold=settings.FRAUD_SUSPICION_SCORE,
+        language_pack=language_pack
+    )
+
+
+def get_fraud_detector() -> FraudDetector:
+    """사기 탐지기 인스턴스를 반환합니다 (처음 호출 시 생성)"""
+    global _fraud_detector
+    if _fraud_detector is None:
+        with _lock:
+            if _fraud_detector is None:
+                _fraud_detector = create_fraud_detector()
+    return _fraud_detector
+
+
+def get_language_packs() -> LanguagePacks:
+    """언어 팩 관리자를 반환합니다 (처음 호출 시 생성, 다른 언어 탐지기는 처음 요청될 때 생성)"""
+    global _language_packs
+    if _language_packs is None:
+        fraud_detector = get_fraud_detector()
+        with _lock:
+            if _language_packs is None:
+                _language_packs = LanguagePacks(
+                    fraud_detector,
+                    lambda pack: create_fraud_detector(
+                        language_pack=pack, reputation_store=fraud_detector.reputation_store
+                    ),
+                    pack_dir=settings.LANGUAGE_PACK_DIR,
+                    max_resident=settings.MAX_RESIDENT_LANGUAGE_PACKS
+                )
+    return _language_packs
+
+
+def get_speech_analyzer() -> SpeechAnalyzer:
+    """음성 분석기 인스턴스를 반환합니다 (처음 호출 시 생성)"""
+    global _speech_analyzer
+    if _speech_analyzer is None:
+        with _lock:
+            if _speech_analyzer is None:
+                _speech_analyzer = SpeechAnalyzer(
+                    target_sample_rate=settings.SPEECH_TARGET_SAMPLE_RATE,
+                    noise_cache=NoiseCalibrationCache(settings.MAX_SESSIONS, settings.SESSION_TTL_SECONDS)
+                )
+    return _speech_analyzer
+
+
+def get_analysis_pool() -> AnalysisWorkerPool:
+    """분석 워커 풀 인스턴스를 반환합니다 (처음 호출 시 생성)"""
+    global _analysis_pool
+    if _analysis_pool is None:
+        fraud_detector = get_fraud_detector()
+        language_packs = get_language_packs()
+        with _lock:
+            if _analysis_pool is None:
+                _analysis_pool = AnalysisWorkerPool(fraud_detector, settings.ANALYSIS_WORKERS, language_packs)
+                load_shedder.register_queue("analysis_workers", lambda: _analysis_pool.pending)
+    return _analysis_pool
+
+
+def get_session_manager() -> CallSessionManager:
+    """통화 세션 관리자 인스턴스를 반환합니다 (처음 호출 시 생성)"""
+    global _session_manager
+    if _session_manager is None:
+        fraud_detector = get_fraud_detector()
+        language_packs = get_language_packs()
+        with _lock:
+            if _session_manager is None:
+                _session_manager = CallSessionManager(
+                    fraud_detector,
+                    language_packs=language_packs,
+                    ttl_seconds=settings.SESSION_TTL_SECONDS,
+                    max_sessions=settings.MAX_SESSIONS,
+                    spill_path=settings.SESSION_SPILL_PATH
+                )
+    return _session_manager
+
+
+def get_shadow_evaluator() -> Optional[ShadowEvaluator]:
+    """섀도 평가기를 반환합니다 (처음 호출 시 생성, 설정이 없으면 None)"""
+    global _shadow_evaluator, _shadow_loaded
+    if not _shadow_loaded:
+        fraud_detector = get_fraud_detector()
+        with _lock:
+            if not _shadow_loaded:
+                try:
+                    _shadow_evaluator = create_shadow_evaluator(
+                        settings.SHADOW_CONFIG_PATH, settings.SHADOW_SAMPLE_RATE, analysis_stats,
+                        reputation_store=fraud_detector.reputation_store
+                    )
+                except Exception as e:
+                    logger.error(f"섀도 평가기 생성 중 오류: {str(e)}")
+                _shadow_loaded = True
+    return _shadow_evaluator
+
+
+def register_job_handler(kind: str, handler: JobHandler) -> None:
+    """비동기 작업 종류별 처리 함수를 등록합니다."""
+    _job_handlers[kind] = handler
+
+
+def get_job_queue() -> JobQueue:
+    """비동기 작업 큐를 반환합니다 (처음 호출 시 생성, 워커는 이벤트 루프에서 시작)"""
+    global _job_queue
+    if _job_queue is None:
+        with _lock:
+            if _job_queue is None:
+                _job_queue = JobQueue(
+                    _job_handlers,
+                    num_workers=settings.JOB_WORKERS,
+                    result_ttl_seconds=settings.JOB_RESULT_TTL_SECONDS,
+                    max_pending=settings.JOB_MAX_PENDING,
+                    spool_dir=settings.JOB_SPOOL_DIR,
+                    store_path=settings.JOB_STORE_PATH
+                )
+    return _job_queue
+
+
+def get_loaded_fraud_detector() -> Optional[FraudDetector]:
+    """이미 생성된 사기 탐지기 (생성하지 않음)"""
+    return _fraud_detector
+
+
+def get_loaded_speech_analyzer() -> Optional[SpeechAnalyzer]:
+    """이미 생성된 음성 분석기 (생성하지 않음)"""
+    return _speech_analyzer
+
+
+def start_workers() -> None:
+    """
+    사기 탐지기를 만들고 분석 워커를 fork합니다.
+    스레드 풀이나 SQLite 연결이 생기기 전에 fork해야 하므로 서버 시작 시 이벤트 루프 스레드에서 동기로 호출합니다
+    (요청 한도/세션/작업 저장소의 SQLite 연결은 fork 이후 처음 사용할 때 열림).
+    """
+    try:
+        get_analysis_pool().start()
+    except Exception as e:
+        logger.error(f"분석 워커 시작 중 오류: {str(e)}")
+
+
+async def warm_up() -> None:
+    """
+    서비스를 미리 생성합니다.
+    분석 워커는 start_workers에서 먼저 fork하고(이미 시작했으면 건너뜀),
+    나머지 서비스 생성은 별도 스레드에서 수행해 이벤트 루프를 막지 않습니다.
+    """
+    start_workers()
+    loop = asyncio.get_running_loop()
+    try:
+        get_analysis_pool()
+        await loop.run_in_executor(None, get_shadow_evaluator)
+
+        # 저장소에 남은 미완료 작업을 이어서 처리
+        if settings.JOB_STORE_PATH:
+            get_job_queue().start()
+
+        if settings.WARM_UP_AUDIO:
+            await loop.run_in_executor(None, get_speech_analyzer().warm_up)
+
+        logger.info("서비스 준비(warm-up)가 완료되었습니다.")
+    except Exception as e:
+        logger.error(f"서비스 준비 중 오류: {str(e)}")
+    finally:
+        _get_ready_event().set()
+
+
+def is_ready() -> bool:
+    """warm-up 완료 여부"""
+    return _ready_event is not None and _ready_event.is_set()
+
+
+async def wait_until_ready(timeout: float) -> bool:
+    """
+    warm-up이 끝날 때까지 최대 timeout초 기다립니다.
+
+    Returns:
+        bool: 준비 완료 여부
+    """
+    try:
+        await asyncio.wait_for(_get_ready_event().wait(), timeout)
+    except asyncio.TimeoutError:
+        return False
+    return True
+
+
+def shutdown() -> None:
+    """서비스를 정리합니다."""
+    if _analysis_pool is not None:
+        _analysis_pool.shutdown()
+    if _shadow_evaluator is not None:
+        _shadow_evaluator.shutdown()
+    if _job_queue is not None:
+        _job_queue.shutdown()
+    rate_limiter.close()
+
+
+def _read_scoring_rules(path: str) -> Optional[str]:
+    """규칙 파일 내용 (경로가 없으면 None, 탐지기 기본 규칙 사용)"""
+    if not path:
+        return None
+    with open(path, encoding="utf-8") as rule_file:
+        return rule_file.read()
+
+
+def _get_ready_event() -> asyncio.Event:
+    global _ready_event
+    if _ready_event is None:
+        _ready_event = asyncio.Event()
+    return _ready_event
@@ -0,0 +1,113 @@
+"""
+상태 확인 API 엔드포인트
+프로세스 생존 여부(liveness)와 트래픽 수신 가능 여부(readiness)를 분리해 제공합니다.
+"""
+
+import importlib.util
+from typing import Any, Dict
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from api import dependencies
+from api.dependencies import analysis_stats, load_shedder
+from config import settings
+
+
+# API 라우터 생성
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+@router.get("/live")
+async def liveness_check() -> Dict[str, Any]:
+    """
+    프로세스 생존 여부를 확인합니다 (의존 서비스 상태와 무관)
+    """
+    return {"status": "OK"}
+
+
+@router.get("/ready")
+async def readiness_check(wait: float = 0.0):
+    """
+    트래픽을 받을 준비가 되었는지 확인합니다.
+    준비되지 않았거나 처리 한도를 넘은 경우 503을 반환해 로드밸런서가 다른 인스턴스로 보내도록 합니다.
+    
+    Args:
+        wait: warm-up 완료를 기다릴 최대 시간 (초)
+    """
+    if wait > 0:
+        await dependencies.wait_until_ready(min(wait, 30.0))
+
+    report = get_readiness_report()
+    status_code = 200 if report["status"] == "READY" else 503
+    return JSONResponse(status_code=status_code, content=report)
+
+
+def get_readiness_report() -> Dict[str, Any]:
+    """
+    의존 서비스별 상태를 점검합니다.
+    
+    Returns:
+        Dict: 전체 상태와 점검 항목별 결과
+    """
+    checks = {
+        "warm_up": {"ok": dependencies.is_ready()},
+        "speech_recognizer": _check_speech_recognizer(),
+        "load": {**load_shedder.status()},
+        "error_rate": _check_error_rate(),
+        "cache": _check_cache()
+    }
+    checks["load"]["ok"] = not checks["load"]["saturated"]
+
+    if not checks["warm_up"]["ok"]:
+        status = "STARTING"
+    elif all(check["ok"] for check in checks.values()):
+        status = "READY"
+    else:
+        status = "NOT_READY"
+
+    return {"status": status, "checks": checks}
+
+
+def _check_speech_recognizer() -> Dict[str, Any]:
+    """음성 인식 엔진 상태 (로드 여부와 최근 인식 오류율)"""
+    analyzer = dependencies.get_loaded_speech_analyzer()
+    if analyzer is not None and analyzer.is_recognizer_loaded:
+        state = "loaded"
+    elif importlib.util.find_spec("speech_recognition") is not None:
+        state = "available"
+    else:
+        state = "missing"
+
+    error_rate = analysis_stats.recent_recognition_error_rate()
+    return {
+        "ok": state != "missing" and error_rate < settings.READY_MAX_ERROR_RATE,
+        "state": state,
+        "recent_error_rate": round(error_rate, 3)
+    }
+
+
+def _check_error_rate() -> Dict[str, Any]:
+    """최근 분석 요청 오류율"""
+    error_rate = analysis_stats.recent_error_rate()
+    return {
+        "ok": error_rate < settings.READY_MAX_ERROR_RATE,
+        "value": round(error_rate, 3),
+        "threshold": settings.READY_MAX_ERROR_RATE
+    }
+
+
+def _check_cache() -> Dict[str, Any]:
+    """정규화 캐시 상태 (준비 여부에는 영향 없음)"""
+    detector = dependencies.get_loaded_fraud_detector()
+    if detector is None:
+        return {"ok": True, "warm": False}
+
+    info = detector.normalizer.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "ok": True,
+        "warm": info.currsize > 0,
+        "entries": info.currsize,
+        "hit_rate": round(info.hits / lookups, 3) if lookups else 0.0
+    }
@@ -0,0 +1,192 @@
+"""
+비동기 작업 API 엔드포인트
+긴 녹음 파일을 접수 즉시 작업 ID로 응답하고, 백그라운드에서 음성 인식/사기 분석을 수행합니다.
+클라이언트는 작업 상태를 조회(wait로 완료까지 대기 가능)해 결과를 받습니다.
+"""
+
+import os
+import uuid
+from typing import Any, BinaryIO, Dict, Optional
+
+from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
+from loguru import logger
+from starlette.concurrency import run_in_threadpool
+
+from api.dependencies import (
+    get_analysis_pool, get_job_queue, get_language_packs, get_shadow_evaluator, get_speech_analyzer,
+    rate_limiter, register_job_handler, scheduler
+)
+from api.responses import FastJSONResponse
+from api.scheduling import get_client_id, take_reservation
+from api.voice_analysis import analyze_audio_file, build_audio_result
+from config import settings
+from services.job_queue import JobNotFound, JobQueue, JobQueueFull
+from services.language_packs import LanguagePackNotFound, LanguagePacks
+
+
+router = APIRouter(prefix="/api/voice/jobs", tags=["jobs"])
+
+SUPPORTED_FORMATS = ['.wav', '.mp3', '.m4a', '.webm', '.ogg']
+
+# 한 번의 조회에서 완료를 기다리는 최대 시간 (초)
+MAX_WAIT_SECONDS = 30.0
+
+
+@router.post("", status_code=202)
+async def submit_audio_job(
+    request: Request,
+    audio_file: UploadFile = File(..., description="분석할 음성 파일"),
+    compact: bool = False,
+    language: Optional[str] = None,
+    job_queue: JobQueue = Depends(get_job_queue),
+    language_packs: LanguagePacks = Depends(get_language_packs)
+) -> Dict[str, Any]:
+    """
+    음성 파일 분석 작업을 접수합니다 (처리를 기다리지 않고 작업 ID 반환).
+
+    Args:
+        audio_file: 업로드된 음성 파일 (.wav, .mp3, .m4a, .webm, .ogg 지원)
+        compact: 결과의 권장사항/최종 판정을 문구 대신 ID로 받을지 여부
+        language: 통화 언어 (ko, en, zh 등, 없으면 기본 언어)
+
+    Returns:
+        Dict: 작업 상태 (job_id로 GET /api/voice/jobs/{job_id} 조회)
+    """
+    if not audio_file.filename:
+        raise HTTPException(status_code=400, detail="파일이 선택되지 않았습니다.")
+
+    file_extension = '.' + audio_file.filename.split('.')[-1].lower()
+    if file_extension not in SUPPORTED_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원되지 않는 파일 형식입니다. 지원 형식: {', '.join(SUPPORTED_FORMATS)}"
+        )
+
+    try:
+        language = language_packs.resolve(language)
+    except LanguagePackNotFound as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # 업로드 내용을 메모리에 올리지 않고 스풀 디렉터리로 복사
+    payload_path = os.path.join(job_queue.spool_dir, uuid.uuid4().hex + file_extension)
+    max_size = settings.JOB_MAX_FILE_SIZE_MB * 1024 * 1024
+    size = await run_in_threadpool(_spool_upload, audio_file.file, payload_path, max_size)
+    if size > max_size:
+        raise HTTPException(
+            status_code=400,
+            detail=f"파일 크기가 너무 큽니다. 최대 {settings.JOB_MAX_FILE_SIZE_MB}MB까지 지원합니다."
+        )
+
+    # 요청 한도 선차감은 작업이 넘겨받아 인식 후 정산
+    reserved = take_reservation(request)
+    try:
+        job = job_queue.submit(
+            "audio", payload_path,
+            params={"filename": audio_file.filename, "compact": compact, "size": size, "language": language,
+                    "reserved_audio_seconds": reserved},
+            client_id=get_client_id(request)
+        )
+    except JobQueueFull as e:
+        os.unlink(payload_path)
+        rate_limiter.refund(get_client_id(request), "audio", reserved)
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
+
+    logger.info(f"음성 분석 작업 접수: {job['job_id']} ({audio_file.filename}, {size} bytes)")
+    return {
+        "success": True,
+        "job": job,
+        "status_url": f"{router.prefix}/{job['job_id']}"
+    }
+
+
+@router.get("/{job_id}")
+async def get_job(
+    job_id: str,
+    wait: float = 0.0,
+    job_queue: JobQueue = Depends(get_job_queue)
+) -> Dict[str, Any]:
+    """
+    작업 상태와 결과를 조회합니다.
+
+    Args:
+        job_id: 작업 ID
+        wait: 작업이 끝나지 않았으면 완료될 때까지 기다릴 최대 시간 (초, 최대 30초)
+
+    Returns:
+        Dict: 작업 상태 (완료 시 result 또는 error 포함)
+    """
+    try:
+        job = await job_queue.wait(job_id, min(max(wait, 0.0), MAX_WAIT_SECONDS))
+    except JobNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return FastJSONResponse({"success": True, "job": job})
+
+
+@router.get("")
+async def get_job_queue_status(job_queue: JobQueue = Depends(get_job_queue)) -> Dict[str, Any]:
+    """
+    작업 큐 상태를 반환합니다.
+
+    Returns:
+        Dict: 상태별 작업 수
+    """
+    return {"success": True, "jobs": job_queue.status()}
+
+
+async def _process_audio_job(job: Dict[str, Any], payload_path: str) -> Dict[str, Any]:
+    """
+    음성 파일 작업을 처리합니다 (스케줄러 bulk 등급, 실시간/대화형/업로드 요청이 먼저).
+
+    Raises:
+        RuntimeError: 음성 인식에 실패한 경우
+    """
+    speech_analyzer = get_speech_analyzer()
+    analysis_pool = get_analysis_pool()
+    params = job["params"]
+
+    duration = 0.0
+    try:
+        audio_properties, speech_result, fraud_analysis = await analyze_audio_file(
+            speech_analyzer, analysis_pool, payload_path, lambda: scheduler.slot("bulk", job["client_id"]),
+            params.get("language")
+        )
+        duration = speech_result.get("duration") or 0
+    finally:
+        # 접수 때 먼저 차감한 길이를 실제 길이로 정산 (처리하지 못했으면 되돌림)
+        rate_limiter.settle(job["client_id"], "audio", params.get("reserved_audio_seconds", 0.0), duration)
+    if not speech_result["success"]:
+        raise RuntimeError(f"음성 인식 실패: {speech_result['error']}")
+
+    shadow_evaluator = get_shadow_evaluator()
+    if shadow_evaluator is not None:
+        shadow_evaluator.submit(speech_result["text"], fraud_analysis)
+
+    logger.info(f"음성 분석 작업 완료: {job['job_id']}, 위험도: {fraud_analysis['risk_score']:.2f}")
+    return build_audio_result(params["filename"], audio_properties, speech_result,
+                              fraud_analysis, params.get("compact", False))
+
+
+def _spool_upload(source: BinaryIO, path: str, max_size: int) -> int:
+    """
+    업로드 파일을 스풀 파일로 복사합니다 (max_size를 넘으면 중단하고 파일 삭제).
+
+    Returns:
+        int: 복사한 바이트 수 (max_size 초과 시 max_size + 1)
+    """
+    size = 0
+    with open(path, "wb") as target:
+        while True:
+            chunk = source.read(1024 * 1024)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_size:
+                break
+            target.write(chunk)
+    if size > max_size:
+        os.unlink(path)
+        return max_size + 1
+    return size
+
+
+register_job_handler("audio", _process_audio_job)
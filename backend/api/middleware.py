@@ -0,0 +1,219 @@
+"""
+API 미들웨어
+분석 요청의 클라이언트별 요청 한도와 부하 차단, 요청 성공/실패 기록, 응답 압축을 담당합니다.
+"""
+
+import gzip
+import json
+import math
+from typing import Optional
+
+from loguru import logger
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 gzip만 사용
+    brotli = None
+
+from api.dependencies import analysis_stats, load_shedder, rate_limiter
+from api.scheduling import RESERVATION_STATE, estimate_audio_seconds, get_client_id
+
+
+class LoadSheddingMiddleware:
+    """
+    부하 차단 미들웨어
+    분석 API(POST) 요청이 한도를 넘으면 타임아웃까지 기다리게 하지 않고 바로 503을 반환합니다.
+    """
+
+    def __init__(self, app, path_prefix: str = "/api/voice", retry_after: int = 1):
+        self.app = app
+        self.path_prefix = path_prefix
+        self.retry_after = retry_after
+
+    async def __call__(self, scope, receive, send):
+        if (scope["type"] != "http"
+                or scope["method"] != "POST"
+                or not scope["path"].startswith(self.path_prefix)):
+            await self.app(scope, receive, send)
+            return
+
+        if not load_shedder.try_acquire():
+            logger.warning(f"처리 한도 초과로 요청을 거절합니다: {scope['path']}")
+            await self._reject(send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            load_shedder.release()
+            # 503은 부하 차단/스케줄러가 의도적으로 거절한 것이므로 오류율에 넣지 않음
+            if status_code != 503:
+                analysis_stats.record_request(status_code < 500)
+
+    async def _reject(self, send):
+        await _send_error(send, 503, "서버가 혼잡합니다. 잠시 후 다시 시도해주세요.", self.retry_after)
+
+
+class RateLimitMiddleware:
+    """
+    요청 한도 미들웨어
+    분석 API(POST) 요청을 클라이언트별 토큰 버킷으로 확인해 한도를 넘으면 429를 반환합니다.
+    음성 업로드(multipart)는 audio, 나머지는 text 자원으로 봅니다.
+    음성은 업로드 크기(Content-Length)로 어림한 길이를 먼저 차감하고, 엔드포인트가 인식 후
+    take_reservation으로 넘겨받아 실제 길이로 정산합니다 (동시에 여러 업로드를 보내도 예산을 넘지 못함).
+    넘겨받지 않은 차감은 4xx/5xx 응답(예: 파라미터 검증 실패 422, 과부하 503)이면 되돌립니다.
+    """
+
+    def __init__(self, app, path_prefix: str = "/api/voice"):
+        self.app = app
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope, receive, send):
+        if (scope["type"] != "http"
+                or scope["method"] != "POST"
+                or not scope["path"].startswith(self.path_prefix)):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if headers.get("content-type", "").startswith("multipart/form-data"):
+            # 음성은 길이를 모르므로 업로드 크기로 어림한 길이를 먼저 차감 (인식 후 정산)
+            try:
+                content_length = int(headers.get("content-length") or 0)
+            except ValueError:
+                content_length = 0
+            resource, cost = "audio", estimate_audio_seconds(content_length)
+        else:
+            resource, cost = "text", 1.0
+
+        client_id = get_client_id(Request(scope))
+        allowed, retry_after = rate_limiter.acquire(client_id, resource, cost)
+        if not allowed:
+            logger.warning(f"요청 한도 초과로 요청을 거절합니다: {scope['path']} ({resource})")
+            await _send_error(send, 429, "요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요.",
+                              max(math.ceil(retry_after), 1))
+            return
+
+        state = scope.setdefault("state", {})
+        state[RESERVATION_STATE] = cost
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if status_code >= 400:
+                rate_limiter.refund(client_id, resource, state.pop(RESERVATION_STATE, 0.0))
+
+
+class CompressionMiddleware:
+    """
+    응답 압축 미들웨어
+    클라이언트의 Accept-Encoding에 따라 br(brotli 설치 시) 또는 gzip으로 응답을 압축합니다.
+    minimum_size보다 작은 응답, 이미 압축된 응답, 스트리밍 응답, JSON/텍스트가 아닌 응답은 그대로 보냅니다.
+    """
+
+    COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 5):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.encodings = ("br", "gzip") if brotli is not None else ("gzip",)
+
+    async def __call__(self, scope, receive, send):
+        encoding = self._negotiate(scope) if scope["type"] == "http" else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            # 첫 본문 조각에서 압축 여부 결정
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+            if (message.get("more_body", False)
+                    or len(body) < self.minimum_size
+                    or "content-encoding" in headers
+                    or not headers.get("content-type", "").startswith(self.COMPRESSIBLE_TYPES)):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = self._compress(body, encoding)
+            headers["content-encoding"] = encoding
+            headers["content-length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _negotiate(self, scope) -> Optional[str]:
+        """Accept-Encoding에서 가중치(q)가 가장 높은 지원 압축 방식을 고릅니다 (같으면 br 우선)."""
+        accept = Headers(scope=scope).get("accept-encoding", "")
+        best, best_quality = None, 0.0
+        for item in accept.split(","):
+            name, _, params = item.strip().partition(";")
+            name = name.strip().lower()
+            quality = 1.0
+            if params.strip().startswith("q="):
+                try:
+                    quality = float(params.strip()[2:])
+                except ValueError:
+                    continue
+            candidates = self.encodings[-1:] if name == "*" else (name,)
+            for candidate in candidates:
+                if candidate in self.encodings and quality > 0 and (
+                        quality > best_quality
+                        or (quality == best_quality and self.encodings.index(candidate) < self.encodings.index(best))):
+                    best, best_quality = candidate, quality
+        return best
+
+    def _compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level)
+
+
+async def _send_error(send, status: int, message: str, retry_after: int) -> None:
+    """JSON 오류 응답을 보냅니다 (Retry-After 포함)."""
+    body = json.dumps({"success": False, "error": message}, ensure_ascii=False).encode("utf-8")
+
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(retry_after).encode())
+        ]
+    })
+    await send({"type": "http.response.body", "body": body})
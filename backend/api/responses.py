@@ -0,0 +1,40 @@
+"""
+API 응답 형식
+분석 응답을 빠르게 직렬화하는 JSON 응답 클래스와, 권장사항/판정 문구를 ID로 줄인 압축 응답 형식을 제공합니다.
+"""
+
+import json
+from typing import Any, Dict
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 사용
+    orjson = None
+
+
+def _fallback(value: Any) -> Any:
+    """orjson/json이 직접 처리하지 못하는 값 (datetime 외 객체 등)"""
+    return jsonable_encoder(value)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    빠른 JSON 응답 클래스
+    엔드포인트에서 이 응답을 직접 반환하면 FastAPI의 jsonable_encoder 변환을 거치지 않고
+    orjson으로 바로 직렬화합니다 (한글/이모지는 이스케이프하지 않음).
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, default=_fallback,
+                                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":"),
+                          default=_fallback).encode("utf-8")
+
+
+def compact_session(session: Dict[str, Any]) -> Dict[str, Any]:
+    """압축 응답용 세션 결과 (권장사항 문구를 빼고 ID만 남김)"""
+    return {key: value for key, value in session.items() if key != "recommendations"}
@@ -0,0 +1,81 @@
+"""
+API 작업 스케줄링
+엔드포인트의 음성 인식/분석 구간을 우선순위 스케줄러(services/scheduler.py)로 감쌉니다.
+클라이언트는 X-API-Key 또는 X-Client-Id 헤더로 공정 분배/요청 한도 단위를, X-Deadline-Ms 헤더로 작업 시작 기한을 지정할 수 있습니다.
+"""
+
+import hashlib
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from fastapi import HTTPException, Request
+from loguru import logger
+
+from api.dependencies import rate_limiter, scheduler
+from config import settings
+from services.scheduler import SchedulerError
+
+
+# 요청 한도 미들웨어가 먼저 차감한 양을 넣어 두는 요청 상태 키 (엔드포인트가 넘겨받아 정산)
+RESERVATION_STATE = "rate_limit_reserved"
+
+
+def get_client_id(request: Request) -> str:
+    """
+    공정 분배/요청 한도 단위 (X-API-Key 헤더, 없으면 X-Client-Id 헤더, 없으면 접속 주소)
+    API 키는 통계/작업 상태에 노출되지 않도록 해시로 바꿉니다.
+    """
+    api_key = request.headers.get("x-api-key")
+    if api_key:
+        return "key:" + hashlib.sha1(api_key.encode("utf-8")).hexdigest()[:12]
+    client_id = request.headers.get("x-client-id")
+    if client_id:
+        return client_id[:64]
+    return request.client.host if request.client else "anonymous"
+
+
+def estimate_audio_seconds(content_length: int) -> float:
+    """
+    업로드 크기로 음성 길이를 어림합니다 (요청 한도 선차감용, 최소 길이 이상 최대 적립량 이하).
+
+    Args:
+        content_length: 요청 본문 크기 (바이트, 모르면 0)
+    """
+    estimate = max(content_length / settings.RATE_LIMIT_AUDIO_RESERVE_BYTES_PER_SECOND,
+                   settings.RATE_LIMIT_AUDIO_MIN_RESERVE_SECONDS)
+    return min(estimate, rate_limiter.limits["audio"][1])
+
+
+def take_reservation(request: Request) -> float:
+    """
+    요청 한도 미들웨어가 먼저 차감한 양을 넘겨받습니다.
+    넘겨받은 쪽이 rate_limiter.settle로 정산하며, 미들웨어는 더 이상 되돌리지 않습니다.
+    """
+    return request.scope.setdefault("state", {}).pop(RESERVATION_STATE, 0.0)
+
+
+def get_deadline_ms(request: Request) -> Optional[float]:
+    """요청별 작업 시작 기한 (X-Deadline-Ms 헤더, 없거나 잘못된 값이면 등급 기본값)"""
+    value = request.headers.get("x-deadline-ms")
+    try:
+        return float(value) if value and float(value) > 0 else None
+    except ValueError:
+        return None
+
+
+@asynccontextmanager
+async def scheduled(priority_class: str, request: Request, cost: float = 1.0) -> AsyncIterator[None]:
+    """
+    스케줄러에서 실행 자리를 얻은 뒤 본문을 실행합니다 (거절되면 503).
+
+    Args:
+        priority_class: 우선순위 등급 (streaming, interactive, upload, bulk)
+        request: 요청 (클라이언트 ID와 기한 확인)
+        cost: 작업 비용 (공정 분배용)
+    """
+    try:
+        async with scheduler.slot(priority_class, get_client_id(request), get_deadline_ms(request), cost):
+            yield
+    except SchedulerError as e:
+        logger.warning(f"작업 스케줄러가 요청을 거절했습니다: {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
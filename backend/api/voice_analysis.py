@@ -3,33 +3,53 @@
 음성 파일 업로드 및 분석 기능을 제공합니다.
 """
 
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Request, Response
 from fastapi.responses import JSONResponse
-from typing import Dict, Any
-import io
+from starlette.concurrency import run_in_threadpool
+from typing import Any, AsyncContextManager, BinaryIO, Callable, Dict, Optional, Tuple, Union
+import time
+from contextlib import ExitStack
 from loguru import logger
 
-from services.speech_analyzer import SpeechAnalyzer
+from api.dependencies import (
+    get_speech_analyzer, get_fraud_detector, get_analysis_pool, get_language_packs, get_shadow_evaluator,
+    analysis_stats, audio_flights, detector_exports, load_shedder, rate_limiter, scheduler
+)
+from api.health import get_readiness_report
+from api.responses import FastJSONResponse
+from api.scheduling import get_client_id, scheduled, take_reservation
+from config import settings
+from services.messages import CATALOG_VERSION, message_catalog, render_verdict
+from services.speech_analyzer import SpeechAnalyzer, local_audio_file
 from services.fraud_detector import FraudDetector
+from services.language_packs import LanguagePackNotFound, LanguagePacks
+from services.shadow import ShadowEvaluator
+from services.worker_pool import AnalysisWorkerPool
 
 
 # API 라우터 생성
 router = APIRouter(prefix="/api/voice", tags=["voice-analysis"])
-
-# 서비스 인스턴스 생성
-speech_analyzer = SpeechAnalyzer()
-fraud_detector = FraudDetector()
+# 서비스 인스턴스는 api.dependencies에서 처음 필요할 때 생성합니다
 
 
 @router.post("/upload-and-analyze")
 async def upload_and_analyze_audio(
-    audio_file: UploadFile = File(..., description="분석할 음성 파일")
+    request: Request,
+    audio_file: UploadFile = File(..., description="분석할 음성 파일"),
+    compact: bool = False,
+    language: Optional[str] = None,
+    speech_analyzer: SpeechAnalyzer = Depends(get_speech_analyzer),
+    analysis_pool: AnalysisWorkerPool = Depends(get_analysis_pool),
+    language_packs: LanguagePacks = Depends(get_language_packs),
+    shadow_evaluator: Optional[ShadowEvaluator] = Depends(get_shadow_evaluator)
 ) -> Dict[str, Any]:
     """
     음성 파일을 업로드하고 사기 패턴을 분석합니다.
     
     Args:
         audio_file: 업로드된 음성 파일 (.wav, .mp3, .m4a, .webm 지원)
+        compact: 권장사항/최종 판정을 문구 대신 ID로 받을지 여부 (문구는 /api/voice/messages)
+        language: 통화 언어 (ko, en, zh 등, 없으면 기본 언어 - 음성 인식 언어와 키워드 팩을 함께 정함)
         
     Returns:
         Dict: 분석 결과
@@ -49,32 +69,29 @@ async def upload_and_analyze_audio(
                 detail=f"지원되지 않는 파일 형식입니다. 지원 형식: {', '.join(supported_formats)}"
             )
         
-        # 파일 크기 제한 (10MB)
-        max_size = 10 * 1024 * 1024  # 10MB
-        audio_content = await audio_file.read()
-        
-        if len(audio_content) > max_size:
+        # 파일 크기 제한 (업로드 내용은 메모리에 올리지 않고 임시 파일 그대로 사용)
+        max_size = settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024
+        if audio_file.size is not None and audio_file.size > max_size:
             raise HTTPException(
                 status_code=400,
-                detail="파일 크기가 너무 큽니다. 최대 10MB까지 지원합니다."
+                detail=f"파일 크기가 너무 큽니다. 최대 {settings.MAX_UPLOAD_SIZE_MB}MB까지 지원합니다."
             )
         
-        # 파일 포인터 초기화
-        audio_file.file = io.BytesIO(audio_content)
-        
-        logger.info(f"음성 파일 업로드 시작: {audio_file.filename} ({len(audio_content)} bytes)")
+        language = _resolve_language(language_packs, language)
         
-        # 2. 음성 속성 분석
-        audio_file.file.seek(0)  # 파일 포인터 초기화
-        audio_properties = speech_analyzer.analyze_audio_properties(audio_file.file)
+        logger.info(f"음성 파일 업로드 시작: {audio_file.filename} ({audio_file.size} bytes)")
         
-        # 3. 음성을 텍스트로 변환
-        audio_file.file.seek(0)  # 파일 포인터 초기화
-        speech_result = speech_analyzer.audio_to_text(audio_file.file)
+        # 2 - 4단계는 스케줄러의 upload 등급으로 실행 (통화 세션/텍스트 분석이 먼저)
+        audio_properties, speech_result, fraud_analysis = await analyze_audio_file(
+            speech_analyzer, analysis_pool, audio_file.file, lambda: scheduled("upload", request), language
+        )
+        rate_limiter.settle(get_client_id(request), "audio", take_reservation(request),
+                            speech_result.get("duration") or 0)
         
         if not speech_result["success"]:
             return JSONResponse(
-                status_code=500,
+                # 디코딩할 수 없는 음성은 클라이언트 입력 오류 (서버 오류율에 넣지 않음)
+                status_code=400 if speech_result.get("input_error") else 500,
                 content={
                     "success": False,
                     "error": "음성 인식 실패",
@@ -83,38 +100,16 @@ async def upload_and_analyze_audio(
                 }
             )
         
-        # 4. 사기 패턴 분석
-        fraud_analysis = fraud_detector.analyze_text(speech_result["text"])
+        # 후보 탐지기 비교 (표본만, 응답을 기다리게 하지 않음)
+        if shadow_evaluator is not None:
+            shadow_evaluator.submit(speech_result["text"], fraud_analysis)
         
         # 5. 종합 결과 생성
-        result = {
-            "success": True,
-            "filename": audio_file.filename,
-            "audio_properties": audio_properties,
-            "speech_recognition": {
-                "text": speech_result["text"],
-                "confidence": speech_result["confidence"],
-                "language": speech_result["language"],
-                "duration": speech_result["duration"]
-            },
-            "fraud_analysis": {
-                "risk_score": fraud_analysis["risk_score"],
-                "risk_level": fraud_analysis["risk_level"],
-                "is_fraud_suspected": fraud_analysis["is_fraud_suspected"],
-                "keyword_matches": fraud_analysis["keyword_matches"],
-                "pattern_analysis": fraud_analysis["pattern_analysis"],
-                "recommendations": fraud_analysis["recommendations"]
-            },
-            "analysis_summary": {
-                "total_analysis_time": fraud_analysis["analysis_time"],
-                "final_verdict": _generate_final_verdict(fraud_analysis),
-                "confidence_level": _calculate_confidence_level(speech_result, fraud_analysis)
-            }
-        }
+        result = build_audio_result(audio_file.filename, audio_properties, speech_result, fraud_analysis, compact)
         
         logger.info(f"음성 분석 완료: {audio_file.filename}, 위험도: {fraud_analysis['risk_score']:.2f}")
         
-        return result
+        return FastJSONResponse(result)
         
     except HTTPException:
         raise
@@ -128,8 +123,14 @@ async def upload_and_analyze_audio(
 
 @router.post("/analyze-text")
 async def analyze_text_only(
+    request: Request,
     text: str,
-    confidence: float = 1.0
+    confidence: float = 1.0,
+    compact: bool = False,
+    language: Optional[str] = None,
+    analysis_pool: AnalysisWorkerPool = Depends(get_analysis_pool),
+    language_packs: LanguagePacks = Depends(get_language_packs),
+    shadow_evaluator: Optional[ShadowEvaluator] = Depends(get_shadow_evaluator)
 ) -> Dict[str, Any]:
     """
     텍스트만으로 사기 패턴을 분석합니다.
@@ -137,6 +138,8 @@ async def analyze_text_only(
     Args:
         text: 분석할 텍스트
         confidence: 텍스트 신뢰도 (0.0 - 1.0)
+        compact: 권장사항/최종 판정을 문구 대신 ID로 받을지 여부 (문구는 /api/voice/messages)
+        language: 텍스트 언어 (ko, en, zh 등, 없거나 auto면 문자 체계로 감지)
         
     Returns:
         Dict: 분석 결과
@@ -144,9 +147,17 @@ async def analyze_text_only(
     try:
         if not text or not text.strip():
             raise HTTPException(status_code=400, detail="분석할 텍스트가 비어있습니다.")
+        language = _resolve_language(language_packs, language, text)
         
-        # 사기 패턴 분석
-        fraud_analysis = fraud_detector.analyze_text(text)
+        # 사기 패턴 분석 (스케줄러 interactive 등급)
+        async with scheduled("interactive", request):
+            started = time.perf_counter()
+            fraud_analysis = await analysis_pool.analyze_text(text, language)
+            analysis_stats.record_analysis(fraud_analysis, (time.perf_counter() - started) * 1000)
+        
+        # 후보 탐지기 비교 (표본만, 응답을 기다리게 하지 않음)
+        if shadow_evaluator is not None:
+            shadow_evaluator.submit(text, fraud_analysis)
         
         # 결과 생성
         result = {
@@ -154,23 +165,27 @@ async def analyze_text_only(
             "input_text": text,
             "input_confidence": confidence,
             "fraud_analysis": {
+                "language": fraud_analysis.get("language", language),
                 "risk_score": fraud_analysis["risk_score"],
                 "risk_level": fraud_analysis["risk_level"],
                 "is_fraud_suspected": fraud_analysis["is_fraud_suspected"],
                 "keyword_matches": fraud_analysis["keyword_matches"],
                 "pattern_analysis": fraud_analysis["pattern_analysis"],
-                "recommendations": fraud_analysis["recommendations"]
+                "script_match": fraud_analysis.get("script_match"),
+                "match_spans": fraud_analysis.get("match_spans", []),
+                "score_breakdown": fraud_analysis.get("score_breakdown", {}),
+                **_recommendation_fields(fraud_analysis, compact)
             },
             "analysis_summary": {
                 "analysis_time": fraud_analysis["analysis_time"],
-                "final_verdict": _generate_final_verdict(fraud_analysis),
+                **_verdict_fields(fraud_analysis, compact),
                 "confidence_level": confidence
             }
         }
         
         logger.info(f"텍스트 분석 완료: 위험도 {fraud_analysis['risk_score']:.2f}")
         
-        return result
+        return FastJSONResponse(result)
         
     except HTTPException:
         raise
@@ -183,22 +198,31 @@ async def analyze_text_only(
 
 
 @router.get("/fraud-keywords")
-async def get_fraud_keywords() -> Dict[str, Any]:
+async def get_fraud_keywords(
+    language: Optional[str] = None,
+    language_packs: LanguagePacks = Depends(get_language_packs)
+) -> Dict[str, Any]:
     """
     현재 사용 중인 사기 키워드 목록을 반환합니다.
     
+    Args:
+        language: 언어 (없으면 기본 언어)
+    
     Returns:
         Dict: 카테고리별 키워드 목록
     """
+    fraud_detector = language_packs.detector(_resolve_language(language_packs, language))
     try:
         keywords = fraud_detector.fraud_keywords
         weights = fraud_detector.scoring_weights
         
         result = {
             "success": True,
+            "language": fraud_detector.language,
             "keywords_by_category": keywords,
             "category_weights": weights,
             "total_keywords": sum(len(kw_list) for kw_list in keywords.values()),
+            "normalized_keywords": len(fraud_detector.keyword_matcher),
             "categories": list(keywords.keys())
         }
         
@@ -212,8 +236,58 @@ async def get_fraud_keywords() -> Dict[str, Any]:
         )
 
 
+@router.get("/messages")
+async def get_messages(request: Request) -> Response:
+    """
+    권장사항/최종 판정 문구 목록을 반환합니다.
+    compact=true로 받은 분석 결과의 ID를 문구로 바꿀 때 사용하며, 버전(ETag)이 같으면 304를 반환합니다.
+
+    Returns:
+        Dict: 문구 목록 버전, 권장사항 ID별 문구, 위험 등급별 판정 문구
+    """
+    etag = f'"{CATALOG_VERSION}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=86400"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return FastJSONResponse({"success": True, **message_catalog()}, headers=headers)
+
+
+@router.get("/detector-export")
+async def get_detector_export(
+    request: Request,
+    language: Optional[str] = None,
+    language_packs: LanguagePacks = Depends(get_language_packs)
+) -> Response:
+    """
+    단말에서 먼저 판정할 수 있도록 컴파일된 사기 탐지기를 내보냅니다 (services/detector_export.py 형식).
+    내용의 SHA-256을 ETag로 사용하며, 같으면 304를 반환합니다.
+    내보내기 바이트와 다이제스트는 언어/탐지기 인스턴스별로 한 번만 만들고, 조건부 요청은 캐시로 응답합니다.
+
+    Args:
+        language: 언어 (없으면 기본 언어)
+
+    Returns:
+        Response: 내보내기 JSON (format, version, language, screening, detector)
+    """
+    fraud_detector = language_packs.detector(_resolve_language(language_packs, language))
+    cached = detector_exports.peek(fraud_detector)
+    if cached is None:
+        cached = await run_in_threadpool(detector_exports.get, fraud_detector)
+    data, content_digest = cached
+    etag = f'"{content_digest}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=data, media_type="application/json", headers=headers)
+
+
 @router.get("/analysis-stats")
-async def get_analysis_stats() -> Dict[str, Any]:
+async def get_analysis_stats(
+    fraud_detector: FraudDetector = Depends(get_fraud_detector),
+    analysis_pool: AnalysisWorkerPool = Depends(get_analysis_pool),
+    language_packs: LanguagePacks = Depends(get_language_packs),
+    shadow_evaluator: Optional[ShadowEvaluator] = Depends(get_shadow_evaluator)
+) -> Dict[str, Any]:
     """
     분석 시스템의 통계 정보를 반환합니다.
     
@@ -221,24 +295,32 @@ async def get_analysis_stats() -> Dict[str, Any]:
         Dict: 시스템 통계 정보
     """
     try:
-        # 실제 운영 환경에서는 데이터베이스에서 통계를 가져옴
-        # 현재는 더미 데이터로 대체
+        # 현재 프로세스에서 집계한 통계 (서버 재시작 시 초기화)
+        readiness = get_readiness_report()
+        checks = readiness["checks"]
         
         result = {
             "success": True,
             "statistics": {
-                "total_analyses": 0,
-                "fraud_detected": 0,
+                **analysis_stats.snapshot(),
                 "false_positives": 0,
-                "average_risk_score": 0.0,
-                "most_common_keywords": [],
                 "supported_audio_formats": [".wav", ".mp3", ".m4a", ".webm", ".ogg"],
-                "max_file_size_mb": 10,
-                "average_processing_time_ms": 0
+                "max_file_size_mb": settings.MAX_UPLOAD_SIZE_MB
+            },
+            "shadow_evaluation": analysis_stats.shadow_snapshot() if shadow_evaluator is not None else None,
+            "scheduler": scheduler.status(),
+            "rate_limits": rate_limiter.status(),
+            "single_flight": {
+                "audio": audio_flights.status(),
+                "text": analysis_pool.in_flight.status()
             },
+            "language_packs": language_packs.status(),
             "system_health": {
-                "speech_analyzer_status": "healthy",
-                "fraud_detector_status": "healthy",
+                "status": readiness["status"],
+                "speech_analyzer_status": checks["speech_recognizer"]["state"],
+                "fraud_detector_status": "healthy" if checks["warm_up"]["ok"] else "starting",
+                "recent_error_rate": checks["error_rate"]["value"],
+                "load": load_shedder.status(),
                 "total_keywords": sum(len(kw_list) for kw_list in fraud_detector.fraud_keywords.values())
             }
         }
@@ -253,6 +335,111 @@ async def get_analysis_stats() -> Dict[str, Any]:
         )
 
 
+async def analyze_audio_file(
+    speech_analyzer: SpeechAnalyzer,
+    analysis_pool: AnalysisWorkerPool,
+    audio_file: Union[str, BinaryIO],
+    slot: Callable[[], AsyncContextManager[None]],
+    language: Optional[str] = None
+) -> Tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]:
+    """
+    음성 인식(음성 속성도 같은 디코딩에서 계산) → 사기 패턴 분석을 실행합니다 (업로드 분석과 비동기 작업에서 공통 사용).
+    업로드는 임시 파일로 한 번 옮기면서 내용 키를 계산하고, 같은 내용의 파일이 동시에 들어오면
+    한 번만 처리하고 결과를 나누어 받습니다 (스케줄러 자리도 한 번만 사용).
+
+    Args:
+        speech_analyzer: 음성 분석기
+        analysis_pool: 분석 워커 풀
+        audio_file: 음성 파일 (파일 객체 또는 경로)
+        slot: 스케줄러 자리를 얻는 컨텍스트 관리자를 만드는 함수
+        language: 언어 코드 (LanguagePacks.resolve 결과, 없으면 기본 언어)
+
+    Returns:
+        Tuple: (음성 속성, 음성 인식 결과, 사기 분석 결과 - 인식 실패 시 None)
+    """
+    with ExitStack() as stack:
+        # 업로드는 임시 파일로 옮기면서 같은 읽기로 내용 키를 계산 (다시 복사하거나 해시하지 않음)
+        audio_path, content_key = await run_in_threadpool(stack.enter_context, local_audio_file(audio_file))
+        speech_language = SpeechAnalyzer.DEFAULT_LANGUAGE
+        if language is not None:
+            content_key = f"{language}:{content_key}"
+            speech_language = get_language_packs().speech_language(language)
+
+        async def compute() -> Tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]:
+            async with slot():
+                speech_result = await run_in_threadpool(speech_analyzer.audio_to_text, audio_path, None,
+                                                        speech_language)
+                audio_properties = speech_result.pop("audio_properties")
+                analysis_stats.record_recognition(speech_result["success"],
+                                                  speech_result.get("input_error", False))
+                analysis_stats.record_audio_preprocessing(speech_result.get("preprocessing"))
+                if not speech_result["success"]:
+                    return audio_properties, speech_result, None
+
+                started = time.perf_counter()
+                fraud_analysis = await analysis_pool.analyze_text(speech_result["text"], language)
+                analysis_stats.record_analysis(fraud_analysis, (time.perf_counter() - started) * 1000)
+            return audio_properties, speech_result, fraud_analysis
+
+        result, _ = await audio_flights.run(content_key, compute)
+    return result
+
+
+def build_audio_result(filename: str, audio_properties: Dict[str, Any], speech_result: Dict[str, Any],
+                       fraud_analysis: Dict[str, Any], compact: bool) -> Dict[str, Any]:
+    """
+    음성 파일 분석 응답을 만듭니다 (업로드 분석과 비동기 작업 결과에서 공통 사용).
+
+    Args:
+        filename: 업로드된 파일 이름
+        audio_properties: 음성 속성 분석 결과
+        speech_result: 음성 인식 결과
+        fraud_analysis: 사기 패턴 분석 결과
+        compact: 권장사항/최종 판정을 문구 대신 ID로 받을지 여부
+
+    Returns:
+        Dict: 분석 결과
+    """
+    return {
+        "success": True,
+        "filename": filename,
+        "audio_properties": audio_properties,
+        "speech_recognition": {
+            "text": speech_result["text"],
+            "confidence": speech_result["confidence"],
+            "language": speech_result["language"],
+            "duration": speech_result["duration"],
+            "preprocessing": speech_result.get("preprocessing"),
+            "noise": speech_result.get("noise")
+        },
+        "fraud_analysis": {
+            "language": fraud_analysis.get("language"),
+            "risk_score": fraud_analysis["risk_score"],
+            "risk_level": fraud_analysis["risk_level"],
+            "is_fraud_suspected": fraud_analysis["is_fraud_suspected"],
+            "keyword_matches": fraud_analysis["keyword_matches"],
+            "pattern_analysis": fraud_analysis["pattern_analysis"],
+            "script_match": fraud_analysis.get("script_match"),
+            "match_spans": fraud_analysis.get("match_spans", []),
+            "score_breakdown": fraud_analysis.get("score_breakdown", {}),
+            **_recommendation_fields(fraud_analysis, compact)
+        },
+        "analysis_summary": {
+            "total_analysis_time": fraud_analysis["analysis_time"],
+            **_verdict_fields(fraud_analysis, compact),
+            "confidence_level": _calculate_confidence_level(speech_result, fraud_analysis)
+        }
+    }
+
+
+def _resolve_language(language_packs: LanguagePacks, language: Optional[str], text: str = "") -> str:
+    """요청 언어를 언어 코드로 정합니다 (지원하지 않는 언어는 400)."""
+    try:
+        return language_packs.resolve(language, text)
+    except LanguagePackNotFound as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 def _generate_final_verdict(fraud_analysis: Dict[str, Any]) -> str:
     """
     최종 판정 메시지를 생성합니다.
@@ -263,18 +450,21 @@ def _generate_final_verdict(fraud_analysis: Dict[str, Any]) -> str:
     Returns:
         str: 최종 판정 메시지
     """
-    risk_level = fraud_analysis["risk_level"]
-    risk_score = fraud_analysis["risk_score"]
-    
-    verdicts = {
-        "VERY_HIGH": f"🚨 매우 위험! 사기 전화로 의심됩니다. (위험도: {risk_score:.1f}/10)",
-        "HIGH": f"⚠️ 위험! 사기 전화일 가능성이 높습니다. (위험도: {risk_score:.1f}/10)",
-        "MEDIUM": f"🔍 주의! 의심스러운 내용이 포함되어 있습니다. (위험도: {risk_score:.1f}/10)",
-        "LOW": f"✅ 비교적 안전하나 주의가 필요합니다. (위험도: {risk_score:.1f}/10)",
-        "VERY_LOW": f"✅ 안전한 통화로 판단됩니다. (위험도: {risk_score:.1f}/10)"
-    }
-    
-    return verdicts.get(risk_level, f"분석 결과: {risk_level} (위험도: {risk_score:.1f}/10)")
+    return render_verdict(fraud_analysis["risk_level"], fraud_analysis["risk_score"])
+
+
+def _recommendation_fields(fraud_analysis: Dict[str, Any], compact: bool) -> Dict[str, Any]:
+    """권장사항 응답 필드 (압축 응답이면 문구 대신 ID)"""
+    if compact:
+        return {"recommendation_ids": fraud_analysis.get("recommendation_ids", [])}
+    return {"recommendations": fraud_analysis["recommendations"]}
+
+
+def _verdict_fields(fraud_analysis: Dict[str, Any], compact: bool) -> Dict[str, Any]:
+    """최종 판정 응답 필드 (압축 응답이면 문구 대신 위험 등급 ID)"""
+    if compact:
+        return {"final_verdict_id": fraud_analysis["risk_level"]}
+    return {"final_verdict": _generate_final_verdict(fraud_analysis)}
 
 
 def _calculate_confidence_level(speech_result: Dict[str, Any], 
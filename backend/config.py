@@ -2,6 +2,8 @@
 Smart Voice Guard - 설정 파일
 """
 
+from typing import Dict
+
 from pydantic_settings import BaseSettings
 import os
 
@@ -22,7 +24,69 @@ class Settings(BaseSettings):
     
     # AI 모델 설정
     WHISPER_MODEL: str = "base"  # tiny, base, small, medium, large
+    SPEECH_TARGET_SAMPLE_RATE: int = 0  # 인식 전 변환할 샘플레이트 (0이면 인식 엔진 기본값 16kHz, 전화 음성은 8000)
     FRAUD_DETECTION_THRESHOLD: float = 0.7  # 사기 탐지 임계값
+    FRAUD_SUSPICION_SCORE: float = 5.0  # 사기 의심으로 판정할 위험도 점수 (0-10, 이 점수 이상이면 is_fraud_suspected)
+    SCORING_RULES_PATH: str = ""  # 가산점/위험 등급 규칙 파일 (services/scoring_rules.py 문법, 비어 있으면 기본 규칙)
+    
+    # 언어 팩 설정 (services/language_packs.py)
+    LANGUAGE_PACK_DIR: str = ""  # 언어 팩 JSON 디렉터리 (비어 있으면 backend/language_packs)
+    MAX_RESIDENT_LANGUAGE_PACKS: int = 2  # 기본 언어(한국어) 외에 메모리에 유지할 언어 팩 수 (프로세스마다)
+    
+    # 분석 워커 설정
+    ANALYSIS_WORKERS: int = 0  # 텍스트 분석 워커 프로세스 수 (0이면 서버 프로세스에서 처리)
+    WARM_UP_AUDIO: bool = False  # 시작 시 음성 처리 라이브러리를 미리 불러올지 여부
+    
+    # 부하 차단 및 준비 상태 설정
+    MAX_IN_FLIGHT_REQUESTS: int = 64  # 동시에 처리할 최대 분석 요청 수 (초과 시 즉시 503)
+    MAX_QUEUE_DEPTH: int = 256  # 워커 대기열 최대 깊이 (초과 시 즉시 503)
+    READY_MAX_ERROR_RATE: float = 0.5  # 최근 오류율이 이 값 이상이면 준비되지 않음으로 보고
+    READY_MIN_EVENTS: int = 20  # 최근 구간(60초) 요청/인식이 이 수 이상일 때만 오류율로 준비 상태를 판단
+    
+    # 응답 압축 설정 (Accept-Encoding에 따라 br 또는 gzip, api/middleware.py)
+    RESPONSE_COMPRESSION_MIN_SIZE: int = 1024  # 이 크기(바이트) 이상인 응답만 압축
+    GZIP_COMPRESSION_LEVEL: int = 6  # gzip 압축 수준 (1 - 9)
+    BROTLI_QUALITY: int = 5  # brotli 압축 수준 (0 - 11, brotli 설치 시)
+    
+    # 업로드 설정 (음성은 블록 단위로 디코딩하므로 파일 크기와 메모리 사용량이 무관, services/audio_stream.py)
+    MAX_UPLOAD_SIZE_MB: int = 50  # 업로드/통화 음성 조각의 최대 파일 크기
+    
+    # 작업 스케줄러 설정 (streaming > interactive > upload > bulk, services/scheduler.py)
+    SCHEDULER_CONCURRENCY: int = 8  # 동시에 실행할 음성 인식/분석 작업 수
+    SCHEDULER_RESERVED_SLOTS: int = 2  # 통화 세션/텍스트 분석 전용 자리 수 (업로드/대량 작업은 사용 불가)
+    SCHEDULER_MAX_QUEUE: int = 256  # 등급별 최대 대기 작업 수 (초과 시 즉시 503)
+    SCHEDULER_DEADLINES_MS: Dict[str, int] = {"streaming": 2000, "interactive": 5000, "upload": 30000, "bulk": 0}  # 등급별 작업 시작 기한 (0이면 기한 없음)
+    SCHEDULER_CLIENT_WEIGHTS: Dict[str, float] = {}  # 클라이언트(X-Client-Id)별 가중치 (기본 1.0)
+    
+    # 클라이언트(X-API-Key/X-Client-Id)별 요청 한도 (토큰 버킷, services/rate_limiter.py, 분당 보충량 0이면 제한 없음)
+    RATE_LIMIT_TEXT_PER_MINUTE: float = 600  # 텍스트 분석 요청 수 (분당)
+    RATE_LIMIT_TEXT_BURST: float = 60  # 한 번에 몰아서 보낼 수 있는 텍스트 요청 수
+    RATE_LIMIT_AUDIO_SECONDS_PER_MINUTE: float = 600  # 음성 인식 길이 (분당 초, 동시 통화 약 10개)
+    RATE_LIMIT_AUDIO_BURST_SECONDS: float = 1800  # 한 번에 몰아서 보낼 수 있는 음성 길이 (초)
+    RATE_LIMIT_AUDIO_RESERVE_BYTES_PER_SECOND: int = 32000  # 업로드 크기로 음성 길이를 어림할 때 초당 바이트 (16kHz 16bit 모노 WAV)
+    RATE_LIMIT_AUDIO_MIN_RESERVE_SECONDS: float = 5.0  # 음성 업로드를 받을 때 먼저 차감하는 최소 길이 (초, 인식 후 실제 길이로 정산)
+    RATE_LIMIT_MAX_CLIENTS: int = 10000  # 메모리에 보관할 최대 클라이언트 수
+    RATE_LIMIT_STORE_PATH: str = ""  # 여러 서버 프로세스가 한도를 공유할 SQLite 파일 경로 (비어 있으면 메모리)
+    
+    # 평판 저장소 설정 (신고된 사기 번호, services/reputation_store.py로 생성)
+    REPUTATION_DB_PATH: str = ""  # 평판 파일 경로 (비어 있거나 파일이 없으면 조회하지 않음)
+    
+    # 섀도 평가 설정 (후보 키워드/가중치/규칙을 실제 요청 일부로 비교, services/shadow.py)
+    SHADOW_CONFIG_PATH: str = ""  # 후보 탐지기 설정 JSON (비어 있으면 섀도 평가 안 함)
+    SHADOW_SAMPLE_RATE: float = 0.0  # 후보로도 분석할 요청 비율 (0.0 - 1.0)
+    
+    # 통화 세션 설정 (여러 조각으로 나누어 보내는 통화의 누적 분석)
+    SESSION_TTL_SECONDS: int = 1800  # 마지막 갱신 후 세션 유지 시간 (초)
+    MAX_SESSIONS: int = 10000  # 메모리에 유지할 최대 세션 수
+    SESSION_SPILL_PATH: str = ""  # 넘친 세션을 보관할 SQLite 파일 경로 (비어 있으면 삭제)
+    
+    # 비동기 작업 설정 (긴 녹음 파일을 접수 후 백그라운드 처리, services/job_queue.py)
+    JOB_WORKERS: int = 2  # 동시에 처리할 작업 수 (스케줄러 bulk 등급 한도 안에서 실행)
+    JOB_MAX_PENDING: int = 100  # 최대 대기 작업 수 (초과 시 429)
+    JOB_MAX_FILE_SIZE_MB: int = 100  # 작업으로 받을 최대 파일 크기
+    JOB_RESULT_TTL_SECONDS: int = 3600  # 완료 후 결과 보관 시간 (초)
+    JOB_SPOOL_DIR: str = ""  # 입력 파일 저장 디렉터리 (비어 있으면 임시 디렉터리)
+    JOB_STORE_PATH: str = ""  # 작업 상태/결과를 기록할 SQLite 파일 경로 (비어 있으면 메모리에만 보관)
     
     # 데이터베이스 설정 (나중에 사용)
     DATABASE_URL: str = "sqlite:///./smart_voice_guard.db"
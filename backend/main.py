@@ -3,22 +3,48 @@ Smart Voice Guard - 메인 서버 파일
 AI 기반 사기 전화 차단 시스템
 """
 
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 import uvicorn
 
 # API 라우터 import
+from api import dependencies
+from api.call_sessions import router as call_sessions_router
+from api.health import router as health_router
+from api.jobs import router as jobs_router
+from api.middleware import CompressionMiddleware, LoadSheddingMiddleware, RateLimitMiddleware
+from api.responses import FastJSONResponse
 from api.voice_analysis import router as voice_router
+from config import settings
 
 # FastAPI 앱 생성
 app = FastAPI(
     title="Smart Voice Guard API",
     description="AI 기반 사기 전화 차단 시스템",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
+)
+
+# 부하 차단 (처리 한도 초과 시 분석 요청을 즉시 거절)
+app.add_middleware(LoadSheddingMiddleware, path_prefix="/api/voice")
+
+# 클라이언트별 요청 한도 (한도를 넘은 요청은 부하 차단/처리 자리를 쓰기 전에 429)
+app.add_middleware(RateLimitMiddleware, path_prefix="/api/voice")
+
+# 응답 압축 (큰 응답만, 클라이언트가 지원하는 경우)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.RESPONSE_COMPRESSION_MIN_SIZE,
+    gzip_level=settings.GZIP_COMPRESSION_LEVEL,
+    brotli_quality=settings.BROTLI_QUALITY
 )
 
 # CORS 설정 (웹 브라우저에서 API에 접근할 수 있도록)
+# 마지막에 등록한 미들웨어가 가장 바깥에서 실행되므로 마지막에 등록해
+# 부하 차단(503)/요청 한도(429) 응답에도 CORS 헤더가 붙도록 함
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # 모든 도메인 허용 (개발용)
@@ -29,6 +55,27 @@ app.add_middleware(
 
 # API 라우터 등록
 app.include_router(voice_router)
+app.include_router(call_sessions_router)
+app.include_router(jobs_router)
+app.include_router(health_router)
+
+# 서버 시작/종료 시 서비스 관리
+@app.on_event("startup")
+async def start_services():
+    """
+    분석 워커를 fork한 뒤 서비스 준비(warm-up)를 백그라운드로 시작합니다
+    워커 fork는 스레드 풀/SQLite 연결이 생기기 전에 동기로 수행하고,
+    나머지 준비 중에도 요청은 바로 받을 수 있으며 준비 상태는 /health/ready로 확인합니다
+    """
+    dependencies.start_workers()
+    app.state.warm_up_task = asyncio.create_task(dependencies.warm_up())
+
+@app.on_event("shutdown")
+async def stop_services():
+    """
+    분석 워커 등 서비스를 정리합니다
+    """
+    dependencies.shutdown()
 
 # 기본 라우트 (홈페이지)
 @app.get("/")
@@ -42,7 +89,7 @@ async def root():
         "version": "1.0.0"
     }
 
-# 서버 상태 확인용 라우트
+# 서버 상태 확인용 라우트 (생존 여부만 확인, 준비 상태는 /health/ready)
 @app.get("/health")
 async def health_check():
     """
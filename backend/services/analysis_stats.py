@@ -0,0 +1,179 @@
+"""
+분석 통계 서비스
+분석 건수, 위험도, 처리 시간, 최근 오류율을 메모리에 집계합니다.
+"""
+
+import threading
+import time
+from collections import Counter, deque
+from typing import Deque, Dict, Optional, Tuple
+
+
+class AnalysisStats:
+    """
+    분석 통계 집계기 클래스
+    누적 통계와 함께 최근 구간(window_seconds)의 요청 성공/실패를 보관해 오류율을 계산합니다.
+    """
+
+    def __init__(self, window_seconds: float = 60.0, max_events: int = 10000, min_events: int = 20):
+        """
+        통계 집계기 초기화
+
+        Args:
+            window_seconds: 최근 오류율 계산 구간 (초)
+            max_events: 최근 구간에 보관할 최대 이벤트 수
+            min_events: 오류율을 계산할 최소 이벤트 수 (이보다 적으면 오류율 0, 한가한 인스턴스의 1/1 = 100% 방지)
+        """
+        self.window_seconds = window_seconds
+        self.min_events = min_events
+        self._lock = threading.Lock()
+        self._events: Deque[Tuple[float, bool]] = deque(maxlen=max_events)
+        self._recognition_events: Deque[Tuple[float, bool]] = deque(maxlen=max_events)
+
+        self.total_analyses = 0
+        self.fraud_detected = 0
+        self.total_risk_score = 0.0
+        self.total_processing_ms = 0.0
+        self.keyword_counts: Counter = Counter()
+
+        # 인식 전 음성 변환 (리샘플링/다운믹스)
+        self.audio_prepared = 0
+        self.audio_original_bytes = 0
+        self.audio_bytes_saved = 0
+
+        # 섀도 평가 (후보 탐지기와의 비교)
+        self.shadow_compared = 0
+        self.shadow_dropped = 0
+        self.shadow_decision_disagreements = 0
+        self.shadow_level_disagreements = 0
+        self.shadow_total_delta = 0.0
+        self.shadow_total_abs_delta = 0.0
+        self.shadow_max_abs_delta = 0.0
+        self.shadow_total_ms = 0.0
+        self.shadow_transitions: Counter = Counter()
+
+    def record_analysis(self, fraud_analysis: Dict[str, any], processing_ms: float) -> None:
+        """
+        사기 분석 결과 하나를 기록합니다.
+
+        Args:
+            fraud_analysis: FraudDetector 분석 결과
+            processing_ms: 처리 시간 (밀리초)
+        """
+        with self._lock:
+            self.total_analyses += 1
+            self.total_risk_score += fraud_analysis.get("risk_score", 0.0)
+            self.total_processing_ms += processing_ms
+            if fraud_analysis.get("is_fraud_suspected"):
+                self.fraud_detected += 1
+            for keywords in fraud_analysis.get("keyword_matches", {}).values():
+                self.keyword_counts.update(keywords)
+
+    def record_shadow(self, primary: Dict[str, any], candidate: Dict[str, any],
+                      processing_ms: float) -> None:
+        """
+        현재 탐지기와 후보 탐지기의 분석 결과 차이를 기록합니다.
+
+        Args:
+            primary: 현재 탐지기 분석 결과
+            candidate: 후보 탐지기 분석 결과
+            processing_ms: 후보 탐지기 처리 시간 (밀리초)
+        """
+        delta = candidate.get("risk_score", 0.0) - primary.get("risk_score", 0.0)
+        with self._lock:
+            self.shadow_compared += 1
+            self.shadow_total_delta += delta
+            self.shadow_total_abs_delta += abs(delta)
+            self.shadow_max_abs_delta = max(self.shadow_max_abs_delta, abs(delta))
+            self.shadow_total_ms += processing_ms
+            if primary.get("is_fraud_suspected") != candidate.get("is_fraud_suspected"):
+                self.shadow_decision_disagreements += 1
+            if primary.get("risk_level") != candidate.get("risk_level"):
+                self.shadow_level_disagreements += 1
+                self.shadow_transitions[f"{primary.get('risk_level')}->{candidate.get('risk_level')}"] += 1
+
+    def record_shadow_dropped(self) -> None:
+        """대기 작업이 많아 버린 섀도 표본을 기록합니다."""
+        with self._lock:
+            self.shadow_dropped += 1
+
+    def shadow_snapshot(self) -> Dict[str, any]:
+        """섀도 평가 통계를 반환합니다."""
+        with self._lock:
+            compared = self.shadow_compared
+            return {
+                "compared": compared,
+                "dropped": self.shadow_dropped,
+                "decision_disagreement_rate": round(self.shadow_decision_disagreements / compared, 4) if compared else 0.0,
+                "level_disagreement_rate": round(self.shadow_level_disagreements / compared, 4) if compared else 0.0,
+                "mean_score_delta": round(self.shadow_total_delta / compared, 3) if compared else 0.0,
+                "mean_abs_score_delta": round(self.shadow_total_abs_delta / compared, 3) if compared else 0.0,
+                "max_abs_score_delta": round(self.shadow_max_abs_delta, 3),
+                "candidate_average_processing_time_ms": round(self.shadow_total_ms / compared, 2) if compared else 0,
+                "level_transitions": dict(self.shadow_transitions.most_common(10))
+            }
+
+    def record_request(self, success: bool) -> None:
+        """API 요청 성공/실패를 기록합니다 (의도적으로 거절한 요청은 기록하지 않음)."""
+        with self._lock:
+            self._events.append((time.monotonic(), success))
+
+    def record_recognition(self, success: bool, input_error: bool = False) -> None:
+        """
+        음성 인식 엔진 호출 성공/실패를 기록합니다.
+
+        Args:
+            success: 성공 여부
+            input_error: 클라이언트가 보낸 음성을 디코딩할 수 없어 실패한 경우 (엔진 오류율에 넣지 않음)
+        """
+        if input_error:
+            return
+        with self._lock:
+            self._recognition_events.append((time.monotonic(), success))
+
+    def record_audio_preprocessing(self, preprocessing: Optional[Dict[str, any]]) -> None:
+        """인식 전 음성 변환 결과(SpeechAnalyzer preprocessing)를 기록합니다."""
+        if not preprocessing:
+            return
+        with self._lock:
+            self.audio_prepared += 1
+            self.audio_original_bytes += preprocessing["original_bytes"]
+            self.audio_bytes_saved += preprocessing["bytes_saved"]
+
+    def recent_error_rate(self) -> float:
+        """최근 구간의 요청 오류율 (요청이 min_events보다 적으면 0)"""
+        return self._error_rate(self._events)
+
+    def recent_recognition_error_rate(self) -> float:
+        """최근 구간의 음성 인식 오류율 (호출이 min_events보다 적으면 0)"""
+        return self._error_rate(self._recognition_events)
+
+    def snapshot(self) -> Dict[str, any]:
+        """누적 통계를 반환합니다."""
+        with self._lock:
+            total = self.total_analyses
+            return {
+                "total_analyses": total,
+                "fraud_detected": self.fraud_detected,
+                "average_risk_score": round(self.total_risk_score / total, 2) if total else 0.0,
+                "average_processing_time_ms": round(self.total_processing_ms / total, 2) if total else 0,
+                "most_common_keywords": [
+                    {"keyword": keyword, "count": count}
+                    for keyword, count in self.keyword_counts.most_common(10)
+                ],
+                "audio_preprocessing": {
+                    "files": self.audio_prepared,
+                    "original_bytes": self.audio_original_bytes,
+                    "bytes_saved": self.audio_bytes_saved
+                }
+            }
+
+    def _error_rate(self, events: Deque[Tuple[float, bool]]) -> float:
+        cutoff = time.monotonic() - self.window_seconds
+        with self._lock:
+            while events and events[0][0] < cutoff:
+                events.popleft()
+            if not events or len(events) < self.min_events:
+                return 0.0
+            failures = sum(1 for _, success in events if not success)
+            return failures / len(events)
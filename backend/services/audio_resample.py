@@ -0,0 +1,142 @@
+"""
+음성 리샘플링 서비스
+업로드된 WAV(44.1/48kHz 스테레오 등)를 음성 인식 엔진이 실제로 사용하는 샘플레이트의
+16bit 모노 PCM으로 줄입니다. 모든 변환은 numpy 배열 연산으로 처리합니다.
+"""
+
+import math
+import wave
+
+import numpy as np
+
+
+def decode_pcm(frames: bytes, sample_width: int, channels: int) -> np.ndarray:
+    """
+    PCM 바이트를 샘플 배열로 바꿉니다.
+
+    Args:
+        frames: PCM 프레임 (리틀 엔디언)
+        sample_width: 샘플 크기 (바이트)
+        channels: 채널 수
+
+    Returns:
+        np.ndarray: 샘플 배열 [프레임 수, 채널 수] -1.0 - 1.0
+
+    Raises:
+        wave.Error: 지원하지 않는 샘플 크기인 경우
+    """
+    raw = np.frombuffer(frames, dtype=np.uint8)
+    raw = raw[:len(raw) - len(raw) % (sample_width * channels)]
+    if sample_width == 1:
+        samples = (raw.astype(np.float32) - 128.0) / 128.0
+    elif sample_width == 2:
+        samples = raw.view("<i2").astype(np.float32) / 32768.0
+    elif sample_width == 3:
+        # 24bit: 3바이트를 상위 바이트에 채워 int32로 만든 뒤 부호 유지하며 이동
+        triplets = raw.reshape(-1, 3).astype(np.int32)
+        samples = ((triplets[:, 0] << 8 | triplets[:, 1] << 16 | triplets[:, 2] << 24) >> 8).astype(np.float32) / 8388608.0
+    elif sample_width == 4:
+        samples = raw.view("<i4").astype(np.float32) / 2147483648.0
+    else:
+        raise wave.Error(f"지원하지 않는 샘플 크기입니다: {sample_width}바이트")
+
+    return samples.reshape(-1, channels)
+
+
+def downmix(samples: np.ndarray) -> np.ndarray:
+    """채널 평균으로 모노 신호를 만듭니다."""
+    if samples.ndim == 1:
+        return samples
+    if samples.shape[1] == 1:
+        return samples[:, 0]
+    return samples.mean(axis=1, dtype=np.float32)
+
+
+class StreamingResampler:
+    """
+    블록 단위 리샘플러 클래스
+    긴 음성을 고정 크기 블록으로 나누어 처리할 때 사용합니다 (다폴리페이즈 FIR, 블록 경계에서 끊김 없음).
+    필터 길이만큼의 입력만 보관하므로 메모리 사용량이 음성 길이와 무관합니다.
+    """
+
+    def __init__(self, source_rate: int, target_rate: int, half_taps: int = 16):
+        """
+        리샘플러 초기화
+
+        Args:
+            source_rate: 원래 샘플레이트
+            target_rate: 목표 샘플레이트 (원래보다 높으면 그대로 통과)
+            half_taps: 입력 샘플 기준 필터 반쪽 길이 (길수록 정확하고 느림)
+        """
+        self.passthrough = target_rate >= source_rate
+        divisor = math.gcd(source_rate, target_rate)
+        self.up = target_rate // divisor
+        self.down = source_rate // divisor
+
+        # 업샘플 영역에서 설계한 windowed-sinc 저역 통과 필터를 위상별로 나눔
+        factor = max(self.up, self.down)
+        center = half_taps * factor
+        positions = np.arange(-center, center + 1)
+        kernel = np.sinc(positions / factor) * np.kaiser(len(positions), 8.0) * self.up / factor
+
+        phases = np.arange(self.up)
+        self._offsets = -((center - phases) // self.up)  # ceil((phase - center) / up)
+        self._taps = 2 * center // self.up + 2
+        kernel_index = phases[:, None] - (self._offsets[:, None] + np.arange(self._taps)) * self.up + center
+        valid = (kernel_index >= 0) & (kernel_index < len(kernel))
+        self._weights = np.where(valid, kernel[np.clip(kernel_index, 0, len(kernel) - 1)], 0.0).astype(np.float32)
+
+        # 앞쪽 필터 구간은 0으로 채움 (버퍼 첫 샘플의 입력 인덱스 = self._start)
+        self._lookbehind = -int(self._offsets.min()) + 1
+        self._buffer = np.zeros(self._lookbehind, dtype=np.float32)
+        self._start = -self._lookbehind
+        self._received = 0
+        self._next_output = 0
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """
+        입력 블록을 받아, 필터에 필요한 입력이 모두 들어온 만큼의 출력을 반환합니다.
+
+        Args:
+            block: 모노 신호 블록
+
+        Returns:
+            np.ndarray: 리샘플링된 신호 (float32, 길이는 블록마다 다를 수 있음)
+        """
+        if self.passthrough:
+            return block.astype(np.float32, copy=False)
+        self._buffer = np.concatenate([self._buffer, block.astype(np.float32, copy=False)])
+        self._received += len(block)
+        return self._emit(self._received)
+
+    def flush(self) -> np.ndarray:
+        """남은 출력을 반환합니다 (뒤쪽 필터 구간은 0으로 채움)."""
+        if self.passthrough:
+            return np.zeros(0, dtype=np.float32)
+        self._buffer = np.concatenate([self._buffer, np.zeros(self._taps, dtype=np.float32)])
+        return self._emit(self._received, final=True)
+
+    def _emit(self, available: int, final: bool = False) -> np.ndarray:
+        if final:
+            # 전체 출력 길이 = ceil(입력 길이 × up / down)
+            end = -(-available * self.up // self.down)
+        else:
+            # 마지막 탭이 이미 들어온 입력 안에 있는 출력까지만
+            end = ((available - self._taps - int(self._offsets.max())) * self.up) // self.down + 1
+        outputs = np.arange(self._next_output, max(end, self._next_output))
+        if len(outputs) == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        positions = outputs * self.down
+        phases = positions % self.up
+        first = positions // self.up + self._offsets[phases] - self._start
+        window = self._buffer[first[:, None] + np.arange(self._taps)]
+        result = np.einsum("ij,ij->i", window, self._weights[phases])
+
+        self._next_output = int(outputs[-1]) + 1
+        # 다음 출력에 필요 없는 앞부분 입력은 버림
+        next_first = (self._next_output * self.down) // self.up + int(self._offsets.min()) - self._start
+        if next_first > 0:
+            self._buffer = self._buffer[next_first:]
+            self._start += next_first
+        return result.astype(np.float32)
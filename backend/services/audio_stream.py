@@ -0,0 +1,203 @@
+"""
+음성 스트리밍 디코딩 서비스
+음성 파일을 한 번에 메모리에 올리지 않고 인식 엔진 샘플레이트의 모노 블록으로 디코딩한 뒤,
+말소리 감지 결과에 따라 길이가 제한된 인식 구간으로 묶습니다.
+PCM WAV는 wave 모듈로 직접 읽고, 그 밖의 형식은 ffmpeg 출력을 파이프로 읽습니다.
+처리 중 보관하는 음성은 인식 구간 하나 분량이므로 메모리 사용량이 녹음 길이와 무관합니다.
+"""
+
+import json
+import shutil
+import subprocess
+import wave
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from services.audio_resample import StreamingResampler, decode_pcm, downmix
+from services.noise_floor import StreamingVad
+
+
+# 디코딩 블록 길이 (초)
+BLOCK_SECONDS = 0.1
+
+
+class AudioDecodeError(Exception):
+    """음성 파일을 디코딩할 수 없음"""
+
+
+@lru_cache(maxsize=None)
+def find_executable(name: str) -> Optional[str]:
+    """ffmpeg/ffprobe 실행 파일 경로 (없으면 None)"""
+    return shutil.which(name)
+
+
+class PcmStream:
+    """
+    음성 디코딩 스트림 클래스
+    with 블록 안에서 반복하면 -1.0 - 1.0 범위의 float32 모노 블록을 차례로 반환합니다.
+
+        with PcmStream(path, 16000) as stream:
+            for block in stream:
+                ...
+    """
+
+    def __init__(self, path: str, target_rate: int, block_seconds: float = BLOCK_SECONDS):
+        """
+        디코딩 스트림 초기화 (형식 확인만 하고 디코딩은 반복할 때 수행)
+
+        Args:
+            path: 음성 파일 경로
+            target_rate: 목표 샘플레이트 (원래보다 높으면 원래 샘플레이트 유지)
+            block_seconds: 블록 길이 (초)
+
+        Raises:
+            AudioDecodeError: PCM WAV가 아니고 ffmpeg도 없는 경우
+        """
+        self.path = path
+        self.block_seconds = block_seconds
+        self._wav: Optional[wave.Wave_read] = None
+        self._process: Optional[subprocess.Popen] = None
+
+        try:
+            self._wav = wave.open(path, "rb")
+            original_rate = self._wav.getframerate()
+            self.info = {
+                "decoder": "wav",
+                "format": "wav",
+                "original_sample_rate": original_rate,
+                "original_channels": self._wav.getnchannels(),
+                "sample_width": self._wav.getsampwidth(),
+                "sample_rate": min(original_rate, target_rate)
+            }
+        except (wave.Error, EOFError):
+            if find_executable("ffmpeg") is None:
+                raise AudioDecodeError("PCM WAV가 아닌 음성을 디코딩하려면 ffmpeg가 필요합니다") from None
+            probe = _probe(path)
+            original_rate = probe.get("sample_rate", 0)
+            self.info = {
+                "decoder": "ffmpeg",
+                "format": probe.get("format", "unknown"),
+                "original_sample_rate": original_rate,
+                "original_channels": probe.get("channels", 0),
+                "sample_width": 2,
+                "sample_rate": min(original_rate, target_rate) if original_rate else target_rate
+            }
+
+    def __enter__(self) -> "PcmStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        if self._wav is not None:
+            return self._iter_wav()
+        return self._iter_ffmpeg()
+
+    def close(self) -> None:
+        if self._wav is not None:
+            self._wav.close()
+        if self._process is not None and self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
+
+    def _iter_wav(self) -> Iterator[np.ndarray]:
+        wav = self._wav
+        channels, sample_width = wav.getnchannels(), wav.getsampwidth()
+        resampler = StreamingResampler(self.info["original_sample_rate"], self.info["sample_rate"])
+        block_frames = max(int(self.info["original_sample_rate"] * self.block_seconds), 1)
+        while True:
+            frames = wav.readframes(block_frames)
+            if not frames:
+                break
+            block = resampler.process(downmix(decode_pcm(frames, sample_width, channels)))
+            if len(block):
+                yield block
+        tail = resampler.flush()
+        if len(tail):
+            yield tail
+
+    def _iter_ffmpeg(self) -> Iterator[np.ndarray]:
+        self._process = subprocess.Popen(
+            [find_executable("ffmpeg"), "-nostdin", "-v", "error", "-i", self.path,
+             "-f", "s16le", "-acodec", "pcm_s16le", "-ac", "1", "-ar", str(self.info["sample_rate"]), "pipe:1"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        block_bytes = max(int(self.info["sample_rate"] * self.block_seconds), 1) * 2
+        decoded = 0
+        while True:
+            chunk = self._process.stdout.read(block_bytes)
+            if not chunk:
+                break
+            decoded += len(chunk)
+            yield np.frombuffer(chunk[:len(chunk) - len(chunk) % 2], dtype="<i2").astype(np.float32) / 32768.0
+        self._process.stdout.close()
+        if self._process.wait() != 0 and decoded == 0:
+            raise AudioDecodeError("ffmpeg로 디코딩할 수 없는 음성 파일입니다")
+
+
+def iter_segments(stream: PcmStream, vad: StreamingVad, max_seconds: float = 30.0,
+                  min_seconds: float = 10.0, silence_seconds: float = 0.3) -> Iterator[Tuple[np.ndarray, bool]]:
+    """
+    디코딩 블록을 인식 구간으로 묶습니다.
+    min_seconds를 넘은 뒤 말소리가 silence_seconds 이상 끊기면 자르고, max_seconds가 되면 무조건 자릅니다.
+
+    Args:
+        stream: 디코딩 스트림
+        vad: 말소리 감지기 (스트림과 같은 샘플레이트)
+        max_seconds: 구간 최대 길이 (초, 보관하는 음성의 상한)
+        min_seconds: 말이 끊긴 곳에서 자르기 시작할 길이 (초)
+        silence_seconds: 자를 수 있는 무음 길이 (초)
+
+    Yields:
+        Tuple: (구간 신호, 말소리 포함 여부)
+    """
+    rate = stream.info["sample_rate"]
+    max_samples, min_samples = int(max_seconds * rate), int(min_seconds * rate)
+    silence_samples = int(silence_seconds * rate)
+
+    blocks = []
+    length = trailing_silence = 0
+    has_speech = False
+    for block in stream:
+        speech = vad.process(block)
+        blocks.append(block)
+        length += len(block)
+        if speech.any():
+            has_speech = True
+            trailing_silence = (len(speech) - 1 - int(np.flatnonzero(speech)[-1])) * vad.frame_length
+        else:
+            trailing_silence += len(speech) * vad.frame_length
+
+        if length >= max_samples or (length >= min_samples and has_speech and trailing_silence >= silence_samples):
+            yield np.concatenate(blocks), has_speech
+            blocks = []
+            length = trailing_silence = 0
+            has_speech = False
+
+    if blocks:
+        yield np.concatenate(blocks), has_speech
+
+
+def _probe(path: str) -> Dict[str, any]:
+    """ffprobe로 첫 음성 스트림의 샘플레이트/채널 수와 형식을 확인합니다 (ffprobe가 없으면 빈 값)."""
+    ffprobe = find_executable("ffprobe")
+    if ffprobe is None:
+        return {}
+    try:
+        output = subprocess.run(
+            [ffprobe, "-v", "error", "-select_streams", "a:0",
+             "-show_entries", "stream=sample_rate,channels:format=format_name", "-of", "json", path],
+            capture_output=True, timeout=10, check=True
+        ).stdout
+        probe = json.loads(output)
+        stream = (probe.get("streams") or [{}])[0]
+        return {
+            "sample_rate": int(stream.get("sample_rate", 0)),
+            "channels": int(stream.get("channels", 0)),
+            "format": probe.get("format", {}).get("format_name", "unknown").split(",")[0]
+        }
+    except (subprocess.SubprocessError, ValueError, OSError):
+        return {}
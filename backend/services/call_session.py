@@ -0,0 +1,337 @@
+"""
+통화 세션 서비스
+하나의 통화를 여러 번에 나누어 보내는 경우, 조각마다 새로 들어온 부분만 분석하고
+통화 단위로 키워드/패턴/위험도를 누적합니다.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from loguru import logger
+
+from services.proximity import ProximityTracker
+
+
+class CallSessionError(Exception):
+    """통화 세션 처리 오류"""
+
+
+class CallSessionNotFound(CallSessionError):
+    """존재하지 않거나 만료된 세션"""
+
+
+class CallSessionExists(CallSessionError):
+    """이미 존재하는 세션"""
+
+
+class CallSessionManager:
+    """
+    통화 세션 관리자 클래스
+    세션 상태는 크기가 제한된 누적 결과만 보관하며(전체 대화 내용은 저장하지 않음),
+    TTL이 지나면 제거하고 최대 세션 수를 넘으면 오래된 세션을 로컬 저장소로 내보냅니다.
+    관리자 잠금은 세션 상태를 읽고 쓰는 동안만 잡고, 조각 분석은 통화별 잠금 안에서 수행하므로
+    서로 다른 통화는 동시에 분석되고 같은 통화의 조각은 순서대로 반영됩니다.
+    """
+
+    # 조각 경계에 걸친 키워드를 찾기 위해 이전 조각 끝부분을 다음 조각 앞에 붙이는 길이
+    OVERLAP_CHARS = 32
+    # 사기 대본 유사도 조회에 사용할 최근 대화 길이
+    MAX_TRANSCRIPT_CHARS = 2000
+    # 로컬 저장소에서 만료된 세션을 지우는 간격 (초, 조회 시에는 만료 여부를 따로 확인)
+    SPILL_CLEANUP_SECONDS = 60.0
+
+    def __init__(self, fraud_detector, ttl_seconds: float = 1800.0,
+                 max_sessions: int = 10000, spill_path: str = "", language_packs=None):
+        """
+        세션 관리자 초기화
+
+        Args:
+            fraud_detector: 조각 분석에 사용할 사기 탐지기 (기본 언어)
+            ttl_seconds: 마지막 갱신 후 세션 유지 시간 (초)
+            max_sessions: 메모리에 유지할 최대 세션 수
+            spill_path: 넘친 세션을 보관할 SQLite 파일 경로 (비어 있으면 넘친 세션은 삭제)
+            language_packs: 언어별 탐지기 관리자 (LanguagePacks, 없으면 기본 탐지기만 사용)
+        """
+        self.fraud_detector = fraud_detector
+        self.language_packs = language_packs
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, Dict[str, any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 통화 ID → [통화별 잠금, 사용 중인 요청 수] (사용 중인 통화만 보관)
+        self._call_locks: Dict[str, list] = {}
+        self._next_spill_cleanup = 0.0
+
+        self._spill: Optional[sqlite3.Connection] = None
+        if spill_path:
+            self._spill = sqlite3.connect(spill_path, check_same_thread=False)
+            self._spill.execute(
+                "CREATE TABLE IF NOT EXISTS call_sessions "
+                "(call_id TEXT PRIMARY KEY, state TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+            self._spill.commit()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def create(self, call_id: Optional[str] = None, language: Optional[str] = None) -> Dict[str, any]:
+        """
+        새 통화 세션을 만듭니다.
+
+        Args:
+            call_id: 통화 ID (없으면 생성)
+            language: 통화 언어 코드 (LanguagePacks.resolve 결과, 없으면 기본 언어)
+
+        Returns:
+            Dict: 세션 상태
+        """
+        call_id = call_id or uuid.uuid4().hex
+        with self._lock:
+            self._evict_expired()
+            if call_id in self._sessions or self._load_spilled(call_id) is not None:
+                raise CallSessionExists(f"이미 존재하는 통화 세션입니다: {call_id}")
+
+            now = time.time()
+            session = {
+                "call_id": call_id,
+                "language": language or self.fraud_detector.language,
+                "created_at": now,
+                "updated_at": now,
+                "fragments": 0,
+                "characters": 0,
+                "keyword_matches": {},
+                "keyword_counts": {},
+                "pattern_analysis": {},
+                "proximity": {},
+                "stream_position": 0,
+                "script_match": None,
+                "overlap": "",
+                "transcript": ""
+            }
+            self._store(session)
+            return self._summarize(session)
+
+    def append(self, call_id: str, text: str) -> Dict[str, any]:
+        """
+        통화 세션에 텍스트 조각을 추가하고 누적 위험도를 갱신합니다.
+
+        Args:
+            call_id: 통화 ID
+            text: 새로 들어온 텍스트 조각 (이전 조각을 다시 보낼 필요 없음)
+
+        Returns:
+            Dict: 갱신된 세션 상태
+        """
+        with self._call_lock(call_id):
+            with self._lock:
+                session = self._get(call_id)
+
+            # 같은 통화의 다른 조각은 통화별 잠금으로 막혀 있으므로 세션 상태를 잠금 없이 읽고 분석
+            fraud_detector = self._detector(session)
+
+            # 이전 조각 끝부분을 붙여 경계에 걸친 키워드도 찾음
+            prefix = f"{session['overlap']} " if session["overlap"] else ""
+            fragment = fraud_detector.analyze_text(prefix + text)
+            if "error" in fragment:
+                raise CallSessionError(fragment["error"])
+
+            # 근접 조합(WITHIN)은 통화 전체 위치 기준으로 이어서 추적 (조각 경계를 넘는 조합 포함)
+            proximity = self._proximity(session)
+            fraud_detector.feed_proximity(
+                proximity, fragment["match_spans"],
+                offset=session["stream_position"] - len(prefix), min_end=len(prefix)
+            )
+
+            transcript = (session["transcript"] + " " + text)[-self.MAX_TRANSCRIPT_CHARS:]
+            script_match = fraud_detector.script_index.query(
+                fraud_detector.normalizer.normalize(transcript).compact,
+                fraud_detector.SCRIPT_MATCH_THRESHOLD
+            )
+
+            with self._lock:
+                # 분석 중에 로컬 저장소로 내보내졌을 수 있으므로 다시 찾음 (내용은 같음)
+                session = self._get(call_id)
+                self._merge_keywords(session["keyword_matches"], fragment["keyword_matches"])
+                self._count_keywords(session["keyword_counts"], fragment["match_spans"], len(prefix))
+                self._merge_patterns(session["pattern_analysis"], fragment["pattern_analysis"])
+                session["proximity"] = proximity.to_state()
+                session["stream_position"] += len(text) + 1
+                session["transcript"] = transcript
+                session["script_match"] = script_match
+                session["overlap"] = text[-self.OVERLAP_CHARS:]
+                session["fragments"] += 1
+                session["characters"] += len(text)
+                session["updated_at"] = time.time()
+                self._store(session)
+
+            return self._summarize(session)
+
+    def get(self, call_id: str) -> Dict[str, any]:
+        """통화 세션의 현재 상태를 반환합니다."""
+        with self._lock:
+            return self._summarize(self._get(call_id))
+
+    def close(self, call_id: str) -> Dict[str, any]:
+        """
+        통화 세션을 종료하고 최종 결과를 반환합니다.
+
+        Args:
+            call_id: 통화 ID
+
+        Returns:
+            Dict: 최종 세션 상태
+        """
+        with self._call_lock(call_id), self._lock:
+            session = self._get(call_id)
+            del self._sessions[call_id]
+            result = self._summarize(session)
+            result["status"] = "closed"
+            return result
+
+    @contextmanager
+    def _call_lock(self, call_id: str) -> Iterator[None]:
+        """통화별 잠금 (같은 통화의 조각 추가/종료를 순서대로 처리, 사용이 끝나면 삭제)"""
+        with self._lock:
+            entry = self._call_locks.setdefault(call_id, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._call_locks[call_id]
+
+    def _get(self, call_id: str) -> Dict[str, any]:
+        """세션을 찾습니다 (메모리에 없으면 로컬 저장소에서 불러옴)"""
+        self._evict_expired()
+        session = self._sessions.get(call_id)
+        if session is None:
+            session = self._load_spilled(call_id, remove=True)
+            if session is None:
+                raise CallSessionNotFound(f"통화 세션을 찾을 수 없습니다: {call_id}")
+            self._store(session)
+        return session
+
+    def _store(self, session: Dict[str, any]) -> None:
+        """세션을 가장 최근 사용 위치에 저장하고 최대 개수를 넘으면 오래된 세션을 내보냅니다."""
+        self._sessions[session["call_id"]] = session
+        self._sessions.move_to_end(session["call_id"])
+
+        while len(self._sessions) > self.max_sessions:
+            _, oldest = self._sessions.popitem(last=False)
+            self._spill_session(oldest)
+
+    def _evict_expired(self) -> None:
+        """TTL이 지난 세션을 제거합니다 (가장 오래 갱신되지 않은 세션부터 확인)"""
+        now = time.time()
+        cutoff = now - self.ttl_seconds
+        while self._sessions:
+            call_id, session = next(iter(self._sessions.items()))
+            if session["updated_at"] >= cutoff:
+                break
+            del self._sessions[call_id]
+            logger.info(f"만료된 통화 세션을 제거했습니다: {call_id}")
+
+        # 로컬 저장소 정리는 일정 간격으로만 수행 (조회 시 만료된 세션은 없는 것으로 처리)
+        if self._spill is not None and now >= self._next_spill_cleanup:
+            self._next_spill_cleanup = now + self.SPILL_CLEANUP_SECONDS
+            self._spill.execute("DELETE FROM call_sessions WHERE updated_at < ?", (cutoff,))
+            self._spill.commit()
+
+    def _spill_session(self, session: Dict[str, any]) -> None:
+        """세션을 로컬 저장소로 내보냅니다."""
+        if self._spill is None:
+            logger.warning(f"최대 세션 수를 넘어 통화 세션을 삭제했습니다: {session['call_id']}")
+            return
+        self._spill.execute(
+            "INSERT OR REPLACE INTO call_sessions (call_id, state, updated_at) VALUES (?, ?, ?)",
+            (session["call_id"], json.dumps(session, ensure_ascii=False), session["updated_at"])
+        )
+        self._spill.commit()
+
+    def _load_spilled(self, call_id: str, remove: bool = False) -> Optional[Dict[str, any]]:
+        """로컬 저장소에서 세션을 불러옵니다."""
+        if self._spill is None:
+            return None
+        row = self._spill.execute(
+            "SELECT state FROM call_sessions WHERE call_id = ? AND updated_at >= ?",
+            (call_id, time.time() - self.ttl_seconds)
+        ).fetchone()
+        if row is None:
+            return None
+        if remove:
+            self._spill.execute("DELETE FROM call_sessions WHERE call_id = ?", (call_id,))
+            self._spill.commit()
+        return json.loads(row[0])
+
+    def _merge_keywords(self, accumulated: Dict[str, List[str]],
+                        fragment: Dict[str, List[str]]) -> None:
+        """카테고리별 키워드를 중복 없이 합칩니다."""
+        for category, keywords in fragment.items():
+            existing = accumulated.setdefault(category, [])
+            existing.extend(keyword for keyword in keywords if keyword not in existing)
+
+    def _count_keywords(self, counts: Dict[str, int], spans: List[Dict[str, any]],
+                        new_text_start: int) -> None:
+        """
+        키워드 등장 횟수를 누적합니다.
+        앞 조각 끝부분 안에서 끝나는 키워드는 앞 조각에서 이미 셌으므로 제외합니다.
+        """
+        counted = set()
+        for span in spans:
+            occurrence = (span["keyword"], span["start"])
+            if span["type"] != "keyword" or span["end"] <= new_text_start or occurrence in counted:
+                continue
+            counted.add(occurrence)  # 여러 카테고리에 속한 키워드는 한 번만 셈
+            counts[span["keyword"]] = counts.get(span["keyword"], 0) + 1
+
+    def _detector(self, session: Dict[str, any]):
+        """세션 언어의 사기 탐지기 (언어가 없는 이전 세션은 기본 언어)"""
+        language = session.get("language")
+        if self.language_packs is None or not language:
+            return self.fraud_detector
+        return self.language_packs.detector(language)
+
+    def _proximity(self, session: Dict[str, any]) -> ProximityTracker:
+        """세션에 저장된 근접 추적 상태를 복원합니다."""
+        return ProximityTracker.from_state(self._detector(session).rule_set.proximity_groups,
+                                           session["proximity"])
+
+    def _merge_patterns(self, accumulated: Dict[str, any], fragment: Dict[str, any]) -> None:
+        """패턴 결과를 합칩니다 (목록은 중복 없이 합치고 참/거짓은 OR)."""
+        for name, value in fragment.items():
+            if isinstance(value, list):
+                existing = accumulated.setdefault(name, [])
+                existing.extend(item for item in value if item not in existing)
+            else:
+                accumulated[name] = bool(accumulated.get(name)) or bool(value)
+
+    def _summarize(self, session: Dict[str, any]) -> Dict[str, any]:
+        """세션 상태를 응답 형식으로 만듭니다."""
+        verdict = self._detector(session).evaluate(
+            session["keyword_matches"], session["pattern_analysis"], session["script_match"],
+            proximity=self._proximity(session)
+        )
+        return {
+            "call_id": session["call_id"],
+            "language": session.get("language", self.fraud_detector.language),
+            "status": "open",
+            "fragments": session["fragments"],
+            "characters": session["characters"],
+            "created_at": datetime.fromtimestamp(session["created_at"]).isoformat(),
+            "updated_at": datetime.fromtimestamp(session["updated_at"]).isoformat(),
+            **verdict,
+            "keyword_matches": session["keyword_matches"],
+            "keyword_counts": session["keyword_counts"],
+            "pattern_analysis": session["pattern_analysis"],
+            "script_match": session["script_match"]
+        }
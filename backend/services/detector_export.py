@@ -0,0 +1,211 @@
+"""
+탐지기 내보내기 서비스
+컴파일된 사기 탐지기(정규화 설정, 키워드 테이블과 매처 정규식, 번호/URL 정규식, 가중치, 규칙, 대본 서명)를
+버전이 붙은 JSON 파일 하나로 내보내고, 그 파일에서 같은 점수를 내는 탐지기를 다시 만듭니다.
+모바일 등 단말에서 먼저 판정하고 경계 구간의 통화만 서버로 보내는 용도입니다.
+
+- 신고 번호 조회(평판 저장소)는 서버에만 있으므로, 번호/계좌가 나온 텍스트는 서버 확인 대상으로 표시합니다.
+- 파일 경로가 .gz로 끝나면 gzip으로 압축합니다.
+- 서버 배포용 내보내기 바이트와 다이제스트는 ExportCache로 언어/탐지기 인스턴스별로 한 번만 만듭니다.
+- 단말 구현은 이 모듈의 load_detector를 기준 구현으로 삼습니다
+  (MinHash 계산의 계수 × CRC32 곱이 2^62까지 커지므로 JavaScript에서는 BigInt가 필요).
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+import weakref
+from typing import Dict, Optional, Tuple, Union
+
+from services.fraud_detector import FraudDetector
+
+
+# 내보내기 파일 형식 이름과 버전 (구조가 바뀌면 버전을 올림, 2: 키워드별 토큰 경계 위치 추가)
+EXPORT_FORMAT = "smart-voice-guard/fraud-detector"
+EXPORT_VERSION = 2
+
+# 사기 의심 기준보다 이만큼 낮은 점수부터 서버 확인 대상 (경계 구간)
+DEFAULT_ESCALATE_MARGIN = 2.0
+
+
+class ExportFormatError(ValueError):
+    """내보내기 파일 형식이나 버전이 맞지 않음"""
+
+
+def export_detector(detector: FraudDetector, escalate_margin: float = DEFAULT_ESCALATE_MARGIN) -> Dict[str, any]:
+    """
+    탐지기를 내보내기 형식으로 변환합니다.
+
+    Args:
+        detector: 사기 탐지기
+        escalate_margin: 사기 의심 기준보다 얼마나 낮은 점수부터 서버로 보낼지
+
+    Returns:
+        Dict: 내보내기 내용 (format, version, language, screening, detector)
+    """
+    return {
+        "format": EXPORT_FORMAT,
+        "version": EXPORT_VERSION,
+        "language": detector.language,
+        "screening": {
+            "escalate_score": max(detector.suspicion_threshold - escalate_margin, 0.0),
+            "escalate_on_numbers": detector.reputation_store is not None
+        },
+        "detector": detector.to_state()
+    }
+
+
+def dumps(artifact: Dict[str, any]) -> bytes:
+    """내보내기 내용을 압축 JSON 바이트로 직렬화합니다 (키 순서 유지, 같은 입력이면 같은 바이트)."""
+    return json.dumps(artifact, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def digest(data: bytes) -> str:
+    """직렬화한 내보내기 내용의 SHA-256 (ETag, 무결성 확인용)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+class ExportCache:
+    """
+    내보내기 캐시 클래스
+    언어별로 마지막 탐지기 인스턴스의 내보내기 바이트와 다이제스트를 보관합니다.
+    탐지기는 만든 뒤 바뀌지 않으므로, 같은 인스턴스면 다시 직렬화하지 않고
+    언어 팩이 다시 불러와져 인스턴스가 바뀌면 새로 만듭니다 (탐지기는 약한 참조로 보관).
+    """
+
+    def __init__(self, escalate_margin: float = DEFAULT_ESCALATE_MARGIN):
+        """
+        캐시 초기화
+
+        Args:
+            escalate_margin: 사기 의심 기준보다 얼마나 낮은 점수부터 서버로 보낼지
+        """
+        self.escalate_margin = escalate_margin
+        self._lock = threading.Lock()
+        # 언어 → (탐지기 약한 참조, 내보내기 바이트, 다이제스트)
+        self._entries: Dict[str, Tuple[weakref.ref, bytes, str]] = {}
+        self.builds = 0
+
+    def peek(self, detector: FraudDetector) -> Optional[Tuple[bytes, str]]:
+        """탐지기의 캐시된 (내보내기 바이트, 다이제스트) (없으면 None, 만들지 않음)"""
+        entry = self._entries.get(detector.language)
+        if entry is None or entry[0]() is not detector:
+            return None
+        return entry[1], entry[2]
+
+    def get(self, detector: FraudDetector) -> Tuple[bytes, str]:
+        """
+        탐지기의 (내보내기 바이트, 다이제스트)를 반환합니다 (없으면 만들어 보관, 동시 요청은 한 번만 만듦).
+
+        Args:
+            detector: 사기 탐지기
+
+        Returns:
+            Tuple: (dumps 결과, digest 결과)
+        """
+        cached = self.peek(detector)
+        if cached is not None:
+            return cached
+        with self._lock:
+            cached = self.peek(detector)
+            if cached is not None:
+                return cached
+            data = dumps(export_detector(detector, self.escalate_margin))
+            entry = (weakref.ref(detector), data, digest(data))
+            self._entries[detector.language] = entry
+            self.builds += 1
+            return entry[1], entry[2]
+
+
+def save_detector(detector: FraudDetector, path: str,
+                  escalate_margin: float = DEFAULT_ESCALATE_MARGIN) -> Dict[str, any]:
+    """
+    탐지기를 파일로 내보냅니다 (.gz면 gzip 압축).
+
+    Args:
+        detector: 사기 탐지기
+        path: 저장할 파일 경로
+        escalate_margin: 사기 의심 기준보다 얼마나 낮은 점수부터 서버로 보낼지
+
+    Returns:
+        Dict: 파일 정보 (path, size, sha256, language, version)
+    """
+    data = dumps(export_detector(detector, escalate_margin))
+    with open(path, "wb") as raw:
+        if path.endswith(".gz"):
+            with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as compressed:
+                compressed.write(data)
+        else:
+            raw.write(data)
+    return {
+        "path": path,
+        "size": len(data),
+        "sha256": digest(data),
+        "language": detector.language,
+        "version": EXPORT_VERSION
+    }
+
+
+def read_artifact(path: str) -> Dict[str, any]:
+    """
+    내보내기 파일을 읽고 형식과 버전을 확인합니다.
+
+    Raises:
+        ExportFormatError: 형식이나 버전이 맞지 않는 경우
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as source:
+        artifact = json.loads(source.read().decode("utf-8"))
+    _check_artifact(artifact)
+    return artifact
+
+
+def load_detector(source: Union[str, Dict[str, any]]) -> FraudDetector:
+    """
+    내보내기 파일(또는 읽어 둔 내용)에서 탐지기를 만듭니다 (기준 로더).
+    평판 저장소 없이 만들므로 신고 번호 점수는 항상 0입니다.
+
+    Args:
+        source: 파일 경로 또는 내보내기 내용
+
+    Returns:
+        FraudDetector: 내보낸 탐지기와 같은 결과를 내는 탐지기
+
+    Raises:
+        ExportFormatError: 형식이나 버전이 맞지 않는 경우
+    """
+    artifact = read_artifact(source) if isinstance(source, str) else source
+    _check_artifact(artifact)
+    return FraudDetector.from_state(artifact["detector"])
+
+
+def needs_server_check(result: Dict[str, any], artifact: Dict[str, any]) -> bool:
+    """
+    단말에서 낸 분석 결과를 서버에서 다시 확인해야 하는지 판단합니다.
+    경계 구간 이상의 점수이거나, 서버만 조회할 수 있는 번호/계좌가 나온 경우 서버로 보냅니다.
+
+    Args:
+        result: 불러온 탐지기의 analyze_text 결과
+        artifact: 내보내기 내용
+
+    Returns:
+        bool: 서버 확인 필요 여부 (분석 오류도 서버로 보냄)
+    """
+    if "error" in result:
+        return True
+    screening = artifact["screening"]
+    if result["risk_score"] >= screening["escalate_score"]:
+        return True
+    patterns = result.get("pattern_analysis", {})
+    return bool(screening["escalate_on_numbers"]
+                and (patterns.get("phone_numbers") or patterns.get("account_numbers")))
+
+
+def _check_artifact(artifact: Dict[str, any]) -> None:
+    if artifact.get("format") != EXPORT_FORMAT:
+        raise ExportFormatError(f"탐지기 내보내기 파일이 아닙니다: {artifact.get('format')}")
+    if artifact.get("version") != EXPORT_VERSION:
+        raise ExportFormatError(
+            f"지원하지 않는 내보내기 버전입니다: {artifact.get('version')} (지원 버전: {EXPORT_VERSION})"
+        )
@@ -3,11 +3,28 @@
 텍스트 내용을 분석하여 사기 패턴을 탐지합니다.
 """
 
+import json
+import os
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 from loguru import logger
 
+from services.keyword_matcher import KeywordMatcher
+from services.messages import render_recommendations
+from services.proximity import ProximityTracker
+from services.reputation_store import KIND_ACCOUNT, KIND_PHONE, ReputationStore
+from services.script_index import ScriptIndex
+from services.scoring_rules import RuleSet, ScoreRule
+from services.text_normalizer import NORMALIZERS, NormalizedText
+
+
+# 언어 팩을 지정하지 않은 탐지기의 언어 (기본 키워드/대본이 한국어)
+DEFAULT_LANGUAGE = "ko"
+
+# 기본 언어의 확인된 사기 통화 대본 (평가용 data/test_scenarios.py와 겹치지 않게 유지)
+KNOWN_SCRIPTS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "known_scripts.json")
+
 
 class FraudDetector:
     """
@@ -15,11 +32,77 @@ class FraudDetector:
     텍스트 분석을 통해 사기 패턴을 탐지합니다.
     """
     
-    def __init__(self):
-        """사기 탐지기 초기화"""
-        self.fraud_keywords = self._load_fraud_keywords()
-        self.scoring_weights = self._load_scoring_weights()
-        logger.info("사기 탐지기가 초기화되었습니다.")
+    # 패턴 정규식 (클래스 로드 시 한 번만 컴파일)
+    # 번호 뒤에 조사가 바로 붙는 경우("010-1234-5678로")도 찾도록 \b 대신 숫자 경계를 사용
+    PHONE_PATTERN = re.compile(r'(?<!\d)\d{2,3}[-.]?\d{3,4}[-.]?\d{4}(?!\d)')
+    ACCOUNT_PATTERN = re.compile(r'(?<!\d)\d{3,4}[-.]?\d{2,6}[-.]?\d{2,8}(?!\d)')
+    URL_PATTERN = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+    
+    # 알려진 사기 대본 유사도 기준 (추정 자카드 유사도)
+    SCRIPT_MATCH_THRESHOLD = 0.3
+    # 유사도 1.0일 때 더해지는 점수
+    SCRIPT_MATCH_WEIGHT = 4.0
+    # 신고된 번호 하나당 더해지는 점수
+    REPORTED_NUMBER_WEIGHT = 3.0
+    
+    # 표현 패턴별 단어 (키워드와 같은 매처로 한 번에 찾음)
+    PATTERN_WORDS = {
+        "time_pressure": ["지금", "당장", "즉시", "바로", "빨리", "급하게", "서둘러"],
+        "authority_claim": ["검찰", "경찰", "수사", "조사", "체포", "구속", "영장"],
+        "financial_instruction": ["이체", "송금", "입금", "계좌", "카드", "비밀번호"]
+    }
+    
+    # 정규식 패턴 이름 (규칙에서 특징으로 사용)
+    REGEX_PATTERNS = ("phone_numbers", "account_numbers", "urls")
+    
+    # 위험도 점수 기본값 (이 점수 이상이면 사기 의심)
+    DEFAULT_SUSPICION_THRESHOLD = 5.0
+    
+    def __init__(self, reputation_store: Optional[ReputationStore] = None,
+                 fraud_keywords: Optional[Dict[str, List[str]]] = None,
+                 scoring_weights: Optional[Dict[str, float]] = None,
+                 scoring_rules: Optional[str] = None,
+                 suspicion_threshold: float = DEFAULT_SUSPICION_THRESHOLD,
+                 language_pack: Optional[Dict[str, any]] = None):
+        """
+        사기 탐지기 초기화
+        
+        Args:
+            reputation_store: 신고된 전화번호/계좌번호 평판 저장소 (없으면 조회하지 않음)
+            fraud_keywords: 카테고리별 키워드 목록 (없으면 언어 팩 또는 기본 키워드)
+            scoring_weights: 카테고리별 가중치 (없으면 언어 팩 또는 기본 가중치)
+            scoring_rules: 가산점/위험 등급 규칙 원문 (services/scoring_rules.py 문법, 없으면 기본 규칙)
+            suspicion_threshold: 사기 의심으로 판정할 위험도 점수 (0-10)
+            language_pack: 언어 팩 (services/language_packs.py 형식, 없으면 기본 한국어)
+        """
+        language_pack = language_pack or {}
+        self.language = language_pack.get("language", DEFAULT_LANGUAGE)
+        self.reputation_store = reputation_store
+        self.fraud_keywords = (fraud_keywords or language_pack.get("fraud_keywords")
+                               or self._load_fraud_keywords())
+        self.scoring_weights = (scoring_weights or language_pack.get("scoring_weights")
+                                or self._load_scoring_weights())
+        self.pattern_words = language_pack.get("pattern_words") or self.PATTERN_WORDS
+        self.suspicion_threshold = suspicion_threshold
+        
+        # 키워드와 패턴 단어는 로드 시 한 번만 정규화하고 하나의 매처로 컴파일
+        all_keywords = [kw for keywords in self.fraud_keywords.values() for kw in keywords]
+        all_pattern_words = [word for words in self.pattern_words.values() for word in words]
+        normalizer_class = NORMALIZERS[language_pack.get("normalizer", "korean")]
+        self.normalizer = normalizer_class(protected_words=all_keywords + all_pattern_words)
+        self.keyword_table = self._compile_keywords(self.fraud_keywords)
+        self.pattern_table = self._compile_keywords(self.pattern_words)
+        self.keyword_matcher = KeywordMatcher(list(self.keyword_table) + list(self.pattern_table),
+                                              self._compile_splits(all_keywords + all_pattern_words))
+        
+        # 규칙은 로드 시 한 번만 컴파일 (규칙 수와 관계없이 분석마다 함수 호출 한 번)
+        self.rule_set = RuleSet(scoring_rules or self._load_scoring_rules(), self._rule_features())
+        
+        known_scripts = language_pack.get("known_scripts")
+        self.script_index = self._build_script_index(
+            self._load_known_scripts() if known_scripts is None else known_scripts
+        )
+        logger.info(f"사기 탐지기가 초기화되었습니다. (언어: {self.language})")
     
     def _load_fraud_keywords(self) -> Dict[str, List[str]]:
         """
@@ -97,6 +180,188 @@ class FraudDetector:
             "suspicious_benefits": 1.5        # 수상한 혜택 (중간)
         }
     
+    def _load_scoring_rules(self) -> str:
+        """
+        기본 가산점/위험 등급 규칙을 로드합니다.
+        
+        Returns:
+            str: 규칙 원문
+        """
+        return """
+        # 패턴 가산점
+        phone_numbers => +1.0
+        account_numbers => +2.0
+        urls => +1.5
+        time_pressure => +1.0
+        authority_claim => +2.0
+        financial_instruction => +1.5
+        
+        # 근접 조합 가산점 (같은 문장 안의 기관 사칭 + 금전 요구 + 시간 압박)
+        authority_claim AND financial_instruction WITHIN 50 => +1.5
+        authority_claim AND financial_instruction AND time_pressure WITHIN 50 => +1.5
+        institution_impersonation AND financial_terms WITHIN 50 => +1.0
+        
+        # 위험 등급 (위에서부터 처음 맞는 등급)
+        score >= 7.0 => level VERY_HIGH
+        score >= 5.0 => level HIGH
+        score >= 3.0 => level MEDIUM
+        score >= 1.0 => level LOW
+        """
+    
+    def _rule_features(self) -> List[str]:
+        """규칙에서 사용할 수 있는 특징 이름 (키워드 카테고리, 패턴, 신고 번호, 대본 유사도)"""
+        return [*self.fraud_keywords, *self.REGEX_PATTERNS, *self.pattern_words,
+                "reported_numbers", "script_match"]
+    
+    def _compile_keywords(self, fraud_keywords: Dict[str, List[str]]) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        키워드를 정규화하여 매칭 테이블을 만듭니다.
+        "계좌이체"와 "계좌 이체"처럼 정규화 결과가 같은 키워드는 한 번만 매칭됩니다.
+        
+        Args:
+            fraud_keywords: 카테고리별 키워드 목록
+            
+        Returns:
+            Dict: 정규화 키워드 → (카테고리, 대표 키워드) 목록
+        """
+        table: Dict[str, List[Tuple[str, str]]] = {}
+        
+        for category, keywords in fraud_keywords.items():
+            for keyword in keywords:
+                term = self.normalizer.normalize_keyword(keyword)
+                if not term:
+                    continue
+                
+                entries = table.setdefault(term, [])
+                if all(existing != category for existing, _ in entries):
+                    entries.append((category, keyword))
+        
+        return table
+    
+    def _compile_splits(self, keywords: List[str]) -> Dict[str, List[int]]:
+        """
+        정규화 키워드별로 토큰 경계를 넘을 수 있는 위치(원래 키워드에서 띄어 쓴 자리)를 모읍니다.
+        "계좌 이체"가 있으면 "계좌이체"는 "계좌" 뒤의 경계를 넘어 매칭됩니다.
+        
+        Args:
+            keywords: 키워드와 패턴 단어 목록
+            
+        Returns:
+            Dict: 정규화 키워드 → 압축 키워드 안의 경계 위치 목록
+        """
+        splits: Dict[str, set] = {}
+        for keyword in keywords:
+            normalized = self.normalizer.normalize(keyword)
+            if normalized.compact and normalized.boundaries:
+                splits.setdefault(normalized.compact, set()).update(normalized.boundaries)
+        return {term: sorted(positions) for term, positions in splits.items()}
+    
+    def _load_known_scripts(self) -> List[Dict[str, str]]:
+        """
+        확인된 사기 통화 대본을 로드합니다 (data/known_scripts.json, 평가 시나리오와 별도로 관리).
+        
+        Returns:
+            List[Dict]: 대본 목록 (식별자, 제목, 사기 유형, 텍스트)
+        """
+        with open(KNOWN_SCRIPTS_PATH, encoding="utf-8") as scripts_file:
+            return json.load(scripts_file)
+    
+    def _build_script_index(self, scripts: List[Dict[str, str]]) -> ScriptIndex:
+        """
+        사기 대본 유사도 인덱스를 생성합니다.
+        
+        Args:
+            scripts: 사기 대본 목록
+            
+        Returns:
+            ScriptIndex: MinHash LSH 인덱스
+        """
+        index = ScriptIndex()
+        for script in scripts:
+            metadata = {"title": script["title"], "fraud_type": script["fraud_type"]}
+            compact_text = self.normalizer.normalize(script["text"]).compact
+            index.add(script["script_id"], compact_text, metadata)
+        return index
+    
+    def to_state(self) -> Dict[str, any]:
+        """
+        컴파일된 탐지기 상태 (JSON 직렬화 가능, services/detector_export.py에서 사용)
+        정규화 설정, 키워드 테이블, 매처 정규식, 정규식 패턴, 규칙 원문, 대본 서명을 담으며
+        평판 저장소(신고 번호)는 포함하지 않습니다.
+        """
+        return {
+            "language": self.language,
+            "suspicion_threshold": self.suspicion_threshold,
+            "script_match_threshold": self.SCRIPT_MATCH_THRESHOLD,
+            "script_match_weight": self.SCRIPT_MATCH_WEIGHT,
+            "reported_number_weight": self.REPORTED_NUMBER_WEIGHT,
+            "regex_patterns": {
+                "phone_numbers": self.PHONE_PATTERN.pattern,
+                "account_numbers": self.ACCOUNT_PATTERN.pattern,
+                "urls": self.URL_PATTERN.pattern
+            },
+            "fraud_keywords": self.fraud_keywords,
+            "scoring_weights": self.scoring_weights,
+            "pattern_words": self.pattern_words,
+            "normalizer": self.normalizer.to_state(),
+            "keyword_table": {term: [list(entry) for entry in entries] for term, entries in self.keyword_table.items()},
+            "pattern_table": {term: [list(entry) for entry in entries] for term, entries in self.pattern_table.items()},
+            "matcher": {
+                "terms": self.keyword_matcher.terms,
+                "regex": self.keyword_matcher.pattern,
+                "splits": {term: list(positions) for term, positions in self.keyword_matcher.splits.items()}
+            },
+            "scoring_rules": self.rule_set.source,
+            "script_index": self.script_index.to_state()
+        }
+    
+    @classmethod
+    def from_state(cls, state: Dict[str, any],
+                   reputation_store: Optional[ReputationStore] = None) -> "FraudDetector":
+        """
+        내보낸 상태에서 탐지기를 복원합니다 (키워드 정규화와 대본 서명 계산을 다시 하지 않음).
+        
+        Args:
+            state: to_state 결과
+            reputation_store: 신고된 전화번호/계좌번호 평판 저장소 (없으면 조회하지 않음)
+            
+        Returns:
+            FraudDetector: 원래 탐지기와 같은 결과를 내는 탐지기
+            
+        Raises:
+            ValueError: 다시 만든 매처 정규식이 내보낸 정규식과 다른 경우
+        """
+        detector = cls.__new__(cls)
+        detector.language = state["language"]
+        detector.reputation_store = reputation_store
+        detector.fraud_keywords = state["fraud_keywords"]
+        detector.scoring_weights = state["scoring_weights"]
+        detector.pattern_words = state["pattern_words"]
+        detector.suspicion_threshold = state["suspicion_threshold"]
+        detector.SCRIPT_MATCH_THRESHOLD = state["script_match_threshold"]
+        detector.SCRIPT_MATCH_WEIGHT = state["script_match_weight"]
+        detector.REPORTED_NUMBER_WEIGHT = state["reported_number_weight"]
+        
+        regex_patterns = state["regex_patterns"]
+        detector.PHONE_PATTERN = re.compile(regex_patterns["phone_numbers"])
+        detector.ACCOUNT_PATTERN = re.compile(regex_patterns["account_numbers"])
+        detector.URL_PATTERN = re.compile(regex_patterns["urls"])
+        
+        normalizer_state = state["normalizer"]
+        detector.normalizer = NORMALIZERS[normalizer_state["kind"]].from_state(normalizer_state)
+        detector.keyword_table = {term: [tuple(entry) for entry in entries]
+                                  for term, entries in state["keyword_table"].items()}
+        detector.pattern_table = {term: [tuple(entry) for entry in entries]
+                                  for term, entries in state["pattern_table"].items()}
+        detector.keyword_matcher = KeywordMatcher(state["matcher"]["terms"], state["matcher"]["splits"])
+        if detector.keyword_matcher.pattern != state["matcher"]["regex"]:
+            raise ValueError("키워드 매처 정규식이 내보낸 정규식과 다릅니다.")
+        
+        detector.rule_set = RuleSet(state["scoring_rules"], detector._rule_features())
+        detector.script_index = ScriptIndex.from_state(state["script_index"])
+        logger.info(f"사기 탐지기를 내보낸 상태에서 복원했습니다. (언어: {detector.language})")
+        return detector
+    
     def analyze_text(self, text: str) -> Dict[str, any]:
         """
         텍스트를 분석하여 사기 패턴을 탐지합니다.
@@ -111,242 +376,287 @@ class FraudDetector:
             if not text or not text.strip():
                 return self._create_empty_result()
             
-            # 텍스트 전처리
-            processed_text = self._preprocess_text(text)
+            # 텍스트 정규화 (띄어쓰기/자모/조사)
+            normalized = self.normalizer.normalize(text)
+            processed_text = normalized.text
             
-            # 키워드 매칭
-            keyword_matches = self._find_keyword_matches(processed_text)
+            # 키워드/패턴 단어 매칭 (한 번의 탐색으로 원본 위치까지 기록)
+            keyword_matches, word_patterns, match_spans = self._scan_matches(normalized)
             
             # 패턴 분석
-            pattern_analysis = self._analyze_patterns(processed_text)
+            pattern_analysis = self._analyze_patterns(text, word_patterns, match_spans)
+            match_spans.sort(key=lambda span: span["start"])
             
-            # 위험도 점수 계산
-            risk_score = self._calculate_risk_score(keyword_matches, pattern_analysis)
+            # 알려진 사기 대본과의 유사도 조회
+            script_match = self.script_index.query(normalized.compact, self.SCRIPT_MATCH_THRESHOLD)
             
-            # 위험도 등급 결정
-            risk_level = self._determine_risk_level(risk_score)
+            # 위험도 점수/등급 결정
+            verdict = self.evaluate(keyword_matches, pattern_analysis, script_match, match_spans)
             
             # 결과 생성
             result = {
                 "text": text,
+                "language": self.language,
                 "processed_text": processed_text,
-                "risk_score": risk_score,
-                "risk_level": risk_level,
-                "is_fraud_suspected": risk_score >= 5.0,
+                "risk_score": verdict["risk_score"],
+                "risk_level": verdict["risk_level"],
+                "is_fraud_suspected": verdict["is_fraud_suspected"],
                 "keyword_matches": keyword_matches,
                 "pattern_analysis": pattern_analysis,
+                "script_match": script_match,
+                "match_spans": match_spans,
+                "score_breakdown": verdict["score_breakdown"],
                 "analysis_time": datetime.now().isoformat(),
-                "recommendations": self._generate_recommendations(risk_level, keyword_matches)
+                "recommendations": verdict["recommendations"],
+                "recommendation_ids": verdict["recommendation_ids"]
             }
             
-            logger.info(f"사기 분석 완료 - 위험도: {risk_score:.2f}, 등급: {risk_level}")
+            logger.info(f"사기 분석 완료 - 위험도: {verdict['risk_score']:.2f}, 등급: {verdict['risk_level']}")
             return result
             
         except Exception as e:
             logger.error(f"텍스트 분석 중 오류: {str(e)}")
             return self._create_error_result(str(e))
     
-    def _preprocess_text(self, text: str) -> str:
+    def evaluate(self, keyword_matches: Dict[str, List[str]],
+                 pattern_analysis: Dict[str, any],
+                 script_match: Optional[Dict[str, any]] = None,
+                 match_spans: Optional[List[Dict[str, any]]] = None,
+                 proximity: Optional[ProximityTracker] = None) -> Dict[str, any]:
         """
-        텍스트를 전처리합니다.
+        매칭 결과로 위험도 점수, 등급, 권장사항을 결정합니다.
+        여러 조각의 매칭 결과를 합친 경우(통화 세션)에도 사용합니다.
         
         Args:
-            text: 원본 텍스트
+            keyword_matches: 키워드 매칭 결과
+            pattern_analysis: 패턴 분석 결과
+            script_match: 알려진 사기 대본 유사도 조회 결과
+            match_spans: 매칭 구간 목록 (위치 순, WITHIN 규칙 평가용)
+            proximity: 매칭을 이미 넣어 둔 근접 추적기 (통화 세션처럼 여러 조각을 이어 볼 때)
             
         Returns:
-            str: 전처리된 텍스트
+            Dict: 위험도 점수, 등급, 사기 의심 여부, 점수 구성, 권장사항 (문구와 ID)
         """
-        # 소문자 변환
-        processed = text.lower()
+        features = self._extract_features(keyword_matches, pattern_analysis, script_match)
+        if proximity is None:
+            proximity = self.new_proximity_tracker()
+            self.feed_proximity(proximity, match_spans or ())
+        rules = self.rule_set.fired_rules(features, proximity.satisfied)
         
-        # 특수문자 제거 (공백으로 대체)
-        processed = re.sub(r'[^\w\s가-힣]', ' ', processed)
+        score_breakdown = self._score_breakdown(keyword_matches, pattern_analysis, script_match, rules)
+        risk_score = score_breakdown["risk_score"]
+        risk_level = self.rule_set.level(features, risk_score)
+        recommendation_ids = self._generate_recommendations(risk_level, keyword_matches, script_match)
         
-        # 연속된 공백 제거
-        processed = re.sub(r'\s+', ' ', processed)
-        
-        # 앞뒤 공백 제거
-        processed = processed.strip()
-        
-        return processed
+        return {
+            "risk_score": risk_score,
+            "risk_level": risk_level,
+            "is_fraud_suspected": risk_score >= self.suspicion_threshold,
+            "score_breakdown": score_breakdown,
+            "recommendations": render_recommendations(recommendation_ids, script_match),
+            "recommendation_ids": recommendation_ids
+        }
     
-    def _find_keyword_matches(self, text: str) -> Dict[str, List[str]]:
+    def _scan_matches(self, normalized: NormalizedText) -> Tuple[Dict[str, List[str]], Dict[str, bool], List[Dict[str, any]]]:
         """
-        텍스트에서 사기 관련 키워드를 찾습니다.
+        정규화된 텍스트를 한 번 훑어 키워드와 패턴 단어를 찾습니다.
         
         Args:
-            text: 분석할 텍스트
+            normalized: 정규화 결과
             
         Returns:
-            Dict: 카테고리별 매칭된 키워드 목록
+            Tuple: (카테고리별 매칭 키워드 (처음 등장한 순서), 패턴 단어 발견 여부,
+                    원본 텍스트 기준 매칭 구간 목록)
         """
-        matches = {}
+        keyword_matches: Dict[str, List[str]] = {}
+        word_patterns = {name: False for name in self.pattern_words}
+        spans: List[Dict[str, any]] = []
+        seen_terms = set()
+        # 단어 단위 정규화기는 매칭 앞뒤에 경계 공백이 붙으므로 원본 위치 계산에서 제외
+        boundary = len(self.normalizer.WORD_BOUNDARY)
         
-        for category, keywords in self.fraud_keywords.items():
-            found_keywords = []
+        for term, position in self.keyword_matcher.scan(normalized.compact, normalized.boundaries):
+            start, end = normalized.raw_span(position + boundary, position + len(term) - boundary)
+            first_seen = term not in seen_terms
+            seen_terms.add(term)
             
-            for keyword in keywords:
-                # 키워드를 소문자로 변환하여 검색
-                if keyword.lower() in text:
-                    found_keywords.append(keyword)
+            for category, keyword in self.keyword_table.get(term, ()):
+                if first_seen:
+                    keyword_matches.setdefault(category, []).append(keyword)
+                spans.append({"type": "keyword", "category": category, "keyword": keyword,
+                              "start": start, "end": end})
             
-            if found_keywords:
-                matches[category] = found_keywords
+            for name, word in self.pattern_table.get(term, ()):
+                word_patterns[name] = True
+                spans.append({"type": "pattern", "pattern": name, "keyword": word,
+                              "start": start, "end": end})
         
-        return matches
+        return keyword_matches, word_patterns, spans
     
-    def _analyze_patterns(self, text: str) -> Dict[str, any]:
+    def _analyze_patterns(self, raw_text: str, word_patterns: Dict[str, bool],
+                          spans: List[Dict[str, any]]) -> Dict[str, any]:
         """
         텍스트에서 사기 패턴을 분석합니다.
         
         Args:
-            text: 분석할 텍스트
+            raw_text: 원본 텍스트 (하이픈/점이 남아 있어야 하는 번호, URL 검색용)
+            word_patterns: 패턴 단어 발견 여부 (키워드 탐색에서 함께 계산)
+            spans: 매칭 구간 목록 (번호/URL 구간을 추가)
             
         Returns:
             Dict: 패턴 분석 결과
         """
         patterns = {
-            "phone_numbers": self._find_phone_numbers(text),
-            "account_numbers": self._find_account_numbers(text),
-            "urls": self._find_urls(text),
-            "time_pressure": self._detect_time_pressure(text),
-            "authority_claim": self._detect_authority_claim(text),
-            "financial_instruction": self._detect_financial_instruction(text)
+            "phone_numbers": self._find_pattern(self.PHONE_PATTERN, "phone_numbers", raw_text, spans),
+            "account_numbers": self._find_pattern(self.ACCOUNT_PATTERN, "account_numbers", raw_text, spans),
+            "urls": self._find_pattern(self.URL_PATTERN, "urls", raw_text, spans),
+            **word_patterns
         }
+        patterns["reported_numbers"] = self._find_reported_numbers(
+            patterns["phone_numbers"], patterns["account_numbers"]
+        )
         
         return patterns
     
-    def _find_phone_numbers(self, text: str) -> List[str]:
-        """전화번호 패턴 찾기"""
-        phone_pattern = r'\b\d{2,3}[-.]?\d{3,4}[-.]?\d{4}\b'
-        return re.findall(phone_pattern, text)
+    def _find_pattern(self, pattern: re.Pattern, name: str, text: str,
+                      spans: List[Dict[str, any]]) -> List[str]:
+        """정규식 패턴(전화번호, 계좌번호, URL)을 찾고 구간을 기록"""
+        found = []
+        for match in pattern.finditer(text):
+            found.append(match.group())
+            spans.append({"type": "pattern", "pattern": name, "keyword": match.group(),
+                          "start": match.start(), "end": match.end()})
+        return found
     
-    def _find_account_numbers(self, text: str) -> List[str]:
-        """계좌번호 패턴 찾기"""
-        account_pattern = r'\b\d{3,4}[-.]?\d{2,6}[-.]?\d{2,8}\b'
-        return re.findall(account_pattern, text)
+    def _find_reported_numbers(self, phone_numbers: List[str],
+                               account_numbers: List[str]) -> List[Dict[str, any]]:
+        """평판 저장소에서 신고된 전화번호/계좌번호 찾기"""
+        if self.reputation_store is None:
+            return []
+        return (self.reputation_store.lookup_many(KIND_PHONE, phone_numbers)
+                + self.reputation_store.lookup_many(KIND_ACCOUNT, account_numbers))
     
-    def _find_urls(self, text: str) -> List[str]:
-        """URL 패턴 찾기"""
-        url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        return re.findall(url_pattern, text)
+    def _extract_features(self, keyword_matches: Dict[str, List[str]],
+                          pattern_analysis: Dict[str, any],
+                          script_match: Optional[Dict[str, any]]) -> Dict[str, bool]:
+        """규칙 평가용 특징별 발견 여부"""
+        features = {name: bool(pattern_analysis.get(name)) for name in self.rule_set.features}
+        for category in keyword_matches:
+            features[category] = True
+        features["script_match"] = script_match is not None
+        return features
     
-    def _detect_time_pressure(self, text: str) -> bool:
-        """시간 압박 표현 탐지"""
-        time_pressure_words = ["지금", "당장", "즉시", "바로", "빨리", "급하게", "서둘러"]
-        return any(word in text for word in time_pressure_words)
+    def new_proximity_tracker(self) -> ProximityTracker:
+        """규칙의 WITHIN 조건을 확인하는 근접 추적기를 만듭니다."""
+        return ProximityTracker(self.rule_set.proximity_groups)
     
-    def _detect_authority_claim(self, text: str) -> bool:
-        """권위 주장 표현 탐지"""
-        authority_words = ["검찰", "경찰", "수사", "조사", "체포", "구속", "영장"]
-        return any(word in text for word in authority_words)
-    
-    def _detect_financial_instruction(self, text: str) -> bool:
-        """금융 지시 표현 탐지"""
-        financial_instructions = ["이체", "송금", "입금", "계좌", "카드", "비밀번호"]
-        return any(word in text for word in financial_instructions)
+    def feed_proximity(self, tracker: ProximityTracker, match_spans: Iterable[Dict[str, any]],
+                       offset: int = 0, min_end: int = 0) -> None:
+        """
+        매칭 구간을 근접 추적기에 넣습니다 (키워드는 카테고리, 패턴은 패턴 이름이 특징).
+        
+        Args:
+            tracker: 근접 추적기
+            match_spans: 매칭 구간 목록 (위치 순)
+            offset: 위치에 더할 값 (여러 조각을 이어 볼 때 앞 조각까지의 길이)
+            min_end: 이 위치 이하에서 끝나는 매칭은 건너뜀 (앞 조각에서 이미 넣은 매칭)
+        """
+        if not tracker.groups:
+            return
+        for span in match_spans:
+            if span["end"] <= min_end:
+                continue
+            feature = span["category"] if span["type"] == "keyword" else span["pattern"]
+            tracker.feed(feature, span["start"] + offset, span["end"] + offset)
     
-    def _calculate_risk_score(self, keyword_matches: Dict[str, List[str]], 
-                             pattern_analysis: Dict[str, any]) -> float:
+    def _score_breakdown(self, keyword_matches: Dict[str, List[str]], 
+                         pattern_analysis: Dict[str, any],
+                         script_match: Optional[Dict[str, any]],
+                         rules: List[ScoreRule]) -> Dict[str, any]:
         """
-        위험도 점수를 계산합니다.
+        위험도 점수와 항목별 기여도를 계산합니다.
         
         Args:
             keyword_matches: 키워드 매칭 결과
             pattern_analysis: 패턴 분석 결과
+            script_match: 알려진 사기 대본 유사도 조회 결과
+            rules: 적용된 가산점 규칙
             
         Returns:
-            float: 위험도 점수 (0-10)
+            Dict: 카테고리별/규칙별 점수, 신고 번호/대본 유사도 점수, 합계와 최종 점수 (0-10)
         """
-        total_score = 0.0
-        
         # 키워드 기반 점수
-        for category, keywords in keyword_matches.items():
-            weight = self.scoring_weights.get(category, 1.0)
-            keyword_score = len(keywords) * weight
-            total_score += keyword_score
-            
-            logger.debug(f"카테고리 '{category}': {len(keywords)}개 키워드 × {weight} = {keyword_score}")
-        
-        # 패턴 기반 점수
-        pattern_score = 0.0
-        if pattern_analysis.get("phone_numbers"):
-            pattern_score += 1.0
-        if pattern_analysis.get("account_numbers"):
-            pattern_score += 2.0
-        if pattern_analysis.get("urls"):
-            pattern_score += 1.5
-        if pattern_analysis.get("time_pressure"):
-            pattern_score += 1.0
-        if pattern_analysis.get("authority_claim"):
-            pattern_score += 2.0
-        if pattern_analysis.get("financial_instruction"):
-            pattern_score += 1.5
-        
-        total_score += pattern_score
-        
-        # 최대 10점으로 제한
-        final_score = min(total_score, 10.0)
-        
-        logger.debug(f"키워드 점수: {total_score - pattern_score:.2f}, 패턴 점수: {pattern_score:.2f}, 최종 점수: {final_score:.2f}")
-        
-        return final_score
-    
-    def _determine_risk_level(self, risk_score: float) -> str:
-        """
-        위험도 점수를 기반으로 위험 등급을 결정합니다.
+        keyword_scores = {
+            category: len(keywords) * self.scoring_weights.get(category, 1.0)
+            for category, keywords in keyword_matches.items()
+        }
         
-        Args:
-            risk_score: 위험도 점수
-            
-        Returns:
-            str: 위험 등급
-        """
-        if risk_score >= 7.0:
-            return "VERY_HIGH"
-        elif risk_score >= 5.0:
-            return "HIGH"
-        elif risk_score >= 3.0:
-            return "MEDIUM"
-        elif risk_score >= 1.0:
-            return "LOW"
-        else:
-            return "VERY_LOW"
+        # 규칙 기반 점수 (패턴 가산점, 조합 가산점)
+        rule_scores = {rule.label: rule.weight for rule in rules}
+        
+        # 신고된 번호는 번호마다 점수 추가
+        reported_score = len(pattern_analysis.get("reported_numbers", [])) * self.REPORTED_NUMBER_WEIGHT
+        
+        # 알려진 사기 대본 유사도 점수 (유사도에 비례)
+        script_score = script_match["similarity"] * self.SCRIPT_MATCH_WEIGHT if script_match else 0.0
+        
+        total_score = sum(keyword_scores.values()) + sum(rule_scores.values()) + reported_score + script_score
+        
+        # 0-10점으로 제한 (음수 가산점 규칙이 있을 수 있음)
+        final_score = min(max(total_score, 0.0), 10.0)
+        
+        logger.debug(f"키워드 점수: {sum(keyword_scores.values()):.2f}, "
+                     f"규칙 점수: {sum(rule_scores.values()):.2f}, 신고 번호 점수: {reported_score:.2f}, "
+                     f"대본 유사도 점수: {script_score:.2f}, 최종 점수: {final_score:.2f}")
+        
+        return {
+            "keywords": keyword_scores,
+            "rules": rule_scores,
+            "reported_numbers": reported_score,
+            "script_match": script_score,
+            "total": total_score,
+            "risk_score": final_score
+        }
     
     def _generate_recommendations(self, risk_level: str, 
-                                 keyword_matches: Dict[str, List[str]]) -> List[str]:
+                                 keyword_matches: Dict[str, List[str]],
+                                 script_match: Optional[Dict[str, any]] = None) -> List[str]:
         """
         위험도에 따른 권장사항을 생성합니다.
         
         Args:
             risk_level: 위험 등급
             keyword_matches: 키워드 매칭 결과
+            script_match: 알려진 사기 대본 유사도 조회 결과
             
         Returns:
-            List[str]: 권장사항 목록
+            List[str]: 권장사항 ID 목록 (문구는 services/messages.py)
         """
         recommendations = []
         
         if risk_level in ["VERY_HIGH", "HIGH"]:
-            recommendations.append("⚠️ 즉시 통화를 종료하세요")
-            recommendations.append("🚨 절대 개인정보를 제공하지 마세요")
-            recommendations.append("📞 해당 기관에 직접 전화로 확인하세요")
+            recommendations.append("end_call")
+            recommendations.append("protect_personal_info")
+            recommendations.append("verify_by_phone")
             
         if "financial_terms" in keyword_matches:
-            recommendations.append("💳 금융 정보 요청 시 의심하세요")
-            recommendations.append("🏦 은행에 직접 문의하세요")
+            recommendations.append("financial_caution")
+            recommendations.append("contact_bank")
             
         if "institution_impersonation" in keyword_matches:
-            recommendations.append("🏛️ 공공기관 사칭 의심")
-            recommendations.append("✅ 공식 채널로 확인하세요")
+            recommendations.append("impersonation_suspected")
+            recommendations.append("verify_official_channel")
             
         if "threat_intimidation" in keyword_matches:
-            recommendations.append("⚖️ 협박성 발언 시 신고하세요")
-            recommendations.append("📱 112 또는 182로 신고 가능")
+            recommendations.append("report_threat")
+            recommendations.append("report_hotline")
+            
+        if script_match:
+            recommendations.append("known_script")
             
         if not recommendations:
-            recommendations.append("✅ 현재 위험도는 낮으나 주의하세요")
-            recommendations.append("🔍 의심스러운 요청 시 확인하세요")
+            recommendations.append("low_risk_caution")
+            recommendations.append("verify_suspicious")
         
         return recommendations
     
@@ -354,27 +664,37 @@ class FraudDetector:
         """빈 텍스트에 대한 기본 결과 생성"""
         return {
             "text": "",
+            "language": self.language,
             "processed_text": "",
             "risk_score": 0.0,
             "risk_level": "VERY_LOW",
             "is_fraud_suspected": False,
             "keyword_matches": {},
             "pattern_analysis": {},
+            "script_match": None,
+            "match_spans": [],
+            "score_breakdown": {},
             "analysis_time": datetime.now().isoformat(),
-            "recommendations": ["📝 분석할 텍스트가 없습니다"]
+            "recommendations": render_recommendations(["empty_text"]),
+            "recommendation_ids": ["empty_text"]
         }
     
     def _create_error_result(self, error_message: str) -> Dict[str, any]:
         """오류 발생 시 결과 생성"""
         return {
             "text": "",
+            "language": self.language,
             "processed_text": "",
             "risk_score": 0.0,
             "risk_level": "UNKNOWN",
             "is_fraud_suspected": False,
             "keyword_matches": {},
             "pattern_analysis": {},
+            "script_match": None,
+            "match_spans": [],
+            "score_breakdown": {},
             "analysis_time": datetime.now().isoformat(),
             "recommendations": [],
+            "recommendation_ids": [],
             "error": error_message
         }
\ No newline at end of file
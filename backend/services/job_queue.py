@@ -0,0 +1,299 @@
+"""
+비동기 작업 큐 서비스
+긴 녹음 파일처럼 처리 시간이 긴 작업을 접수 즉시 작업 ID로 응답하고, 백그라운드 워커가 처리합니다.
+입력 파일은 스풀 디렉터리에 저장해 메모리에 올려 두지 않으며, 결과는 TTL 동안 보관합니다.
+저장소 경로를 지정하면 작업 상태와 결과를 SQLite에 기록해 서버 재시작 후에도 이어서 처리합니다.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import uuid
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from loguru import logger
+
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+FINISHED_STATES = (JOB_SUCCEEDED, JOB_FAILED)
+
+# 작업 처리 함수: (작업 정보, 입력 파일 경로) → 결과
+JobHandler = Callable[[Dict[str, any], str], Awaitable[Dict[str, any]]]
+
+
+class JobError(Exception):
+    """작업 큐 오류"""
+
+
+class JobNotFound(JobError):
+    """존재하지 않거나 결과 보관 기간이 지난 작업"""
+
+
+class JobQueueFull(JobError):
+    """대기 작업이 한도를 넘음"""
+
+
+class JobQueue:
+    """
+    작업 큐 클래스
+    작업 정보는 메모리(OrderedDict, 접수 순)에 두고 입력 파일은 스풀 디렉터리에 둡니다.
+    워커는 이벤트 루프의 태스크로 실행되며, 무거운 처리는 작업 종류별 처리 함수가 스레드/스케줄러로 넘깁니다.
+    """
+
+    def __init__(self, handlers: Dict[str, JobHandler], num_workers: int = 2,
+                 result_ttl_seconds: float = 3600.0, max_pending: int = 100,
+                 spool_dir: str = "", store_path: str = ""):
+        """
+        작업 큐 초기화
+
+        Args:
+            handlers: 작업 종류별 처리 함수 (등록 후 추가된 종류도 사용)
+            num_workers: 동시에 처리할 작업 수
+            result_ttl_seconds: 완료 후 결과 보관 시간 (초)
+            max_pending: 최대 대기 작업 수 (넘으면 접수 거절)
+            spool_dir: 입력 파일 저장 디렉터리 (비어 있으면 임시 디렉터리)
+            store_path: 작업 상태를 기록할 SQLite 파일 경로 (비어 있으면 메모리에만 보관)
+        """
+        self.handlers = handlers
+        self.num_workers = max(num_workers, 1)
+        self.result_ttl_seconds = result_ttl_seconds
+        self.max_pending = max_pending
+        self.spool_dir = spool_dir or os.path.join(tempfile.gettempdir(), "smart-voice-guard-jobs")
+        os.makedirs(self.spool_dir, exist_ok=True)
+
+        self._jobs: "OrderedDict[str, Dict[str, any]]" = OrderedDict()
+        self._events: Dict[str, asyncio.Event] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+        self._store: Optional[sqlite3.Connection] = None
+        if store_path:
+            self._store = sqlite3.connect(store_path, check_same_thread=False)
+            self._store.execute(
+                "CREATE TABLE IF NOT EXISTS jobs "
+                "(job_id TEXT PRIMARY KEY, state TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+            self._store.commit()
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._workers)
+
+    def start(self) -> None:
+        """
+        워커를 시작하고, 저장소에 남은 미완료 작업을 다시 대기열에 넣습니다 (이벤트 루프에서 호출).
+        이미 시작했으면 아무것도 하지 않습니다.
+        """
+        if self._workers:
+            return
+
+        self._queue = asyncio.Queue()
+        restored = self._restore()
+        self._workers = [asyncio.create_task(self._worker(), name=f"job-worker-{index}")
+                         for index in range(self.num_workers)]
+        logger.info(f"작업 큐 워커 {self.num_workers}개를 시작했습니다. (복구한 대기 작업 {restored}건)")
+
+    def shutdown(self) -> None:
+        """워커를 멈춥니다 (대기/처리 중 작업은 저장소가 있으면 재시작 후 이어서 처리)."""
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def submit(self, kind: str, payload_path: str, params: Optional[Dict[str, any]] = None,
+               client_id: str = "anonymous") -> Dict[str, any]:
+        """
+        작업을 접수합니다 (처리를 기다리지 않고 바로 반환).
+
+        Args:
+            kind: 작업 종류 (등록된 처리 함수 이름)
+            payload_path: 스풀 디렉터리에 저장한 입력 파일 경로 (완료 후 삭제)
+            params: 처리 함수에 넘길 설정값
+            client_id: 작업을 요청한 클라이언트
+
+        Returns:
+            Dict: 작업 상태
+
+        Raises:
+            JobQueueFull: 대기 작업이 한도를 넘은 경우
+        """
+        if kind not in self.handlers:
+            raise JobError(f"알 수 없는 작업 종류입니다: {kind}")
+        self.start()
+        self._evict_expired()
+        if self.pending >= self.max_pending:
+            raise JobQueueFull(f"대기 중인 작업이 너무 많습니다 ({self.max_pending}건)")
+
+        now = time.time()
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "kind": kind,
+            "status": JOB_QUEUED,
+            "client_id": client_id,
+            "params": params or {},
+            "payload_path": payload_path,
+            "created_at": now,
+            "started_at": None,
+            "finished_at": None,
+            "result": None,
+            "error": None
+        }
+        self._jobs[job["job_id"]] = job
+        self._persist(job)
+        self._queue.put_nowait(job["job_id"])
+        return self._public(job)
+
+    def get(self, job_id: str) -> Dict[str, any]:
+        """
+        작업 상태를 조회합니다.
+
+        Raises:
+            JobNotFound: 없거나 결과 보관 기간이 지난 경우
+        """
+        self._evict_expired()
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise JobNotFound(f"존재하지 않거나 만료된 작업입니다: {job_id}")
+        return self._public(job)
+
+    async def wait(self, job_id: str, timeout: float) -> Dict[str, any]:
+        """
+        작업이 끝날 때까지 최대 timeout초 기다린 뒤 상태를 반환합니다 (long-poll).
+
+        Raises:
+            JobNotFound: 없거나 결과 보관 기간이 지난 경우
+        """
+        job = self.get(job_id)
+        if job["status"] in FINISHED_STATES or timeout <= 0:
+            return job
+
+        event = self._events.setdefault(job_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.get(job_id)
+
+    @property
+    def pending(self) -> int:
+        """대기 중이거나 처리 중인 작업 수"""
+        return sum(1 for job in self._jobs.values() if job["status"] not in FINISHED_STATES)
+
+    def status(self) -> Dict[str, any]:
+        """작업 큐 상태"""
+        counts = {state: 0 for state in (JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, JOB_FAILED)}
+        for job in self._jobs.values():
+            counts[job["status"]] += 1
+        return {
+            "workers": len(self._workers),
+            "max_pending": self.max_pending,
+            "persistent": self._store is not None,
+            **counts
+        }
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            job = self._jobs.get(job_id)
+            if job is None or job["status"] != JOB_QUEUED:
+                continue
+
+            job["status"] = JOB_RUNNING
+            job["started_at"] = time.time()
+            self._persist(job)
+            try:
+                job["result"] = await self.handlers[job["kind"]](self._public(job), job["payload_path"])
+                job["status"] = JOB_SUCCEEDED
+            except asyncio.CancelledError:
+                # 서버 종료: 저장소가 있으면 재시작 후 다시 처리
+                job["status"] = JOB_QUEUED
+                job["started_at"] = None
+                self._persist(job)
+                raise
+            except Exception as e:
+                logger.error(f"작업 처리 중 오류 ({job_id}): {str(e)}")
+                job["status"] = JOB_FAILED
+                job["error"] = str(e)
+
+            job["finished_at"] = time.time()
+            self._remove_payload(job)
+            self._persist(job)
+            event = self._events.pop(job_id, None)
+            if event is not None:
+                event.set()
+
+    def _public(self, job: Dict[str, any]) -> Dict[str, any]:
+        """응답용 작업 상태 (내부 필드 제외)"""
+        finished_at = job["finished_at"]
+        return {
+            "job_id": job["job_id"],
+            "kind": job["kind"],
+            "status": job["status"],
+            "client_id": job["client_id"],
+            "params": job["params"],
+            "created_at": job["created_at"],
+            "started_at": job["started_at"],
+            "finished_at": finished_at,
+            "expires_at": finished_at + self.result_ttl_seconds if finished_at else None,
+            "result": job["result"],
+            "error": job["error"]
+        }
+
+    def _evict_expired(self) -> None:
+        """결과 보관 기간이 지난 작업을 지웁니다."""
+        cutoff = time.time() - self.result_ttl_seconds
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job["finished_at"] is not None and job["finished_at"] < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
+        if expired and self._store is not None:
+            self._store.executemany("DELETE FROM jobs WHERE job_id = ?", [(job_id,) for job_id in expired])
+            self._store.commit()
+
+    def _remove_payload(self, job: Dict[str, any]) -> None:
+        try:
+            os.unlink(job["payload_path"])
+        except OSError:
+            pass
+
+    def _persist(self, job: Dict[str, any]) -> None:
+        if self._store is None:
+            return
+        self._store.execute(
+            "INSERT OR REPLACE INTO jobs (job_id, state, updated_at) VALUES (?, ?, ?)",
+            (job["job_id"], json.dumps(job, ensure_ascii=False, default=str), time.time())
+        )
+        self._store.commit()
+
+    def _restore(self) -> int:
+        """저장소의 작업을 불러오고, 미완료 작업은 입력 파일이 남아 있으면 다시 대기열에 넣습니다."""
+        if self._store is None:
+            return 0
+
+        rows = self._store.execute("SELECT state FROM jobs ORDER BY updated_at").fetchall()
+        requeued = 0
+        for (state,) in rows:
+            job = json.loads(state)
+            if job["status"] not in FINISHED_STATES:
+                if os.path.exists(job["payload_path"]):
+                    job["status"] = JOB_QUEUED
+                    job["started_at"] = None
+                    self._queue.put_nowait(job["job_id"])
+                    requeued += 1
+                else:
+                    job["status"] = JOB_FAILED
+                    job["error"] = "서버 재시작 중 입력 파일이 사라졌습니다"
+                    job["finished_at"] = time.time()
+                    self._persist(job)
+            self._jobs[job["job_id"]] = job
+        self._evict_expired()
+        return requeued
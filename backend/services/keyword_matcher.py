@@ -0,0 +1,107 @@
+"""
+키워드 매칭 서비스
+정규화된 키워드 전체를 하나의 트라이 정규식으로 컴파일해 텍스트를 한 번만 훑습니다.
+토큰을 붙여 쓴 압축 텍스트에서는 키워드가 원래 띄어 쓴 자리에서만 토큰 경계를 넘을 수 있습니다
+("계좌 이체"는 "계좌 이체"/"계좌이체"에 매칭되지만 "이체"는 "우리 이 체육관"에 매칭되지 않음).
+"""
+
+import re
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+
+class KeywordMatcher:
+    """
+    키워드 매처 클래스
+    각 위치에서 가장 긴 키워드를 찾고, 그 키워드의 접두사인 짧은 키워드는
+    미리 계산한 표로 함께 보고하므로 겹치는 키워드도 모두 찾습니다.
+    """
+
+    def __init__(self, terms: Iterable[str], splits: Optional[Mapping[str, Iterable[int]]] = None):
+        """
+        매처 초기화
+
+        Args:
+            terms: 매칭할 (정규화된) 키워드 목록
+            splits: 키워드별로 토큰 경계를 넘을 수 있는 키워드 안 위치 (원래 키워드에서 띄어 쓴 자리)
+        """
+        self.terms = sorted({term for term in terms if term})
+        self.splits: Dict[str, Tuple[int, ...]] = {
+            term: tuple(sorted(set(positions))) for term, positions in (splits or {}).items() if positions
+        }
+
+        # 키워드별로 자신의 접두사인 다른 키워드 목록을 미리 계산
+        term_set = set(self.terms)
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            term: tuple(term[:length] for length in range(len(term) - 1, 0, -1)
+                        if term[:length] in term_set)
+            for term in self.terms
+        }
+
+        trie: Dict[str, dict] = {}
+        for term in self.terms:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        # 전방 탐색(lookahead)으로 감싸 겹치는 위치에서도 매칭되도록 하고,
+        # 키워드 첫 글자 집합으로 시작 위치를 먼저 걸러 불필요한 시도를 줄입니다
+        self.pattern = self._trie_to_regex(trie)
+        first_chars = "".join(sorted({term[0] for term in self.terms}))
+        self._regex = (
+            re.compile(f"(?=[{re.escape(first_chars)}])(?=({self.pattern}))")
+            if self.terms else None
+        )
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def scan(self, text: str, boundaries: Sequence[int] = ()) -> List[Tuple[str, int]]:
+        """
+        텍스트에서 모든 키워드 출현 위치를 찾습니다.
+
+        Args:
+            text: 정규화된 텍스트
+            boundaries: 붙여 쓴 토큰 경계 위치 (오름차순, NormalizedText.boundaries)
+
+        Returns:
+            List[Tuple[str, int]]: (키워드, 시작 위치) 목록 (위치 순)
+        """
+        if self._regex is None:
+            return []
+
+        matches = []
+        for match in self._regex.finditer(text):
+            term = match.group(1)
+            start = match.start()
+            # 가장 긴 키워드가 경계를 넘어 제외되어도 접두사 키워드는 따로 확인
+            for candidate in (term, *self._prefixes[term]):
+                if not boundaries or self._respects_boundaries(candidate, start, boundaries):
+                    matches.append((candidate, start))
+        return matches
+
+    def _respects_boundaries(self, term: str, start: int, boundaries: Sequence[int]) -> bool:
+        """키워드가 넘는 토큰 경계가 모두 원래 키워드에서 띄어 쓴 자리인지 여부"""
+        index = bisect_right(boundaries, start)
+        end = start + len(term)
+        allowed = self.splits.get(term, ())
+        while index < len(boundaries) and boundaries[index] < end:
+            if boundaries[index] - start not in allowed:
+                return False
+            index += 1
+        return True
+
+    def _trie_to_regex(self, node: Dict[str, dict]) -> str:
+        """트라이를 정규식으로 변환합니다 (긴 키워드를 먼저 시도하도록 탐욕적 선택)."""
+        branches = [
+            re.escape(char) + self._trie_to_regex(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ""
+
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return f"(?:{body})?"
+        return body
@@ -0,0 +1,201 @@
+"""
+언어 팩 서비스
+언어별 키워드/패턴 단어/사기 대본 묶음(언어 팩)을 언어마다 한 번만 컴파일한 탐지기로 유지하고,
+요청에 지정된 언어 또는 텍스트의 문자 체계로 탐지기를 고릅니다.
+
+- 기본 언어(한국어) 탐지기는 항상 메모리에 둡니다.
+- 다른 언어 팩은 처음 요청될 때 JSON 파일에서 읽어 컴파일하고, 최근에 쓴 max_resident개만 유지합니다(LRU).
+- 팩 파일 형식은 FraudDetector의 language_pack 인자와 같습니다
+  (language, speech_language, normalizer, fraud_keywords, pattern_words, known_scripts, 선택: scoring_weights).
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from loguru import logger
+
+from services.fraud_detector import DEFAULT_LANGUAGE
+
+
+# 기본 언어 팩 디렉터리 (backend/language_packs)
+BUILTIN_PACK_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "language_packs")
+
+# 기본 언어의 음성 인식 언어 코드
+DEFAULT_SPEECH_LANGUAGE = "ko-KR"
+
+# 자동 감지 요청 값
+AUTO = "auto"
+
+
+class LanguagePackNotFound(Exception):
+    """지원하지 않는 언어"""
+
+
+def detect_language(text: str) -> str:
+    """
+    문자 체계로 텍스트의 언어를 추정합니다 (한글 → ko, 한자만 있으면 zh, 로마자 → en).
+    가장 많이 쓰인 문자 체계를 고르며, 글자가 없으면 기본 언어입니다.
+
+    Args:
+        text: 텍스트
+
+    Returns:
+        str: 언어 코드
+    """
+    hangul = han = latin = 0
+    for char in text:
+        code = ord(char)
+        if 0xAC00 <= code <= 0xD7A3 or 0x1100 <= code <= 0x11FF or 0x3130 <= code <= 0x318F:
+            hangul += 1
+        elif 0x4E00 <= code <= 0x9FFF or 0x3400 <= code <= 0x4DBF:
+            han += 1
+        elif ("a" <= char <= "z") or ("A" <= char <= "Z"):
+            latin += 1
+
+    if hangul and hangul >= han and hangul * 2 >= latin:
+        return "ko"
+    if han and han * 2 >= latin:
+        return "zh"
+    if latin:
+        return "en"
+    return DEFAULT_LANGUAGE
+
+
+class LanguagePacks:
+    """
+    언어 팩 관리 클래스
+    언어 코드 → 탐지기 LRU를 두고, 같은 언어의 탐지기는 동시에 요청되어도 한 번만 만듭니다.
+    """
+
+    def __init__(self, default_detector, detector_factory: Callable[[Dict[str, any]], any],
+                 pack_dir: str = "", max_resident: int = 2):
+        """
+        언어 팩 관리자 초기화 (팩 파일 목록만 확인하고 컴파일은 처음 요청될 때 수행)
+
+        Args:
+            default_detector: 기본 언어 탐지기 (항상 유지)
+            detector_factory: 언어 팩으로 탐지기를 만드는 함수
+            pack_dir: 언어 팩 JSON 디렉터리 (비어 있으면 기본 언어 팩 디렉터리)
+            max_resident: 기본 언어 외에 메모리에 유지할 최대 탐지기 수
+        """
+        self.default_detector = default_detector
+        self.default_language = default_detector.language
+        self.detector_factory = detector_factory
+        self.max_resident = max(max_resident, 1)
+        self.pack_dir = pack_dir or BUILTIN_PACK_DIR
+        self._paths = self._find_packs(self.pack_dir)
+        self._resident: "OrderedDict[str, any]" = OrderedDict()
+        self._speech_languages: Dict[str, str] = {self.default_language: DEFAULT_SPEECH_LANGUAGE}
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.evictions = 0
+
+    @property
+    def languages(self) -> List[str]:
+        """지원 언어 목록"""
+        return sorted({self.default_language, *self._paths})
+
+    def resolve(self, language: Optional[str], text: str = "") -> str:
+        """
+        요청 언어를 언어 코드로 정합니다 ("en-US" → "en", 비어 있거나 auto면 텍스트로 감지).
+
+        Args:
+            language: 요청 언어 (없으면 자동 감지)
+            text: 자동 감지에 사용할 텍스트 (없으면 기본 언어)
+
+        Returns:
+            str: 언어 코드
+
+        Raises:
+            LanguagePackNotFound: 지원하지 않는 언어인 경우
+        """
+        if not language or language.lower() == AUTO:
+            if not text:
+                return self.default_language
+            detected = detect_language(text)
+            return detected if detected in self.languages else self.default_language
+
+        code = language.lower().replace("_", "-").split("-")[0]
+        if code not in self.languages:
+            raise LanguagePackNotFound(
+                f"지원하지 않는 언어입니다: {language} (지원 언어: {', '.join(self.languages)})"
+            )
+        return code
+
+    def detector(self, language: str):
+        """
+        언어의 탐지기를 반환합니다 (처음 요청되면 컴파일하고, 넘치면 가장 오래 쓰지 않은 탐지기를 내림).
+
+        Args:
+            language: 언어 코드 (resolve 결과)
+        """
+        if language == self.default_language:
+            return self.default_detector
+
+        with self._lock:
+            detector = self._resident.get(language)
+            if detector is not None:
+                self._resident.move_to_end(language)
+                return detector
+
+            pack = self._read_pack(language)
+            detector = self.detector_factory(pack)
+            self.loads += 1
+            self._resident[language] = detector
+            while len(self._resident) > self.max_resident:
+                evicted, _ = self._resident.popitem(last=False)
+                self.evictions += 1
+                logger.info(f"언어 팩을 메모리에서 내렸습니다: {evicted}")
+            logger.info(f"언어 팩을 불러왔습니다: {language}")
+            return detector
+
+    def speech_language(self, language: str) -> str:
+        """
+        언어의 음성 인식 언어 코드 (예: ko → ko-KR)
+
+        Args:
+            language: 언어 코드 (resolve 결과)
+        """
+        speech_language = self._speech_languages.get(language)
+        if speech_language is None:
+            # 탐지기를 만들지 않고 팩 파일에서 인식 언어만 읽음
+            speech_language = self._read_pack(language).get("speech_language", language)
+            self._speech_languages[language] = speech_language
+        return speech_language
+
+    def status(self) -> Dict[str, any]:
+        """지원 언어와 메모리에 있는 언어 팩"""
+        with self._lock:
+            resident = list(self._resident)
+        return {
+            "languages": self.languages,
+            "default": self.default_language,
+            "resident": [self.default_language, *resident],
+            "max_resident": self.max_resident,
+            "loads": self.loads,
+            "evictions": self.evictions
+        }
+
+    def _read_pack(self, language: str) -> Dict[str, any]:
+        path = self._paths.get(language)
+        if path is None:
+            raise LanguagePackNotFound(f"지원하지 않는 언어입니다: {language}")
+        with open(path, encoding="utf-8") as pack_file:
+            pack = json.load(pack_file)
+        pack.setdefault("language", language)
+        return pack
+
+    def _find_packs(self, pack_dir: str) -> Dict[str, str]:
+        """언어 코드 → 팩 파일 경로 (파일 이름이 언어 코드, 기본 언어 파일은 무시)"""
+        if not os.path.isdir(pack_dir):
+            logger.warning(f"언어 팩 디렉터리가 없습니다: {pack_dir}")
+            return {}
+        paths = {}
+        for name in sorted(os.listdir(pack_dir)):
+            code, extension = os.path.splitext(name)
+            if extension == ".json" and code != self.default_language:
+                paths[code.lower()] = os.path.join(pack_dir, name)
+        return paths
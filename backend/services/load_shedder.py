@@ -0,0 +1,79 @@
+"""
+부하 차단(load shedding) 서비스
+처리 중인 요청과 워커 대기열이 한도를 넘으면 새 요청을 기다리게 하지 않고 즉시 거절합니다.
+"""
+
+import threading
+from typing import Callable, Dict
+
+
+class LoadShedder:
+    """
+    부하 차단기 클래스
+    요청 수락 여부는 처리 중 요청 수와 등록된 대기열 깊이(워커 풀 등)로 판단합니다.
+    """
+
+    def __init__(self, max_in_flight: int, max_queue_depth: int):
+        """
+        부하 차단기 초기화
+
+        Args:
+            max_in_flight: 동시에 처리할 최대 분석 요청 수
+            max_queue_depth: 허용할 최대 대기열 깊이 (등록된 대기열의 합)
+        """
+        self.max_in_flight = max_in_flight
+        self.max_queue_depth = max_queue_depth
+        self.in_flight = 0
+        self.shed_count = 0
+        self._lock = threading.Lock()
+        self._queue_sources: Dict[str, Callable[[], int]] = {}
+
+    def register_queue(self, name: str, depth: Callable[[], int]) -> None:
+        """
+        대기열 깊이를 알려주는 함수를 등록합니다.
+
+        Args:
+            name: 대기열 이름
+            depth: 현재 대기열 깊이를 반환하는 함수
+        """
+        self._queue_sources[name] = depth
+
+    def queue_depths(self) -> Dict[str, int]:
+        """등록된 대기열별 깊이"""
+        return {name: depth() for name, depth in self._queue_sources.items()}
+
+    def is_saturated(self) -> bool:
+        """처리 한도를 넘었는지 여부"""
+        return (self.in_flight >= self.max_in_flight
+                or sum(self.queue_depths().values()) >= self.max_queue_depth)
+
+    def try_acquire(self) -> bool:
+        """
+        요청 하나를 수락합니다.
+
+        Returns:
+            bool: 수락 여부 (거절된 경우 release를 호출하지 않음)
+        """
+        with self._lock:
+            if self.is_saturated():
+                self.shed_count += 1
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self) -> None:
+        """수락했던 요청의 처리가 끝났음을 알립니다."""
+        with self._lock:
+            self.in_flight -= 1
+
+    def status(self) -> Dict[str, any]:
+        """현재 부하 상태"""
+        queues = self.queue_depths()
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "queue_depths": queues,
+            "max_queue_depth": self.max_queue_depth,
+            "shed_requests": self.shed_count,
+            "saturated": self.is_saturated()
+        }
@@ -0,0 +1,74 @@
+"""
+안내 문구 서비스
+권장사항과 최종 판정 문구를 ID로 관리합니다. 응답에는 문구 대신 ID만 보낼 수 있고,
+클라이언트는 GET /api/voice/messages로 문구 목록을 한 번 받아 캐시합니다.
+"""
+
+import hashlib
+import json
+from typing import Dict, List, Optional
+
+
+# 권장사항 (ID → 문구, {title}은 알려진 사기 대본 제목)
+RECOMMENDATIONS: Dict[str, str] = {
+    "end_call": "⚠️ 즉시 통화를 종료하세요",
+    "protect_personal_info": "🚨 절대 개인정보를 제공하지 마세요",
+    "verify_by_phone": "📞 해당 기관에 직접 전화로 확인하세요",
+    "financial_caution": "💳 금융 정보 요청 시 의심하세요",
+    "contact_bank": "🏦 은행에 직접 문의하세요",
+    "impersonation_suspected": "🏛️ 공공기관 사칭 의심",
+    "verify_official_channel": "✅ 공식 채널로 확인하세요",
+    "report_threat": "⚖️ 협박성 발언 시 신고하세요",
+    "report_hotline": "📱 112 또는 182로 신고 가능",
+    "known_script": "📋 알려진 사기 수법과 유사합니다: {title}",
+    "low_risk_caution": "✅ 현재 위험도는 낮으나 주의하세요",
+    "verify_suspicious": "🔍 의심스러운 요청 시 확인하세요",
+    "empty_text": "📝 분석할 텍스트가 없습니다"
+}
+
+# 최종 판정 (위험 등급 → 문구, {risk_score}는 위험도 점수)
+VERDICTS: Dict[str, str] = {
+    "VERY_HIGH": "🚨 매우 위험! 사기 전화로 의심됩니다. (위험도: {risk_score:.1f}/10)",
+    "HIGH": "⚠️ 위험! 사기 전화일 가능성이 높습니다. (위험도: {risk_score:.1f}/10)",
+    "MEDIUM": "🔍 주의! 의심스러운 내용이 포함되어 있습니다. (위험도: {risk_score:.1f}/10)",
+    "LOW": "✅ 비교적 안전하나 주의가 필요합니다. (위험도: {risk_score:.1f}/10)",
+    "VERY_LOW": "✅ 안전한 통화로 판단됩니다. (위험도: {risk_score:.1f}/10)"
+}
+
+UNKNOWN_VERDICT = "분석 결과: {risk_level} (위험도: {risk_score:.1f}/10)"
+
+# 문구 목록이 바뀌면 달라지는 버전 (클라이언트 캐시 확인용)
+CATALOG_VERSION = hashlib.sha1(
+    json.dumps([RECOMMENDATIONS, VERDICTS], ensure_ascii=False, sort_keys=True).encode("utf-8")
+).hexdigest()[:12]
+
+
+def render_recommendations(recommendation_ids: List[str],
+                           script_match: Optional[Dict[str, any]] = None) -> List[str]:
+    """
+    권장사항 ID 목록을 문구로 바꿉니다.
+
+    Args:
+        recommendation_ids: 권장사항 ID 목록
+        script_match: 알려진 사기 대본 유사도 조회 결과 (known_script 문구에 사용)
+
+    Returns:
+        List[str]: 권장사항 문구 목록
+    """
+    title = script_match["title"] if script_match else ""
+    return [RECOMMENDATIONS[recommendation_id].format(title=title) for recommendation_id in recommendation_ids]
+
+
+def render_verdict(risk_level: str, risk_score: float) -> str:
+    """위험 등급과 점수로 최종 판정 문구를 만듭니다."""
+    template = VERDICTS.get(risk_level, UNKNOWN_VERDICT)
+    return template.format(risk_level=risk_level, risk_score=risk_score)
+
+
+def message_catalog() -> Dict[str, any]:
+    """클라이언트에 보낼 문구 목록"""
+    return {
+        "version": CATALOG_VERSION,
+        "recommendations": RECOMMENDATIONS,
+        "verdicts": VERDICTS
+    }
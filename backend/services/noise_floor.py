@@ -0,0 +1,221 @@
+"""
+배경 소음 보정 서비스
+인식용으로 이미 디코딩한 샘플에서 프레임 에너지를 계산해 배경 소음 수준을 추정합니다.
+통화 세션처럼 같은 출처의 음성이 나누어 들어오면 이전 조각의 추정값을 이어 사용합니다.
+
+speech_recognition의 adjust_for_ambient_noise는 파일 앞 1초를 읽어 버리고(그 구간의 말이 빠짐)
+공유 Recognizer의 energy_threshold를 바꾸므로 사용하지 않습니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+FRAME_SECONDS = 0.02
+
+# 프레임 에너지 하위 분위수를 소음 수준으로 사용 (말 사이 쉬는 구간)
+NOISE_PERCENTILE = 10
+
+# 소음 수준 대비 이 배수를 넘는 프레임을 말소리로 봄 (speech_recognition dynamic_energy_ratio와 같은 값)
+ENERGY_RATIO = 1.5
+
+# 에너지 최소 임계값 (16bit RMS, 디지털 무음 대비)
+MIN_ENERGY_THRESHOLD = 30.0
+
+
+def frame_energies(signal: np.ndarray, sample_rate: int) -> np.ndarray:
+    """
+    프레임별 RMS 에너지를 계산합니다 (16bit 정수 단위, speech_recognition energy_threshold와 같은 척도).
+
+    Args:
+        signal: 모노 신호 (-1.0 - 1.0)
+        sample_rate: 샘플레이트
+
+    Returns:
+        np.ndarray: 프레임별 RMS
+    """
+    frame_length = max(int(sample_rate * FRAME_SECONDS), 1)
+    frame_count = len(signal) // frame_length
+    if frame_count == 0:
+        return np.sqrt(np.mean(np.square(signal, dtype=np.float64), keepdims=True)) * 32768.0
+    frames = signal[:frame_count * frame_length].reshape(frame_count, frame_length)
+    return np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1)) * 32768.0
+
+
+def estimate_noise_floor(energies: np.ndarray) -> float:
+    """프레임 에너지에서 배경 소음 수준을 추정합니다."""
+    if len(energies) == 0:
+        return 0.0
+    return float(np.percentile(energies, NOISE_PERCENTILE))
+
+
+class NoiseCalibrationCache:
+    """
+    출처별 소음 보정 캐시 클래스
+    통화 ID 등 출처별로 소음 수준을 보관합니다. 새 조각의 소음이 더 낮으면 바로 따라가고,
+    더 높으면 천천히 따라가 말이 계속 이어지는 조각 때문에 소음 수준이 올라가지 않게 합니다.
+    """
+
+    def __init__(self, max_sources: int = 10000, ttl_seconds: float = 1800.0, rise_rate: float = 0.2):
+        """
+        캐시 초기화
+
+        Args:
+            max_sources: 보관할 최대 출처 수 (오래 사용하지 않은 출처부터 제거)
+            ttl_seconds: 마지막 사용 후 보관 시간 (초)
+            rise_rate: 소음 수준이 올라갈 때 새 추정값을 반영하는 비율
+        """
+        self.max_sources = max_sources
+        self.ttl_seconds = ttl_seconds
+        self.rise_rate = rise_rate
+        self._lock = threading.Lock()
+        # 출처 → (소음 수준, 조각 수, 마지막 사용 시각)
+        self._sources: "OrderedDict[str, Tuple[float, int, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def update(self, source_id: str, noise_floor: float) -> Tuple[float, int]:
+        """
+        출처의 소음 수준을 새 추정값으로 갱신합니다.
+
+        Args:
+            source_id: 출처 ID
+            noise_floor: 이번 조각의 소음 수준 추정값
+
+        Returns:
+            Tuple: (보정된 소음 수준, 지금까지의 조각 수)
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            previous = self._sources.pop(source_id, None)
+            if previous is None:
+                calibrated, chunks = noise_floor, 1
+            else:
+                floor, chunks = previous[0], previous[1] + 1
+                calibrated = noise_floor if noise_floor < floor else floor + self.rise_rate * (noise_floor - floor)
+            self._sources[source_id] = (calibrated, chunks, now)
+            return calibrated, chunks
+
+    def peek(self, source_id: str) -> Optional[float]:
+        """출처의 현재 소음 수준 (갱신하지 않음, 없으면 None)"""
+        with self._lock:
+            entry = self._sources.get(source_id)
+            return entry[0] if entry is not None else None
+
+    def forget(self, source_id: str) -> None:
+        """출처의 보정값을 지웁니다 (통화 종료 시)."""
+        with self._lock:
+            self._sources.pop(source_id, None)
+
+    def _evict(self, now: float) -> None:
+        cutoff = now - self.ttl_seconds
+        while self._sources:
+            oldest_id, (_, _, last_used) = next(iter(self._sources.items()))
+            if last_used >= cutoff and len(self._sources) < self.max_sources:
+                break
+            del self._sources[oldest_id]
+
+
+class StreamingVad:
+    """
+    블록 단위 말소리 감지 클래스
+    최근 구간의 프레임 에너지로 소음 수준을 계속 추정하며 프레임별 말소리 여부를 판단합니다.
+    전체 구간의 소음 수준은 로그 눈금 히스토그램으로 누적해 음성 길이와 무관한 메모리로 계산합니다.
+    """
+
+    # 소음 수준 추정에 쓰는 최근 프레임 수 (5초)
+    RECENT_FRAMES = 250
+    # 최근 프레임이 이보다 적으면 초기값(캐시된 소음 수준) 사용
+    MIN_RECENT_FRAMES = 10
+    # 히스토그램 구간 (16bit RMS 1 - 32768, 로그 눈금)
+    _BINS = np.concatenate([[0.0], np.geomspace(1.0, 32768.0, 256)])
+
+    def __init__(self, sample_rate: int, initial_floor: Optional[float] = None):
+        """
+        말소리 감지 초기화
+
+        Args:
+            sample_rate: 샘플레이트
+            initial_floor: 초기 소음 수준 (같은 출처의 이전 조각 보정값)
+        """
+        self.sample_rate = sample_rate
+        self.frame_length = max(int(sample_rate * FRAME_SECONDS), 1)
+        self.initial_floor = initial_floor
+        self.frames = 0
+        self.speech_frames = 0
+        self._recent: "deque[float]" = deque(maxlen=self.RECENT_FRAMES)
+        self._histogram = np.zeros(len(self._BINS) - 1, dtype=np.int64)
+        self._pending = np.zeros(0, dtype=np.float32)
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """
+        신호 블록의 프레임별 말소리 여부를 판단합니다 (프레임 길이에 못 미치는 끝부분은 다음 블록과 합침).
+
+        Args:
+            block: 모노 신호 블록 (-1.0 - 1.0)
+
+        Returns:
+            np.ndarray: 프레임별 말소리 여부
+        """
+        signal = np.concatenate([self._pending, block]) if len(self._pending) else block
+        frame_count = len(signal) // self.frame_length
+        self._pending = signal[frame_count * self.frame_length:]
+        if frame_count == 0:
+            return np.zeros(0, dtype=bool)
+
+        energies = frame_energies(signal[:frame_count * self.frame_length], self.sample_rate)
+        self._recent.extend(energies.tolist())
+        self._histogram += np.histogram(np.clip(energies, 0.0, 32768.0), self._BINS)[0]
+
+        speech = energies > self.threshold
+        self.frames += frame_count
+        self.speech_frames += int(np.count_nonzero(speech))
+        return speech
+
+    @property
+    def noise_floor(self) -> float:
+        """최근 구간의 소음 수준"""
+        if len(self._recent) < self.MIN_RECENT_FRAMES:
+            if self.initial_floor is not None:
+                return self.initial_floor
+            if not self._recent:
+                return 0.0
+        return estimate_noise_floor(np.fromiter(self._recent, dtype=np.float64))
+
+    @property
+    def threshold(self) -> float:
+        return max(self.noise_floor * ENERGY_RATIO, MIN_ENERGY_THRESHOLD)
+
+    def overall_noise_floor(self) -> float:
+        """전체 구간의 소음 수준 (히스토그램 분위수, 구간 상한값)"""
+        total = int(self._histogram.sum())
+        if total == 0:
+            return self.initial_floor or 0.0
+        rank = np.searchsorted(np.cumsum(self._histogram), total * NOISE_PERCENTILE / 100.0)
+        return float(self._BINS[rank + 1])
+
+    def summary(self, cache: Optional[NoiseCalibrationCache] = None,
+                source_id: Optional[str] = None) -> Dict[str, any]:
+        """
+        소음 보정 결과 (출처가 있으면 캐시에 반영)
+
+        Returns:
+            Dict: 소음 수준, 에너지 임계값, 말소리 프레임 비율, 말소리 여부, 누적 조각 수
+        """
+        noise_floor = self.overall_noise_floor()
+        chunks = 1
+        if cache is not None and source_id:
+            noise_floor, chunks = cache.update(source_id, noise_floor)
+        return {
+            "noise_floor": round(noise_floor, 1),
+            "energy_threshold": round(max(noise_floor * ENERGY_RATIO, MIN_ENERGY_THRESHOLD), 1),
+            "speech_frame_ratio": round(self.speech_frames / self.frames, 3) if self.frames else 0.0,
+            "speech_detected": self.speech_frames > 0,
+            "calibrated_chunks": chunks
+        }
@@ -0,0 +1,77 @@
+"""
+근접 동시 등장 서비스
+"검찰 ... 이체"처럼 여러 특징이 일정 글자 수 구간 안에 함께 등장했는지를
+매칭 위치를 한 번 훑으면서 판단합니다 (매칭 수에 선형).
+"""
+
+from typing import Dict, List, Sequence, Set, Tuple
+
+
+# (특징 이름 목록, 최대 구간 길이)
+ProximityGroup = Tuple[Tuple[str, ...], int]
+
+
+class ProximityTracker:
+    """
+    근접 동시 등장 추적기 클래스
+    특징별 가장 최근 등장 위치만 보관하는 슬라이딩 윈도우로, 매칭을 위치 순서대로 넣으면
+    새 매칭으로 끝나는 구간에 그룹의 모든 특징이 들어오는지 바로 확인합니다.
+    상태가 작아 통화 세션처럼 텍스트가 나누어 들어오는 경우에도 이어서 사용할 수 있습니다.
+    """
+
+    def __init__(self, groups: Sequence[ProximityGroup]):
+        """
+        추적기 초기화
+
+        Args:
+            groups: 확인할 그룹 목록 (특징 이름 목록, 최대 구간 길이)
+        """
+        self.groups = list(groups)
+        self.satisfied: Set[int] = set()
+        self._latest: Dict[str, Tuple[int, int]] = {}
+
+        # 특징별로 확인할 그룹 (등장한 특징이 속한 그룹만 확인)
+        self._groups_by_feature: Dict[str, List[int]] = {}
+        for index, (features, _) in enumerate(self.groups):
+            for feature in set(features):
+                self._groups_by_feature.setdefault(feature, []).append(index)
+
+    def feed(self, feature: str, start: int, end: int) -> None:
+        """
+        매칭 하나를 추가합니다 (시작 위치가 줄어들지 않는 순서로 호출).
+
+        Args:
+            feature: 특징 이름
+            start: 시작 위치
+            end: 끝 위치
+        """
+        group_indexes = self._groups_by_feature.get(feature)
+        if group_indexes is None:
+            return
+
+        self._latest[feature] = (start, end)
+        for index in group_indexes:
+            if index in self.satisfied:
+                continue
+            features, distance = self.groups[index]
+            spans = [self._latest.get(name) for name in features]
+            if None in spans:
+                continue
+            # 각 특징의 가장 최근 등장 위치가 구간 왼쪽 끝을 가장 오른쪽으로 당김
+            if max(span_end for _, span_end in spans) - min(span_start for span_start, _ in spans) <= distance:
+                self.satisfied.add(index)
+
+    def to_state(self) -> Dict[str, any]:
+        """저장용 상태 (JSON 직렬화 가능)"""
+        return {
+            "latest": {feature: list(span) for feature, span in self._latest.items()},
+            "satisfied": sorted(self.satisfied)
+        }
+
+    @classmethod
+    def from_state(cls, groups: Sequence[ProximityGroup], state: Dict[str, any]) -> "ProximityTracker":
+        """저장된 상태에서 추적기를 복원합니다."""
+        tracker = cls(groups)
+        tracker._latest = {feature: tuple(span) for feature, span in state.get("latest", {}).items()}
+        tracker.satisfied = {index for index in state.get("satisfied", ()) if index < len(tracker.groups)}
+        return tracker
@@ -0,0 +1,266 @@
+"""
+클라이언트별 요청 한도(rate limit) 서비스
+API 키(또는 클라이언트 ID)별 토큰 버킷으로 한 연동처가 음성 인식 용량을 독점하지 못하게 합니다.
+
+- 자원별로 단위가 다릅니다: text는 요청 1건, audio는 음성 길이(초).
+- 음성 길이는 디코딩 후에야 알 수 있으므로, 요청을 받을 때 업로드 크기로 어림한 길이를 먼저 차감(예약)하고
+  인식 후 실제 길이와의 차이를 정산합니다 (잔여량이 음수가 되면 다시 채워질 때까지 거절).
+- 기본 저장소는 numpy 배열(클라이언트당 한 행)이고, 저장소 경로를 지정하면 SQLite 파일로
+  여러 서버 프로세스가 같은 버킷을 공유합니다.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+RESOURCES = ("text", "audio")
+
+
+class MemoryBucketStore:
+    """
+    메모리 버킷 저장소
+    클라이언트 키 → 행 번호 사전과 [클라이언트 수, 자원 수] 배열로 잔여량/사용량을 보관합니다.
+    가득 차면 가장 오래 사용하지 않은 행을 재사용합니다.
+    """
+
+    def __init__(self, max_clients: int):
+        self.max_clients = max(max_clients, 1)
+        self._index: Dict[str, int] = {}
+        self._keys: List[Optional[str]] = [None] * self.max_clients
+        self._tokens = np.zeros((self.max_clients, len(RESOURCES)))
+        self._updated = np.full(self.max_clients, -np.inf)
+        self._usage = np.zeros((self.max_clients, len(RESOURCES)))
+        self._rejected = np.zeros((self.max_clients, len(RESOURCES)), dtype=np.int64)
+
+    def take(self, key: str, resource: int, cost: float, rates: np.ndarray, bursts: np.ndarray,
+             now: float, check: bool) -> Tuple[bool, float]:
+        row = self._row(key, bursts, now)
+        tokens = np.minimum(bursts, self._tokens[row] + (now - self._updated[row]) * rates)
+        self._updated[row] = now
+
+        allowed = not check or (tokens[resource] >= cost and tokens[resource] > 0)
+        if allowed:
+            tokens[resource] -= cost
+            self._usage[row, resource] += cost
+        else:
+            self._rejected[row, resource] += 1
+        self._tokens[row] = tokens
+        return allowed, float(tokens[resource])
+
+    def usage(self) -> Dict[str, Tuple[List[float], List[int]]]:
+        return {key: (self._usage[row].tolist(), self._rejected[row].tolist())
+                for key, row in self._index.items()}
+
+    def close(self) -> None:
+        pass
+
+    def _row(self, key: str, bursts: np.ndarray, now: float) -> int:
+        row = self._index.get(key)
+        if row is not None:
+            return row
+
+        row = int(np.argmin(self._updated))
+        previous = self._keys[row]
+        if previous is not None:
+            del self._index[previous]
+        self._index[key] = row
+        self._keys[row] = key
+        self._tokens[row] = bursts
+        self._updated[row] = now
+        self._usage[row] = 0
+        self._rejected[row] = 0
+        return row
+
+
+class SqliteBucketStore:
+    """
+    SQLite 버킷 저장소
+    한 클라이언트의 잔여량/사용량을 한 행에 두고, 차감은 쓰기 트랜잭션 안에서 읽고 씁니다
+    (같은 파일을 여는 여러 프로세스가 같은 한도를 공유).
+    """
+
+    def __init__(self, path: str):
+        # 연결은 처음 사용할 때 엽니다 (모듈 로드 시점에 열면 분석 워커 fork 때 연결이 자식에게 복사됨)
+        self.path = path
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=5.0)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_buckets "
+                "(client_key TEXT PRIMARY KEY, tokens TEXT NOT NULL, updated REAL NOT NULL, "
+                "usage TEXT NOT NULL, rejected TEXT NOT NULL)"
+            )
+        return self._connection
+
+    def take(self, key: str, resource: int, cost: float, rates: np.ndarray, bursts: np.ndarray,
+             now: float, check: bool) -> Tuple[bool, float]:
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT tokens, updated, usage, rejected FROM rate_buckets WHERE client_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                tokens, usage, rejected = bursts.copy(), [0.0] * len(RESOURCES), [0] * len(RESOURCES)
+            else:
+                tokens = np.minimum(bursts, np.asarray(json.loads(row[0])) + (now - row[1]) * rates)
+                usage, rejected = json.loads(row[2]), json.loads(row[3])
+
+            allowed = not check or (tokens[resource] >= cost and tokens[resource] > 0)
+            if allowed:
+                tokens[resource] -= cost
+                usage[resource] += cost
+            else:
+                rejected[resource] += 1
+            connection.execute(
+                "INSERT OR REPLACE INTO rate_buckets VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(tokens.tolist()), now, json.dumps(usage), json.dumps(rejected))
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        return allowed, float(tokens[resource])
+
+    def usage(self) -> Dict[str, Tuple[List[float], List[int]]]:
+        rows = self.connection.execute("SELECT client_key, usage, rejected FROM rate_buckets").fetchall()
+        return {key: (json.loads(usage), json.loads(rejected)) for key, usage, rejected in rows}
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+class RateLimiter:
+    """
+    요청 한도 클래스
+    자원별 (분당 보충량, 최대 적립량)으로 클라이언트마다 토큰 버킷을 둡니다.
+    """
+
+    def __init__(self, limits: Dict[str, Tuple[float, float]], max_clients: int = 10000, store_path: str = ""):
+        """
+        요청 한도 초기화
+
+        Args:
+            limits: 자원별 (분당 보충량, 최대 적립량) - text는 요청 수, audio는 음성 초 (분당 보충량 0이면 제한 없음)
+            max_clients: 메모리 저장소에 보관할 최대 클라이언트 수
+            store_path: 여러 프로세스가 공유할 SQLite 파일 경로 (비어 있으면 메모리)
+        """
+        self.limits = {resource: limits.get(resource, (0.0, 0.0)) for resource in RESOURCES}
+        self._rates = np.array([per_minute / 60.0 for per_minute, _ in self.limits.values()])
+        self._bursts = np.array([max(burst, per_minute / 60.0) for per_minute, burst in self.limits.values()])
+        self._lock = threading.Lock()
+        self._store = SqliteBucketStore(store_path) if store_path else MemoryBucketStore(max_clients)
+
+    def is_limited(self, resource: str) -> bool:
+        """자원에 한도가 설정되어 있는지 여부"""
+        return self.limits[resource][0] > 0
+
+    def acquire(self, client_key: str, resource: str, cost: float = 1.0) -> Tuple[bool, float]:
+        """
+        요청을 받을지 판단하고, 받으면 cost만큼 차감합니다.
+        잔여량이 cost 이상이고 0보다 커야 받습니다 (cost 0이면 잔여량만 확인).
+
+        Args:
+            client_key: 클라이언트 키
+            resource: 자원 (text, audio)
+            cost: 차감량
+
+        Returns:
+            Tuple: (수락 여부, 거절 시 다시 시도할 때까지의 초)
+        """
+        if not self.is_limited(resource):
+            return True, 0.0
+        index = RESOURCES.index(resource)
+        with self._lock:
+            allowed, remaining = self._store.take(client_key, index, cost, self._rates, self._bursts,
+                                                  time.time(), check=True)
+        if allowed:
+            return True, 0.0
+        return False, (max(cost, 1e-3) - remaining) / self._rates[index]
+
+    def charge(self, client_key: str, resource: str, amount: float) -> None:
+        """
+        처리 후 실제 사용량을 차감합니다 (잔여량이 음수가 될 수 있음).
+
+        Args:
+            client_key: 클라이언트 키
+            resource: 자원 (text, audio)
+            amount: 사용량 (audio는 음성 길이 초)
+        """
+        if amount <= 0 or not self.is_limited(resource):
+            return
+        with self._lock:
+            self._store.take(client_key, RESOURCES.index(resource), amount, self._rates, self._bursts,
+                             time.time(), check=False)
+
+    def refund(self, client_key: str, resource: str, amount: float) -> None:
+        """
+        acquire로 차감했지만 처리하지 않은 요청(검증 실패, 과부하 거절 등)의 차감량을 되돌립니다.
+
+        Args:
+            client_key: 클라이언트 키
+            resource: 자원 (text, audio)
+            amount: 되돌릴 양 (acquire의 cost)
+        """
+        if amount <= 0 or not self.is_limited(resource):
+            return
+        with self._lock:
+            self._store.take(client_key, RESOURCES.index(resource), -amount, self._rates, self._bursts,
+                             time.time(), check=False)
+
+    def settle(self, client_key: str, resource: str, reserved: float, actual: float) -> None:
+        """
+        acquire로 먼저 차감한 양을 실제 사용량으로 정산합니다 (모자라면 더 차감, 남으면 되돌림).
+
+        Args:
+            client_key: 클라이언트 키
+            resource: 자원 (text, audio)
+            reserved: 먼저 차감한 양
+            actual: 실제 사용량 (audio는 음성 길이 초)
+        """
+        if actual > reserved:
+            self.charge(client_key, resource, actual - reserved)
+        else:
+            self.refund(client_key, resource, reserved - actual)
+
+    def status(self, top: int = 10) -> Dict[str, any]:
+        """
+        한도 설정과 사용량이 많은 클라이언트 목록
+
+        Args:
+            top: 반환할 클라이언트 수
+        """
+        with self._lock:
+            usage = self._store.usage()
+        audio = RESOURCES.index("audio")
+        ranked = sorted(usage.items(), key=lambda item: (item[1][0][audio], sum(item[1][0])), reverse=True)
+        return {
+            "limits": {resource: {"per_minute": per_minute, "burst": burst}
+                       for resource, (per_minute, burst) in self.limits.items()},
+            "clients": len(usage),
+            "rejected": {resource: int(sum(rejected[index] for _, rejected in usage.values()))
+                         for index, resource in enumerate(RESOURCES)},
+            "top_clients": [
+                {
+                    "client": key,
+                    "text_requests": int(used[RESOURCES.index("text")]),
+                    "audio_seconds": round(used[audio], 1),
+                    "rejected": int(sum(rejected))
+                }
+                for key, (used, rejected) in ranked[:top]
+            ]
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._store.close()
@@ -0,0 +1,272 @@
+"""
+발신자/계좌 평판 저장소
+신고된 사기 전화번호와 계좌번호를 정렬된 고정 길이 레코드 파일로 저장하고,
+블룸 필터와 mmap 이진 탐색으로 번호 하나를 수 마이크로초 안에 조회합니다.
+
+파일 구조 (리틀 엔디언):
+    헤더 (32 bytes) | 블룸 필터 비트 배열 (8바이트 단위) | 키 u64 × N (오름차순) | 신고 건수 u32 × N
+
+대량 등록:
+    python -m services.reputation_store reputation.bin --phones phones.txt --accounts accounts.csv
+"""
+
+import argparse
+import hashlib
+import math
+import mmap
+import os
+import re
+import struct
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+
+_MAGIC = b"SVGREP01"
+_HEADER = struct.Struct("<8sIQQI")
+_HEADER_SIZE = 32
+
+# 번호 종류 (같은 숫자라도 종류가 다르면 다른 키)
+KIND_PHONE = "phone"
+KIND_ACCOUNT = "account"
+
+_NON_DIGIT = re.compile(r'\D')
+
+
+def number_key(kind: str, number: str) -> int:
+    """
+    번호를 64비트 조회 키로 변환합니다 (숫자만 남긴 뒤 해시).
+
+    Args:
+        kind: 번호 종류 (phone, account)
+        number: 원본 번호 (하이픈, 점 등 포함 가능)
+
+    Returns:
+        int: 64비트 키
+    """
+    digits = _NON_DIGIT.sub("", number)
+    digest = hashlib.blake2b(f"{kind}:{digits}".encode("ascii"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _bloom_size(num_bits: int) -> int:
+    """블룸 필터 바이트 크기 (뒤따르는 키 배열 정렬을 위해 8바이트 단위)"""
+    return ((num_bits + 63) // 64) * 8
+
+
+def _bloom_positions(keys: np.ndarray, num_bits: int, num_hashes: int) -> np.ndarray:
+    """키 배열의 블룸 필터 비트 위치 (키의 상/하위 32비트로 이중 해싱)"""
+    low = keys & np.uint64(0xFFFFFFFF)
+    high = (keys >> np.uint64(32)) | np.uint64(1)
+    return np.concatenate([
+        (low + np.uint64(i) * high) % np.uint64(num_bits) for i in range(num_hashes)
+    ])
+
+
+class ReputationStore:
+    """
+    평판 저장소 클래스
+    파일을 읽기 전용 mmap으로 열어 사용하므로 여러 워커 프로세스가 같은 페이지를 공유합니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        저장소 열기
+
+        Args:
+            path: 평판 파일 경로
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, num_bits, num_hashes = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"평판 파일 형식이 올바르지 않습니다: {path}")
+
+        self.version = version
+        self.count = count
+        self._num_bits = num_bits
+        self._num_hashes = num_hashes
+        self._bloom_offset = _HEADER_SIZE
+        keys_offset = _HEADER_SIZE + _bloom_size(num_bits)
+
+        # 키와 신고 건수를 각각 연속 배열로 두어 searchsorted가 복사 없이 동작하도록 함
+        self._keys = np.frombuffer(self._mmap, dtype="<u8", count=count, offset=keys_offset)
+        self._reports = np.frombuffer(self._mmap, dtype="<u4", count=count, offset=keys_offset + count * 8)
+
+        logger.info(f"평판 저장소를 열었습니다: {path} ({count}건)")
+
+    @classmethod
+    def open_if_exists(cls, path: str) -> Optional["ReputationStore"]:
+        """파일이 있으면 저장소를 열고, 없으면 None을 반환합니다."""
+        if not path or not os.path.exists(path):
+            return None
+        return cls(path)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def lookup(self, kind: str, number: str) -> int:
+        """
+        번호의 신고 건수를 조회합니다.
+
+        Args:
+            kind: 번호 종류 (phone, account)
+            number: 조회할 번호
+
+        Returns:
+            int: 신고 건수 (등록되지 않은 번호는 0)
+        """
+        key = number_key(kind, number)
+        if not self._might_contain(key):
+            return 0
+
+        index = int(np.searchsorted(self._keys, np.uint64(key)))
+        if index < self.count and int(self._keys[index]) == key:
+            return int(self._reports[index])
+        return 0
+
+    def lookup_many(self, kind: str, numbers: Iterable[str]) -> List[Dict[str, any]]:
+        """
+        여러 번호를 조회해 신고된 번호만 반환합니다.
+
+        Returns:
+            List[Dict]: 신고된 번호 목록 (번호, 종류, 신고 건수)
+        """
+        reported = []
+        for number in numbers:
+            reports = self.lookup(kind, number)
+            if reports:
+                reported.append({"number": number, "kind": kind, "reports": reports})
+        return reported
+
+    def close(self) -> None:
+        """저장소를 닫습니다."""
+        self._keys = self._reports = None
+        self._mmap.close()
+        self._file.close()
+
+    def _might_contain(self, key: int) -> bool:
+        """블룸 필터 검사 (False면 확실히 없음)"""
+        low = key & 0xFFFFFFFF
+        high = (key >> 32) | 1
+        for i in range(self._num_hashes):
+            position = (low + i * high) % self._num_bits
+            if not self._mmap[self._bloom_offset + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+
+    @staticmethod
+    def build(path: str, entries: Iterable[Tuple[str, str, int]],
+              false_positive_rate: float = 0.01, merge_with: Optional[str] = None,
+              chunk_size: int = 1_000_000) -> int:
+        """
+        평판 파일을 만듭니다 (같은 번호의 신고 건수는 합산).
+
+        Args:
+            path: 출력 파일 경로
+            entries: (종류, 번호, 신고 건수) 목록
+            false_positive_rate: 블룸 필터 오탐률
+            merge_with: 함께 합칠 기존 평판 파일 경로
+            chunk_size: 한 번에 배열로 변환할 항목 수
+
+        Returns:
+            int: 저장된 고유 번호 수
+        """
+        key_chunks: List[np.ndarray] = []
+        report_chunks: List[np.ndarray] = []
+
+        for keys, reports in _chunked_keys(entries, chunk_size):
+            key_chunks.append(keys)
+            report_chunks.append(reports)
+
+        if merge_with:
+            existing = ReputationStore(merge_with)
+            key_chunks.append(np.array(existing._keys))
+            report_chunks.append(np.array(existing._reports))
+            existing.close()
+
+        all_keys = np.concatenate(key_chunks) if key_chunks else np.zeros(0, dtype=np.uint64)
+        all_reports = np.concatenate(report_chunks) if report_chunks else np.zeros(0, dtype=np.uint32)
+
+        # 정렬 후 같은 키의 신고 건수 합산
+        unique_keys, inverse = np.unique(all_keys, return_inverse=True)
+        summed = np.bincount(inverse, weights=all_reports, minlength=len(unique_keys))
+        unique_reports = np.minimum(summed, np.iinfo(np.uint32).max).astype(np.uint32)
+
+        count = len(unique_keys)
+        num_bits = max(64, int(-count * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        num_hashes = max(1, round(num_bits / max(count, 1) * math.log(2)))
+
+        bits = np.zeros(num_bits, dtype=bool)
+        if count:
+            bits[_bloom_positions(unique_keys, num_bits, num_hashes)] = True
+        bloom = np.packbits(bits, bitorder="little").tobytes().ljust(_bloom_size(num_bits), b"\0")
+
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as output:
+            output.write(_HEADER.pack(_MAGIC, 1, count, num_bits, num_hashes).ljust(_HEADER_SIZE, b"\0"))
+            output.write(bloom)
+            output.write(unique_keys.astype("<u8").tobytes())
+            output.write(unique_reports.astype("<u4").tobytes())
+        os.replace(temp_path, path)
+
+        logger.info(f"평판 파일을 생성했습니다: {path} ({count}건, 블룸 {num_bits}비트/{num_hashes}해시)")
+        return count
+
+
+def _chunked_keys(entries: Iterable[Tuple[str, str, int]],
+                  chunk_size: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """항목을 일정 개수씩 키/신고 건수 배열로 변환합니다."""
+    keys: List[int] = []
+    reports: List[int] = []
+    for kind, number, count in entries:
+        keys.append(number_key(kind, number))
+        reports.append(count)
+        if len(keys) >= chunk_size:
+            yield np.array(keys, dtype=np.uint64), np.array(reports, dtype=np.uint32)
+            keys, reports = [], []
+    if keys:
+        yield np.array(keys, dtype=np.uint64), np.array(reports, dtype=np.uint32)
+
+
+def read_blocklist(path: str, kind: str) -> Iterator[Tuple[str, str, int]]:
+    """
+    블록리스트 파일을 읽습니다.
+    한 줄에 "번호" 또는 "번호,신고건수" 형식이며 '#'으로 시작하는 줄은 무시합니다.
+    """
+    with open(path, encoding="utf-8") as blocklist:
+        for line in blocklist:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            number, _, reports = line.partition(",")
+            if not _NON_DIGIT.sub("", number):
+                continue  # 헤더 등 숫자가 없는 줄
+            yield kind, number, int(reports) if reports.strip().isdigit() else 1
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """블록리스트를 평판 파일로 대량 등록합니다."""
+    parser = argparse.ArgumentParser(description="사기 번호 블록리스트를 평판 파일로 변환합니다.")
+    parser.add_argument("output", help="출력 평판 파일 경로")
+    parser.add_argument("--phones", nargs="*", default=[], help="전화번호 블록리스트 파일")
+    parser.add_argument("--accounts", nargs="*", default=[], help="계좌번호 블록리스트 파일")
+    parser.add_argument("--merge", help="합칠 기존 평판 파일")
+    parser.add_argument("--fp-rate", type=float, default=0.01, help="블룸 필터 오탐률")
+    args = parser.parse_args(argv)
+
+    def entries():
+        for path in args.phones:
+            yield from read_blocklist(path, KIND_PHONE)
+        for path in args.accounts:
+            yield from read_blocklist(path, KIND_ACCOUNT)
+
+    count = ReputationStore.build(args.output, entries(), args.fp_rate, merge_with=args.merge)
+    print(f"{count}건을 저장했습니다: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
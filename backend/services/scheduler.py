@@ -0,0 +1,275 @@
+"""
+분석 작업 스케줄러
+음성 인식/사기 분석 작업을 우선순위 등급별로 줄 세워, 대량 작업이 몰려도 실시간 통화 분석이 먼저 실행되도록 합니다.
+
+- 등급: streaming(통화 세션) > interactive(텍스트 분석) > upload(파일 업로드) > bulk(대량 재분석)
+- 같은 등급 안에서는 API 클라이언트별 가중 공정 큐(WFQ)로 순서를 정해 한 클라이언트가 독점하지 못하게 합니다.
+- 기한(deadline) 안에 시작할 수 없는 작업은 기다리게 하지 않고 바로 거절합니다.
+- 낮은 등급은 동시 실행 수를 제한해 높은 등급이 쓸 자리를 항상 남겨 둡니다.
+
+이벤트 루프에서만 사용합니다 (작업 자체는 호출한 쪽에서 스레드/워커로 실행).
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, List, Optional
+
+import numpy as np
+
+
+PRIORITY_CLASSES = ("streaming", "interactive", "upload", "bulk")
+
+# 서비스 시간 평균(EWMA)에 새 값을 반영하는 비율
+_EWMA_ALPHA = 0.2
+
+
+class SchedulerError(Exception):
+    """스케줄러 작업 거절"""
+
+
+class SchedulerQueueFull(SchedulerError):
+    """등급별 대기열이 가득 참"""
+
+
+class SchedulerDeadlineExceeded(SchedulerError):
+    """기한 안에 작업을 시작할 수 없음"""
+
+
+class _Waiter:
+    """대기 중인 작업"""
+    __slots__ = ("future", "client_id", "deadline", "enqueued")
+
+    def __init__(self, future: asyncio.Future, client_id: str, deadline: Optional[float]):
+        self.future = future
+        self.client_id = client_id
+        self.deadline = deadline
+        self.enqueued = time.monotonic()
+
+
+class _ClassQueue:
+    """등급별 대기열과 통계"""
+
+    def __init__(self, limit: int, max_queue: int):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.heap: List[tuple] = []
+        self.waiting = 0
+        self.running = 0
+        # 가중 공정 큐의 가상 시각과 클라이언트별 마지막 종료 태그
+        self.virtual_time = 0.0
+        self.last_finish: Dict[str, float] = {}
+        self.admitted = 0
+        self.completed = 0
+        self.dropped_deadline = 0
+        self.rejected_full = 0
+        self.waits_ms: Deque[float] = deque(maxlen=1000)
+        self.service_ms: Optional[float] = None
+
+
+class PriorityScheduler:
+    """
+    우선순위 스케줄러 클래스
+    전체 동시 실행 수(concurrency) 안에서, 자리가 나면 높은 등급부터 대기 작업을 시작시킵니다.
+    """
+
+    def __init__(self, concurrency: int, reserved_slots: int = 1, max_queue: int = 256,
+                 deadlines_ms: Optional[Dict[str, int]] = None,
+                 client_weights: Optional[Dict[str, float]] = None):
+        """
+        스케줄러 초기화
+
+        Args:
+            concurrency: 전체 동시 실행 작업 수
+            reserved_slots: upload/bulk가 쓸 수 없는 자리 수 (streaming/interactive 전용)
+            max_queue: 등급별 최대 대기 작업 수 (넘으면 즉시 거절)
+            deadlines_ms: 등급별 기본 기한 (밀리초, 0이면 기한 없음)
+            client_weights: 클라이언트별 가중치 (기본 1.0, 높을수록 같은 등급에서 더 많은 몫)
+        """
+        self.concurrency = max(concurrency, 1)
+        self.deadlines_ms = deadlines_ms or {}
+        self.client_weights = client_weights or {}
+        self.running = 0
+        self._sequence = itertools.count()
+
+        shared = max(self.concurrency - reserved_slots, 1)
+        limits = {
+            "streaming": self.concurrency,
+            "interactive": self.concurrency,
+            "upload": shared,
+            "bulk": max(shared // 2, 1)
+        }
+        self._queues = {name: _ClassQueue(limits[name], max_queue) for name in PRIORITY_CLASSES}
+
+    @asynccontextmanager
+    async def slot(self, priority_class: str, client_id: str = "anonymous",
+                   deadline_ms: Optional[float] = None, cost: float = 1.0) -> AsyncIterator[None]:
+        """
+        실행 자리를 얻을 때까지 기다린 뒤 작업을 실행합니다.
+
+            async with scheduler.slot("interactive", client_id):
+                result = await analysis_pool.analyze_text(text)
+
+        Args:
+            priority_class: 우선순위 등급 (PRIORITY_CLASSES)
+            client_id: API 클라이언트 ID (같은 등급 안의 공정 분배 단위)
+            deadline_ms: 작업 시작 기한 (밀리초, 없으면 등급 기본값)
+            cost: 작업 비용 (공정 분배에서 클라이언트 몫을 차감하는 양)
+
+        Raises:
+            SchedulerQueueFull: 대기열이 가득 찬 경우
+            SchedulerDeadlineExceeded: 기한 안에 시작할 수 없는 경우
+        """
+        await self._acquire(priority_class, client_id, deadline_ms, cost)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(priority_class, (time.monotonic() - started) * 1000)
+
+    def status(self) -> Dict[str, any]:
+        """등급별 대기열 지표"""
+        classes = {}
+        for name, queue in self._queues.items():
+            waits = np.asarray(queue.waits_ms) if queue.waits_ms else None
+            classes[name] = {
+                "queued": queue.waiting,
+                "running": queue.running,
+                "limit": queue.limit,
+                "admitted": queue.admitted,
+                "completed": queue.completed,
+                "dropped_deadline": queue.dropped_deadline,
+                "rejected_full": queue.rejected_full,
+                "wait_ms": {
+                    "p50": round(float(np.percentile(waits, 50)), 2),
+                    "p95": round(float(np.percentile(waits, 95)), 2),
+                    "max": round(float(waits.max()), 2)
+                } if waits is not None else {},
+                "service_ms": round(queue.service_ms, 2) if queue.service_ms is not None else None
+            }
+        return {"concurrency": self.concurrency, "running": self.running, "classes": classes}
+
+    @property
+    def queued(self) -> int:
+        """전체 대기 작업 수"""
+        return sum(queue.waiting for queue in self._queues.values())
+
+    async def _acquire(self, priority_class: str, client_id: str,
+                       deadline_ms: Optional[float], cost: float) -> None:
+        queue = self._queues.get(priority_class)
+        if queue is None:
+            raise ValueError(f"알 수 없는 우선순위 등급입니다: {priority_class}")
+
+        if deadline_ms is None:
+            deadline_ms = self.deadlines_ms.get(priority_class) or None
+        now = time.monotonic()
+        deadline = now + deadline_ms / 1000 if deadline_ms else None
+
+        # 자리가 있고 앞선 대기 작업이 없으면 바로 실행
+        if self._can_start(priority_class) and not self._waiting_ahead(priority_class):
+            self._start(queue, 0.0)
+            return
+
+        if queue.waiting >= queue.max_queue:
+            queue.rejected_full += 1
+            raise SchedulerQueueFull(f"{priority_class} 대기열이 가득 찼습니다 ({queue.max_queue}건)")
+        if deadline_ms and self._estimated_wait_ms(priority_class) > deadline_ms:
+            queue.dropped_deadline += 1
+            raise SchedulerDeadlineExceeded(f"{priority_class} 작업을 기한({deadline_ms:.0f}ms) 안에 시작할 수 없습니다")
+
+        # 가중 공정 큐: 클라이언트별 종료 태그가 작은 작업부터 (대기 작업이 없으면 태그 초기화)
+        if not queue.waiting:
+            queue.last_finish.clear()
+        weight = self.client_weights.get(client_id, 1.0)
+        start_tag = max(queue.virtual_time, queue.last_finish.get(client_id, 0.0))
+        finish_tag = start_tag + cost / weight
+        queue.last_finish[client_id] = finish_tag
+
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), client_id, deadline)
+        heapq.heappush(queue.heap, (finish_tag, next(self._sequence), waiter))
+        queue.waiting += 1
+        self._dispatch()
+
+        try:
+            timeout = deadline - now if deadline is not None else None
+            await asyncio.wait_for(waiter.future, timeout)
+        except asyncio.TimeoutError:
+            queue.waiting -= 1
+            queue.dropped_deadline += 1
+            raise SchedulerDeadlineExceeded(
+                f"{priority_class} 작업이 기한({deadline_ms:.0f}ms) 안에 시작되지 못했습니다"
+            ) from None
+        except asyncio.CancelledError:
+            # 자리를 받은 직후 취소되었으면 자리를 돌려줌
+            # (_dispatch가 기한 초과로 거절한 작업은 자리를 받지 않았고 대기 수도 이미 정리됨)
+            if waiter.future.done() and not waiter.future.cancelled():
+                if waiter.future.exception() is None:
+                    self._release(priority_class, None)
+            else:
+                queue.waiting -= 1
+            raise
+
+    def _can_start(self, priority_class: str) -> bool:
+        queue = self._queues[priority_class]
+        return self.running < self.concurrency and queue.running < queue.limit
+
+    def _waiting_ahead(self, priority_class: str) -> bool:
+        """같거나 높은 등급에 대기 작업이 있는지 여부"""
+        for name in PRIORITY_CLASSES:
+            if self._queues[name].waiting:
+                return True
+            if name == priority_class:
+                return False
+        return False
+
+    def _estimated_wait_ms(self, priority_class: str) -> float:
+        """같거나 높은 등급의 대기 작업이 모두 시작될 때까지의 예상 시간"""
+        total_ms = 0.0
+        for name in PRIORITY_CLASSES:
+            queue = self._queues[name]
+            if queue.service_ms is not None:
+                total_ms += (queue.waiting + (1 if name == priority_class else 0)) * queue.service_ms
+            if name == priority_class:
+                break
+        return total_ms / self.concurrency
+
+    def _start(self, queue: _ClassQueue, waited_ms: float) -> None:
+        self.running += 1
+        queue.running += 1
+        queue.admitted += 1
+        queue.waits_ms.append(waited_ms)
+
+    def _release(self, priority_class: str, service_ms: Optional[float]) -> None:
+        queue = self._queues[priority_class]
+        self.running -= 1
+        queue.running -= 1
+        if service_ms is not None:
+            queue.completed += 1
+            queue.service_ms = service_ms if queue.service_ms is None else (
+                queue.service_ms + _EWMA_ALPHA * (service_ms - queue.service_ms)
+            )
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """빈 자리에 높은 등급부터 대기 작업을 시작시킵니다."""
+        now = time.monotonic()
+        for name in PRIORITY_CLASSES:
+            queue = self._queues[name]
+            while queue.heap and self._can_start(name):
+                finish_tag, _, waiter = heapq.heappop(queue.heap)
+                if waiter.future.done():
+                    # 기한 초과/취소로 이미 빠져나간 작업 (대기 수와 통계는 대기 쪽에서 정리)
+                    continue
+                queue.waiting -= 1
+                if waiter.deadline is not None and now > waiter.deadline:
+                    queue.dropped_deadline += 1
+                    waiter.future.set_exception(SchedulerDeadlineExceeded(f"{name} 작업의 기한이 지났습니다"))
+                    continue
+                queue.virtual_time = finish_tag
+                self._start(queue, (now - waiter.enqueued) * 1000)
+                waiter.future.set_result(None)
+            if self.running >= self.concurrency:
+                return
@@ -0,0 +1,226 @@
+"""
+점수 규칙 서비스
+위험도 가산점과 위험 등급을 간단한 규칙 문법으로 정의하고, 로드 시 한 번만
+파이썬 함수로 컴파일해 분석마다 규칙 수와 관계없이 함수 호출 한 번으로 평가합니다.
+
+규칙 문법 (한 줄에 규칙 하나, '#' 뒤는 주석):
+    <조건> => +<점수>          조건이 참이면 점수를 더함 (음수도 가능)
+    <조건> => level <등급>     위에서부터 처음 참인 규칙의 등급을 사용 (없으면 VERY_LOW)
+
+조건:
+    authority_claim                               특징(패턴, 키워드 카테고리 등) 발견 여부
+    a AND b / a OR b / NOT a / ( ... )            논리 연산 (AND가 OR보다 먼저 결합)
+    a AND b WITHIN 50                             모든 특징이 50자 구간 안에 함께 등장 (services/proximity.py)
+    score >= 7.0                                  위험도 점수 비교 (등급 규칙에서만 사용)
+
+예:
+    authority_claim AND financial_instruction WITHIN 50 => +2.0
+    score >= 7.0 => level VERY_HIGH
+"""
+
+import re
+from typing import Callable, Collection, Dict, Iterable, List, NamedTuple, Tuple
+
+from services.proximity import ProximityGroup
+
+
+class RuleSyntaxError(ValueError):
+    """규칙 문법 오류"""
+
+
+class ScoreRule(NamedTuple):
+    """가산점 규칙"""
+    label: str      # 조건 원문 (점수 구성에 표시)
+    weight: float
+
+
+class LevelRule(NamedTuple):
+    """위험 등급 규칙"""
+    label: str
+    level: str
+
+
+DEFAULT_LEVEL = "VERY_LOW"
+
+_TOKEN_PATTERN = re.compile(r'\s*(?:(\d+(?:\.\d+)?)|([A-Za-z_]\w*)|(>=|<=|==|>|<|\(|\)))')
+_KEYWORDS = {"AND", "OR", "NOT", "WITHIN"}
+_ACTION_PATTERN = re.compile(r'^(?:([+-]\d+(?:\.\d+)?)|level\s+([A-Z_]+))$')
+
+
+class RuleSet:
+    """
+    컴파일된 규칙 집합 클래스
+    가산점 규칙은 발견 여부 튜플을 반환하는 함수 하나로, 등급 규칙은 조건식 체인 하나로 컴파일합니다.
+    """
+
+    def __init__(self, source: str, features: Iterable[str]):
+        """
+        규칙 컴파일
+
+        Args:
+            source: 규칙 원문
+            features: 규칙에서 사용할 수 있는 특징 이름 목록 (오타 검사용)
+        """
+        self.source = source
+        self.features = frozenset(features)
+        self.rules: List[ScoreRule] = []
+        self.level_rules: List[LevelRule] = []
+        # WITHIN 조건 목록 (ProximityTracker에 넘겨 한 번의 순회로 모두 확인)
+        self.proximity_groups: List[ProximityGroup] = []
+
+        score_conditions: List[str] = []
+        level_branches: List[str] = []
+
+        for line_number, line in enumerate(source.splitlines(), start=1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+
+            condition, arrow, action = line.partition("=>")
+            action_match = _ACTION_PATTERN.match(action.strip())
+            if not arrow or not action_match:
+                raise RuleSyntaxError(f"{line_number}번째 줄: '<조건> => +점수' 또는 '<조건> => level 등급' 형식이어야 합니다")
+
+            weight, level = action_match.groups()
+            label = " ".join(condition.split())
+            try:
+                expression = _Parser(condition, self.features, allow_score=level is not None,
+                                     proximity_groups=self.proximity_groups).parse()
+            except RuleSyntaxError as e:
+                raise RuleSyntaxError(f"{line_number}번째 줄: {e}") from None
+
+            if level is None:
+                self.rules.append(ScoreRule(label, float(weight)))
+                score_conditions.append(expression)
+            else:
+                self.level_rules.append(LevelRule(label, level))
+                level_branches.append(f"{level!r} if {expression} else ")
+
+        # 생성되는 코드에는 검증된 특징 이름, 숫자, 등급 이름만 들어갑니다
+        self._match_rules: Callable[[Dict[str, bool], Collection[int]], Tuple[bool, ...]] = _compile(
+            f"lambda f, near: ({''.join(c + ', ' for c in score_conditions)})"
+        )
+        self._match_level: Callable[[Dict[str, bool], float], str] = _compile(
+            f"lambda f, score: {''.join(level_branches)}{DEFAULT_LEVEL!r}"
+        )
+
+    def __len__(self) -> int:
+        return len(self.rules) + len(self.level_rules)
+
+    def fired_rules(self, features: Dict[str, bool],
+                    proximity_hits: Collection[int] = ()) -> List[ScoreRule]:
+        """
+        조건이 참인 가산점 규칙을 반환합니다.
+
+        Args:
+            features: 특징별 발견 여부 (모든 특징 이름 포함)
+            proximity_hits: 충족된 WITHIN 조건 번호 (proximity_groups 기준, ProximityTracker.satisfied)
+
+        Returns:
+            List[ScoreRule]: 적용된 규칙 목록 (정의 순서)
+        """
+        return [rule for rule, fired in zip(self.rules, self._match_rules(features, proximity_hits)) if fired]
+
+    def level(self, features: Dict[str, bool], score: float) -> str:
+        """위험도 점수와 특징으로 위험 등급을 결정합니다."""
+        return self._match_level(features, score)
+
+
+def _compile(source: str) -> Callable:
+    return eval(compile(source, "<scoring rules>", "eval"), {"__builtins__": {}})
+
+
+class _Parser:
+    """조건식 파서 (재귀 하강, 파이썬 식 문자열로 변환)"""
+
+    def __init__(self, text: str, features: frozenset, allow_score: bool,
+                 proximity_groups: List[ProximityGroup]):
+        self.tokens = self._tokenize(text)
+        self.index = 0
+        self.features = features
+        self.allow_score = allow_score
+        self.proximity_groups = proximity_groups
+
+    def parse(self) -> str:
+        if not self.tokens:
+            raise RuleSyntaxError("조건이 비어 있습니다")
+        expression = self._expression()
+        if self.index < len(self.tokens):
+            raise RuleSyntaxError(f"예상하지 못한 '{self.tokens[self.index]}'")
+        return expression
+
+    def _expression(self) -> str:
+        terms = [self._term()]
+        while self._accept("OR"):
+            terms.append(self._term())
+        return terms[0] if len(terms) == 1 else "(" + " or ".join(terms) + ")"
+
+    def _term(self) -> str:
+        factors = [self._factor()]
+        while self._accept("AND"):
+            factors.append(self._factor())
+
+        if self._accept("WITHIN"):
+            distance = self._next()
+            if not distance.isdigit():
+                raise RuleSyntaxError("WITHIN 뒤에는 글자 수(정수)가 와야 합니다")
+            names = [factor for factor in factors if factor.startswith("f[")]
+            if len(names) != len(factors) or len(names) < 2:
+                raise RuleSyntaxError("WITHIN은 두 개 이상의 특징을 AND로 이은 조건에만 쓸 수 있습니다")
+            group = (tuple(name[3:-2] for name in names), int(distance))
+            if group not in self.proximity_groups:
+                self.proximity_groups.append(group)
+            factors.append(f"({self.proximity_groups.index(group)} in near)")
+
+        return factors[0] if len(factors) == 1 else "(" + " and ".join(factors) + ")"
+
+    def _factor(self) -> str:
+        token = self._next()
+        if token == "NOT":
+            return f"(not {self._factor()})"
+        if token == "(":
+            expression = self._expression()
+            if self._next() != ")":
+                raise RuleSyntaxError("괄호가 닫히지 않았습니다")
+            return expression
+        if token == "score":
+            if not self.allow_score:
+                raise RuleSyntaxError("score 비교는 등급 규칙(=> level)에서만 사용할 수 있습니다")
+            operator, value = self._next(), self._next()
+            if operator not in (">=", "<=", ">", "<", "==") or not _is_number(value):
+                raise RuleSyntaxError("score 뒤에는 비교 연산자와 숫자가 와야 합니다")
+            return f"(score {operator} {float(value)})"
+        if token in self.features:
+            return f"f[{token!r}]"
+        raise RuleSyntaxError(f"알 수 없는 특징입니다: '{token}'")
+
+    def _accept(self, keyword: str) -> bool:
+        if self.index < len(self.tokens) and self.tokens[self.index] == keyword:
+            self.index += 1
+            return True
+        return False
+
+    def _next(self) -> str:
+        if self.index >= len(self.tokens):
+            raise RuleSyntaxError("조건이 끝나지 않았습니다")
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    @staticmethod
+    def _tokenize(text: str) -> List[str]:
+        tokens = []
+        position = 0
+        text = text.rstrip()
+        while position < len(text):
+            match = _TOKEN_PATTERN.match(text, position)
+            if not match or match.end() == position:
+                raise RuleSyntaxError(f"해석할 수 없는 부분: '{text[position:].strip()}'")
+            token = match.group(match.lastindex)
+            tokens.append(token.upper() if token.upper() in _KEYWORDS else token)
+            position = match.end()
+        return tokens
+
+
+def _is_number(token: str) -> bool:
+    return bool(re.fullmatch(r'\d+(?:\.\d+)?', token))
@@ -0,0 +1,190 @@
+"""
+사기 대본 유사도 인덱스
+MinHash + LSH를 사용해 알려진 사기 대본과 가장 유사한 대본을 빠르게 찾습니다.
+"""
+
+import random
+import re
+import zlib
+from typing import Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+
+# MinHash 해시 함수에 사용하는 메르센 소수 (2^31 - 1)
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+class ScriptIndex:
+    """
+    사기 대본 인덱스 클래스
+    문자 단위 shingle의 MinHash 서명을 밴드로 나누어 LSH 버킷에 저장하므로,
+    조회 시 전체 대본을 훑지 않고 같은 버킷에 들어간 후보만 비교합니다.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 32,
+                 shingle_size: int = 2, seed: int = 1):
+        """
+        인덱스 초기화
+
+        Args:
+            num_perm: MinHash 서명 길이 (해시 함수 개수)
+            bands: LSH 밴드 개수 (num_perm의 약수여야 함)
+            shingle_size: 문자 shingle 길이 (한글은 음절 2-gram이 적당)
+            seed: 해시 함수 계수 생성용 시드
+        """
+        if num_perm % bands != 0:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        # 해시 함수 계수 (a * x + b) mod p 를 미리 계산
+        rng = random.Random(seed)
+        self._perm_a = np.array(
+            [rng.randrange(1, _MERSENNE_PRIME) for _ in range(num_perm)], dtype=np.uint64
+        )
+        self._perm_b = np.array(
+            [rng.randrange(0, _MERSENNE_PRIME) for _ in range(num_perm)], dtype=np.uint64
+        )
+
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+        self._scripts: List[Dict[str, any]] = []
+        self._signatures: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return len(self._scripts)
+
+    def add(self, script_id: str, text: str, metadata: Optional[Dict[str, any]] = None) -> bool:
+        """
+        사기 대본을 인덱스에 추가합니다.
+
+        Args:
+            script_id: 대본 식별자
+            text: 대본 텍스트
+            metadata: 함께 반환할 부가 정보 (제목, 사기 유형 등)
+
+        Returns:
+            bool: 추가 여부 (shingle을 만들 수 없는 짧은 텍스트는 제외)
+        """
+        signature = self._signature(text)
+        if signature is None:
+            logger.warning(f"사기 대본이 너무 짧아 인덱스에서 제외합니다: {script_id}")
+            return False
+
+        self._insert({"script_id": script_id, **(metadata or {})}, signature)
+        return True
+
+    def query(self, text: str, threshold: float = 0.0) -> Optional[Dict[str, any]]:
+        """
+        텍스트와 가장 유사한 사기 대본을 찾습니다.
+
+        Args:
+            text: 조회할 텍스트
+            threshold: 최소 유사도 (추정 자카드 유사도)
+
+        Returns:
+            Optional[Dict]: 가장 유사한 대본 정보와 유사도, 후보가 없으면 None
+        """
+        if not self._scripts:
+            return None
+
+        signature = self._signature(text)
+        if signature is None:
+            return None
+
+        # 같은 버킷을 공유하는 후보만 비교
+        candidates = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        best_position = None
+        best_similarity = threshold
+        for position in candidates:
+            similarity = float(np.mean(self._signatures[position] == signature))
+            if similarity >= best_similarity:
+                best_position = position
+                best_similarity = similarity
+
+        if best_position is None:
+            return None
+
+        return {**self._scripts[best_position], "similarity": round(best_similarity, 3)}
+
+    def to_state(self) -> Dict[str, any]:
+        """
+        내보내기용 상태 (JSON 직렬화 가능)
+        해시 계수를 그대로 담으므로 다른 언어의 클라이언트도 같은 서명을 계산할 수 있습니다
+        (계수와 CRC32 값의 곱은 2^62까지 커지므로 64비트 정수 연산이 필요).
+        """
+        return {
+            "num_perm": self.num_perm,
+            "bands": self.bands,
+            "shingle_size": self.shingle_size,
+            "prime": _MERSENNE_PRIME,
+            "perm_a": self._perm_a.tolist(),
+            "perm_b": self._perm_b.tolist(),
+            "scripts": [
+                {**script, "signature": signature.tolist()}
+                for script, signature in zip(self._scripts, self._signatures)
+            ]
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, any]) -> "ScriptIndex":
+        """
+        내보낸 상태에서 인덱스를 복원합니다 (대본 텍스트 없이 서명으로 버킷을 다시 만듦).
+
+        Raises:
+            ValueError: 해시 소수나 계수 개수가 맞지 않는 경우
+        """
+        if state.get("prime", _MERSENNE_PRIME) != _MERSENNE_PRIME:
+            raise ValueError(f"지원하지 않는 해시 소수입니다: {state['prime']}")
+        index = cls(num_perm=state["num_perm"], bands=state["bands"], shingle_size=state["shingle_size"])
+        if len(state["perm_a"]) != index.num_perm or len(state["perm_b"]) != index.num_perm:
+            raise ValueError("해시 계수 개수가 num_perm과 다릅니다.")
+        index._perm_a = np.array(state["perm_a"], dtype=np.uint64)
+        index._perm_b = np.array(state["perm_b"], dtype=np.uint64)
+        for script in state["scripts"]:
+            metadata = {key: value for key, value in script.items() if key != "signature"}
+            index._insert(metadata, np.array(script["signature"], dtype=np.uint64))
+        return index
+
+    def _insert(self, script: Dict[str, any], signature: np.ndarray) -> None:
+        """대본 정보와 서명을 저장하고 밴드별 버킷에 등록합니다."""
+        position = len(self._scripts)
+        self._scripts.append(script)
+        self._signatures.append(signature)
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(key, []).append(position)
+
+    def _shingles(self, text: str) -> List[str]:
+        """공백과 특수문자를 제거한 문자 shingle 목록을 생성합니다."""
+        compact = re.sub(r'[\W_]+', '', text.lower())
+        size = self.shingle_size
+        if len(compact) < size:
+            return []
+        return list({compact[i:i + size] for i in range(len(compact) - size + 1)})
+
+    def _signature(self, text: str) -> Optional[np.ndarray]:
+        """텍스트의 MinHash 서명을 계산합니다."""
+        shingles = self._shingles(text)
+        if not shingles:
+            return None
+
+        hashes = np.array(
+            [zlib.crc32(shingle.encode("utf-8")) for shingle in shingles], dtype=np.uint64
+        )
+        # (해시 함수 개수 × shingle 개수) 행렬에서 행별 최솟값이 서명
+        permuted = (np.outer(self._perm_a, hashes) + self._perm_b[:, None]) % _MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        """서명을 밴드별 버킷 키로 나눕니다."""
+        return [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
@@ -0,0 +1,122 @@
+"""
+섀도 평가 서비스
+새 키워드 목록이나 가중치/규칙을 배포하기 전에, 실제 요청 일부를 후보 탐지기로도 분석해
+현재 탐지기와의 판정 차이를 통계로 모읍니다. 후보 분석은 응답과 무관하게 백그라운드에서 실행됩니다.
+"""
+
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from loguru import logger
+
+
+class ShadowEvaluator:
+    """
+    섀도 평가기 클래스
+    표본 비율(sample_rate)만큼의 요청만 후보 탐지기로 다시 분석하고,
+    대기 중인 작업이 max_pending을 넘으면 새 표본을 버려 추가 CPU 사용량을 제한합니다.
+    """
+
+    def __init__(self, candidate_detector, stats, sample_rate: float, max_pending: int = 32):
+        """
+        섀도 평가기 초기화
+
+        Args:
+            candidate_detector: 비교할 후보 사기 탐지기
+            stats: 비교 결과를 기록할 통계 집계기 (AnalysisStats)
+            sample_rate: 후보로도 분석할 요청 비율 (0.0 - 1.0)
+            max_pending: 백그라운드 대기 작업 최대 개수
+        """
+        self.candidate_detector = candidate_detector
+        self.stats = stats
+        self.sample_rate = sample_rate
+        self.max_pending = max_pending
+        self.pending = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="shadow")
+
+    @staticmethod
+    def load_config(path: str) -> Dict[str, any]:
+        """
+        후보 탐지기 설정 파일(JSON)을 읽습니다.
+        fraud_keywords, scoring_weights, scoring_rules, suspicion_threshold 항목을 사용할 수 있고,
+        없는 항목은 기본값을 사용합니다.
+        """
+        with open(path, encoding="utf-8") as config_file:
+            config = json.load(config_file)
+
+        allowed = {"fraud_keywords", "scoring_weights", "scoring_rules", "suspicion_threshold"}
+        unknown = set(config) - allowed
+        if unknown:
+            raise ValueError(f"알 수 없는 섀도 설정 항목입니다: {', '.join(sorted(unknown))}")
+        return config
+
+    def submit(self, text: str, primary_result: Dict[str, any]) -> bool:
+        """
+        표본으로 뽑힌 요청을 후보 탐지기로 분석하도록 예약합니다 (즉시 반환).
+
+        Args:
+            text: 분석한 텍스트
+            primary_result: 현재 탐지기의 분석 결과
+
+        Returns:
+            bool: 예약 여부 (표본에서 제외되었거나 대기 작업이 많으면 False)
+        """
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return False
+        if "error" in primary_result:
+            return False
+
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.stats.record_shadow_dropped()
+                return False
+            self.pending += 1
+
+        self._executor.submit(self._compare, text, primary_result)
+        return True
+
+    def shutdown(self) -> None:
+        """백그라운드 작업을 정리합니다 (대기 중인 작업은 취소)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _compare(self, text: str, primary_result: Dict[str, any]) -> None:
+        """후보 탐지기로 분석하고 차이를 기록합니다."""
+        try:
+            started = time.perf_counter()
+            candidate_result = self.candidate_detector.analyze_text(text)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+            if "error" not in candidate_result:
+                self.stats.record_shadow(primary_result, candidate_result, elapsed_ms)
+        except Exception as e:
+            logger.error(f"섀도 평가 중 오류: {str(e)}")
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+
+def create_shadow_evaluator(config_path: str, sample_rate: float, stats,
+                            reputation_store=None) -> Optional[ShadowEvaluator]:
+    """
+    설정 파일로 후보 탐지기를 만들어 섀도 평가기를 반환합니다 (설정이 없으면 None).
+
+    Args:
+        config_path: 후보 탐지기 설정 파일 경로
+        sample_rate: 표본 비율
+        stats: 통계 집계기
+        reputation_store: 후보 탐지기와 공유할 평판 저장소
+    """
+    if not config_path or sample_rate <= 0:
+        return None
+
+    from services.fraud_detector import FraudDetector
+
+    config = ShadowEvaluator.load_config(config_path)
+    candidate = FraudDetector(reputation_store=reputation_store, **config)
+    logger.info(f"섀도 평가를 시작합니다: {config_path} (표본 비율 {sample_rate:.0%})")
+    return ShadowEvaluator(candidate, stats, sample_rate)
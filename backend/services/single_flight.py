@@ -0,0 +1,95 @@
+"""
+동시 중복 요청 합치기(single-flight) 서비스
+같은 내용(텍스트/음성 파일 해시)의 분석이 동시에 여러 건 들어오면 한 번만 계산하고 결과를 나누어 줍니다.
+사기 전화가 대량으로 돌 때 같은 음성/문장이 한꺼번에 들어와 인식 엔진에 몰리는 것을 막습니다.
+이미 끝난 결과는 보관하지 않으므로 캐시가 아니며, 진행 중인 계산만 공유합니다.
+"""
+
+import asyncio
+import copy
+import hashlib
+from typing import Any, Awaitable, BinaryIO, Callable, Dict, Optional, Tuple, Union
+
+
+def text_key(text: str) -> str:
+    """텍스트 내용 키"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def file_key(audio_file: Union[str, BinaryIO], chunk_size: int = 1024 * 1024,
+             copy_to: Optional[BinaryIO] = None) -> str:
+    """
+    파일 내용 키 (나누어 읽어 메모리에 한 번에 올리지 않음, 파일 객체는 처음 위치로 되돌림)
+
+    Args:
+        audio_file: 파일 경로 또는 파일 객체
+        chunk_size: 한 번에 읽을 바이트 수
+        copy_to: 읽은 내용을 함께 쓸 파일 (업로드를 임시 파일로 옮기면서 키를 계산할 때)
+    """
+    digest = hashlib.sha256()
+    if isinstance(audio_file, str):
+        with open(audio_file, "rb") as source:
+            _consume(source, chunk_size, digest, copy_to)
+    else:
+        audio_file.seek(0)
+        _consume(audio_file, chunk_size, digest, copy_to)
+        audio_file.seek(0)
+    return digest.hexdigest()
+
+
+def _consume(source: BinaryIO, chunk_size: int, digest: Any, copy_to: Optional[BinaryIO]) -> None:
+    for chunk in iter(lambda: source.read(chunk_size), b""):
+        digest.update(chunk)
+        if copy_to is not None:
+            copy_to.write(chunk)
+
+
+class SingleFlight:
+    """
+    동시 중복 요청 합치기 클래스 (이벤트 루프에서 사용)
+    계산은 첫 요청과 분리된 태스크로 실행되어, 첫 요청이 취소되어도 기다리는 다른 요청은 결과를 받습니다.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Task] = {}
+        self.executed = 0
+        self.shared = 0
+
+    async def run(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        같은 키의 계산이 진행 중이면 그 결과를 기다리고, 없으면 새로 계산합니다.
+
+        Args:
+            key: 내용 키 (text_key, file_key)
+            compute: 결과를 계산하는 코루틴 함수
+
+        Returns:
+            Tuple: (결과 - 나누어 받은 경우 얕은 복사본, 다른 요청의 결과를 나누어 받았는지 여부)
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            self.shared += 1
+            result = await asyncio.shield(task)
+            return copy.copy(result), True
+
+        task = asyncio.ensure_future(compute())
+        self._calls[key] = task
+        self.executed += 1
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task), False
+
+    @property
+    def in_flight(self) -> int:
+        """진행 중인 계산 수"""
+        return len(self._calls)
+
+    def status(self) -> Dict[str, int]:
+        """계산/공유 횟수"""
+        return {"in_flight": self.in_flight, "executed": self.executed, "shared": self.shared}
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # 기다리던 요청이 모두 취소된 경우에도 예외가 처리되지 않았다는 경고가 남지 않도록 확인
+            task.exception()
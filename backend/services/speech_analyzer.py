@@ -3,14 +3,25 @@
 음성을 텍스트로 변환하고 기본적인 분석을 수행합니다.
 """
 
-import speech_recognition as sr
-from pydub import AudioSegment
-import io
+import math
 import tempfile
 import os
-from typing import Dict, Optional, Tuple
+import shutil
+import threading
+import wave
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
 from loguru import logger
 
+from services.audio_stream import AudioDecodeError, PcmStream, find_executable, iter_segments
+from services.noise_floor import MIN_ENERGY_THRESHOLD, NoiseCalibrationCache, StreamingVad, frame_energies
+from services.single_flight import file_key
+
+# speech_recognition은 import 비용이 커서 음성을 처음 처리할 때 불러옵니다
+# (텍스트 분석만 하는 배포에서는 불러오지 않음)
+
 
 class SpeechAnalyzer:
     """
@@ -18,52 +29,139 @@ class SpeechAnalyzer:
     음성 파일을 텍스트로 변환하는 기능을 제공합니다.
     """
     
-    def __init__(self):
-        """음성 분석기 초기화"""
-        self.recognizer = sr.Recognizer()
+    # 인식 엔진별 입력 샘플레이트 (이보다 높은 샘플레이트는 인식 전에 낮춤)
+    RECOGNIZER_SAMPLE_RATES = {
+        "google": 16000,
+        "sphinx": 16000
+    }
+    
+    # 인식 엔진에 한 번에 보내는 최대 음성 길이 (초, 처리 중 보관하는 음성의 상한)
+    MAX_SEGMENT_SECONDS = 30.0
+    
+    # 기본 인식 언어 (언어 팩의 speech_language로 요청마다 바꿀 수 있음)
+    DEFAULT_LANGUAGE = "ko-KR"
+    
+    def __init__(self, recognizer_backend: str = "google", target_sample_rate: int = 0,
+                 noise_cache: Optional[NoiseCalibrationCache] = None):
+        """
+        음성 분석기 초기화
+        
+        Args:
+            recognizer_backend: 사용할 음성 인식 엔진 (google, 실패 시 sphinx)
+            target_sample_rate: 인식 전 변환할 샘플레이트 (0이면 인식 엔진 기본값)
+            noise_cache: 출처(통화)별 배경 소음 보정 캐시
+        """
+        self.recognizer_backend = recognizer_backend
+        self.target_sample_rate = target_sample_rate or self.RECOGNIZER_SAMPLE_RATES.get(recognizer_backend, 16000)
+        self.noise_cache = noise_cache or NoiseCalibrationCache()
+        self._recognizer = None
+        self._recognizer_lock = threading.Lock()
         logger.info("음성 분석기가 초기화되었습니다.")
     
-    def audio_to_text(self, audio_file) -> Dict[str, any]:
+    @property
+    def recognizer(self):
+        """음성 인식기 (처음 사용할 때 생성)"""
+        if self._recognizer is None:
+            with self._recognizer_lock:
+                if self._recognizer is None:
+                    import speech_recognition as sr
+                    self._recognizer = sr.Recognizer()
+                    logger.info("음성 인식 엔진을 불러왔습니다.")
+        return self._recognizer
+    
+    @property
+    def is_recognizer_loaded(self) -> bool:
+        """음성 인식기 로드 여부"""
+        return self._recognizer is not None
+    
+    def warm_up(self) -> None:
+        """음성 인식 엔진을 미리 불러오고 ffmpeg 설치 여부를 확인합니다."""
+        self.recognizer
+        if find_executable("ffmpeg") is None:
+            logger.warning("ffmpeg가 없어 PCM WAV 외의 음성 형식은 처리할 수 없습니다.")
+    
+    def audio_to_text(self, audio_file, source_id: Optional[str] = None,
+                      language: str = DEFAULT_LANGUAGE) -> Dict[str, any]:
         """
         음성 파일을 텍스트로 변환합니다.
+        디코딩 → 말소리 감지 → 구간별 인식을 블록 단위로 이어서 처리하므로, 긴 녹음도 메모리에
+        인식 구간 하나(최대 MAX_SEGMENT_SECONDS) 분량만 올립니다. 말소리가 없는 구간은 인식하지 않지만,
+        파일 앞부분부터 말소리가 전혀 감지되지 않으면(음량이 일정한 음성은 소음 수준과 구분되지 않음)
+        무음이 아닌 구간을 그대로 인식합니다. 음성 속성(audio_properties)도 같은 디코딩에서 계산합니다.
         
         Args:
-            audio_file: 업로드된 음성 파일
+            audio_file: 업로드된 음성 파일 (파일 객체 또는 경로)
+            source_id: 음성 출처 ID (통화 ID 등, 같은 출처의 조각끼리 소음 보정값을 이어 사용)
+            language: 인식 언어 코드 (예: ko-KR, en-US)
             
         Returns:
             Dict: 변환 결과 (텍스트, 신뢰도, 오류 정보 등)
         """
         try:
-            # 1. 음성 파일 읽기
             logger.info("음성 파일 처리를 시작합니다...")
             
-            # 파일 내용을 메모리에 로드
-            audio_content = audio_file.read()
-            
-            # 임시 파일로 저장
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as temp_file:
-                temp_file.write(audio_content)
-                temp_file_path = temp_file.name
-            
-            # 2. 음성 파일 형식 변환 (WAV로 통일)
-            processed_audio_path = self._convert_to_wav(temp_file_path)
+            with _local_path(audio_file) as audio_path, PcmStream(audio_path, self.target_sample_rate) as stream:
+                info = stream.info
+                initial_floor = self.noise_cache.peek(source_id) if source_id else None
+                vad = StreamingVad(info["sample_rate"], initial_floor)
+                
+                texts = []
+                weighted_confidence = squares = 0.0
+                text_samples = samples = segments = recognized_segments = fallback_segments = 0
+                google_available = True
+                for segment, has_speech in iter_segments(stream, vad, self.MAX_SEGMENT_SECONDS):
+                    samples += len(segment)
+                    segments += 1
+                    squares += float(np.dot(segment, segment))
+                    if not has_speech:
+                        # 지금까지 말소리가 한 번도 감지되지 않았으면 무음이 아닌 구간은 그대로 인식
+                        if vad.speech_frames or not _is_audible(segment, info["sample_rate"]):
+                            continue
+                        fallback_segments += 1
+                    recognized_segments += 1
+                    text, confidence, google_available = self._recognize_segment(
+                        segment, info["sample_rate"], language, google_available
+                    )
+                    if text:
+                        texts.append(text)
+                        weighted_confidence += confidence * len(segment)
+                        text_samples += len(segment)
+                
+                original_bytes = os.path.getsize(audio_path)
             
-            # 3. 음성 인식 수행
-            text_result = self._perform_speech_recognition(processed_audio_path)
+            noise = vad.summary(self.noise_cache, source_id)
+            if not recognized_segments:
+                logger.info(f"말소리가 감지되지 않아 음성 인식을 건너뜁니다 (소음 수준 {noise['noise_floor']})")
+            elif fallback_segments:
+                logger.info(f"말소리가 감지되지 않은 구간 {fallback_segments}개를 그대로 인식했습니다 "
+                            f"(소음 수준 {noise['noise_floor']})")
             
-            # 4. 임시 파일 정리
-            os.unlink(temp_file_path)
-            if processed_audio_path != temp_file_path:
-                os.unlink(processed_audio_path)
+            prepared_bytes = samples * 2
+            preprocessing = {
+                "decoder": info["decoder"],
+                "original_sample_rate": info["original_sample_rate"],
+                "original_channels": info["original_channels"],
+                "sample_rate": info["sample_rate"],
+                "channels": 1,
+                "original_bytes": original_bytes,
+                "prepared_bytes": prepared_bytes,
+                "bytes_saved": max(original_bytes - prepared_bytes, 0),
+                "segments": segments,
+                "recognized_segments": recognized_segments,
+                "fallback_segments": fallback_segments
+            }
             
-            # 5. 결과 반환
             return {
                 "success": True,
-                "text": text_result["text"],
-                "confidence": text_result["confidence"],
-                "language": "ko-KR",
-                "duration": text_result.get("duration", 0),
-                "error": None
+                "text": " ".join(texts),
+                "confidence": round(weighted_confidence / text_samples, 3) if text_samples else 0.0,
+                "language": language,
+                "duration": round(samples / info["sample_rate"], 3) if info["sample_rate"] else 0,
+                "preprocessing": preprocessing,
+                "noise": noise,
+                "audio_properties": _audio_properties(info, original_bytes, squares, samples),
+                "error": None,
+                "input_error": False
             }
             
         except Exception as e:
@@ -72,183 +170,157 @@ class SpeechAnalyzer:
                 "success": False,
                 "text": "",
                 "confidence": 0.0,
-                "language": "ko-KR",
+                "language": language,
                 "duration": 0,
-                "error": str(e)
+                "audio_properties": dict(EMPTY_AUDIO_PROPERTIES),
+                "error": str(e),
+                # 디코딩할 수 없는 음성(클라이언트 입력 문제)인지 여부 (인식 엔진 오류율에서 제외)
+                "input_error": isinstance(e, (AudioDecodeError, wave.Error, EOFError))
             }
     
-    def _convert_to_wav(self, file_path: str) -> str:
-        """
-        음성 파일을 WAV 형식으로 변환합니다.
-        
-        Args:
-            file_path: 원본 파일 경로
-            
-        Returns:
-            str: 변환된 WAV 파일 경로
-        """
-        try:
-            # 파일 확장자 확인
-            file_extension = os.path.splitext(file_path)[1].lower()
-            
-            if file_extension == '.wav':
-                return file_path
-            
-            # 다른 형식의 경우 WAV로 변환
-            logger.info(f"음성 파일을 WAV 형식으로 변환합니다: {file_extension}")
-            
-            # AudioSegment로 파일 읽기
-            if file_extension == '.mp3':
-                audio = AudioSegment.from_mp3(file_path)
-            elif file_extension == '.m4a':
-                audio = AudioSegment.from_file(file_path, format="m4a")
-            elif file_extension == '.webm':
-                audio = AudioSegment.from_file(file_path, format="webm")
-            else:
-                # 기본적으로 시도
-                audio = AudioSegment.from_file(file_path)
-            
-            # WAV 형식으로 변환 후 저장
-            wav_path = file_path.replace(file_extension, '.wav')
-            audio.export(wav_path, format="wav")
-            
-            return wav_path
-            
-        except Exception as e:
-            logger.error(f"음성 파일 변환 중 오류: {str(e)}")
-            return file_path
+    def forget_source(self, source_id: str) -> None:
+        """출처의 배경 소음 보정값을 지웁니다 (통화 종료 시)."""
+        self.noise_cache.forget(source_id)
     
-    def _perform_speech_recognition(self, wav_file_path: str) -> Dict[str, any]:
+    def _recognize_segment(self, segment: np.ndarray, sample_rate: int, language: str,
+                           google_available: bool) -> Tuple[str, float, bool]:
         """
-        WAV 파일에 대해 음성 인식을 수행합니다.
+        인식 구간 하나를 텍스트로 변환합니다 (Google 실패 시 Sphinx).
         
         Args:
-            wav_file_path: WAV 파일 경로
+            segment: 구간 신호 (모노, -1.0 - 1.0)
+            sample_rate: 샘플레이트
+            language: 인식 언어 코드
+            google_available: Google API를 시도할지 여부 (앞 구간에서 API 오류가 났으면 False)
             
         Returns:
-            Dict: 인식 결과
+            Tuple: (텍스트, 신뢰도, 다음 구간에서 Google API를 시도할지 여부)
         """
-        try:
-            # 음성 파일 로드
-            with sr.AudioFile(wav_file_path) as source:
-                # 배경 소음 제거
-                self.recognizer.adjust_for_ambient_noise(source)
-                
-                # 음성 데이터 읽기
-                audio_data = self.recognizer.record(source)
-                
-                # 음성 파일 길이 계산
-                duration = len(audio_data.frame_data) / audio_data.sample_rate
-            
+        import speech_recognition as sr
+        
+        # 디코딩한 샘플을 그대로 인식 엔진에 전달 (파일로 다시 쓰거나 읽지 않음)
+        pcm = (np.clip(segment, -1.0, 1.0) * 32767.0).round().astype("<i2").tobytes()
+        audio_data = sr.AudioData(pcm, sample_rate, 2)
+        
+        if google_available:
             # Google Speech Recognition API 사용 (무료)
             try:
                 text = self.recognizer.recognize_google(
                     audio_data, 
-                    language='ko-KR',  # 한국어 설정
+                    language=language,
                     show_all=False
                 )
-                
-                return {
-                    "text": text,
-                    "confidence": 0.8,  # Google API는 신뢰도 점수를 제공하지 않음
-                    "duration": duration
-                }
+                return text, 0.8, True  # Google API는 신뢰도 점수를 제공하지 않음
                 
             except sr.UnknownValueError:
                 logger.warning("음성을 인식할 수 없습니다.")
-                return {
-                    "text": "",
-                    "confidence": 0.0,
-                    "duration": duration
-                }
+                return "", 0.0, True
                 
             except sr.RequestError as e:
                 logger.error(f"Google Speech Recognition API 오류: {str(e)}")
-                # 대체 방법으로 Sphinx 엔진 사용
-                return self._fallback_recognition(audio_data, duration)
-                
-        except Exception as e:
-            logger.error(f"음성 인식 중 오류: {str(e)}")
-            return {
-                "text": "",
-                "confidence": 0.0,
-                "duration": 0
-            }
-    
-    def _fallback_recognition(self, audio_data, duration: float) -> Dict[str, any]:
-        """
-        Google API 실패 시 대체 음성 인식 엔진 사용
+                google_available = False
         
-        Args:
-            audio_data: 음성 데이터
-            duration: 음성 길이
-            
-        Returns:
-            Dict: 인식 결과
-        """
+        # 대체 방법으로 PocketSphinx 엔진 사용 (오프라인)
         try:
-            # PocketSphinx 엔진 사용 (오프라인)
-            text = self.recognizer.recognize_sphinx(audio_data, language='ko-KR')
-            
-            return {
-                "text": text,
-                "confidence": 0.6,  # 대체 엔진은 낮은 신뢰도
-                "duration": duration
-            }
+            text = self.recognizer.recognize_sphinx(audio_data, language=language)
+            return text, 0.6, google_available  # 대체 엔진은 낮은 신뢰도
             
         except Exception as e:
             logger.error(f"대체 음성 인식 엔진 오류: {str(e)}")
-            return {
-                "text": "",
-                "confidence": 0.0,
-                "duration": duration
-            }
+            return "", 0.0, google_available
     
     def analyze_audio_properties(self, audio_file) -> Dict[str, any]:
         """
-        음성 파일의 기본적인 속성을 분석합니다.
+        음성 파일의 기본적인 속성을 분석합니다 (블록 단위 디코딩, 파일 전체를 메모리에 올리지 않음).
+        음성 인식도 할 때는 audio_to_text 결과의 audio_properties를 사용합니다 (다시 디코딩하지 않음).
         
         Args:
-            audio_file: 음성 파일
+            audio_file: 음성 파일 (파일 객체 또는 경로)
             
         Returns:
             Dict: 음성 속성 분석 결과
         """
         try:
-            # 파일 내용 읽기
-            audio_content = audio_file.read()
-            
-            # 임시 파일로 저장
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as temp_file:
-                temp_file.write(audio_content)
-                temp_file_path = temp_file.name
-            
-            # AudioSegment로 분석
-            audio = AudioSegment.from_file(temp_file_path)
-            
-            properties = {
-                "duration": len(audio) / 1000.0,  # 초 단위
-                "sample_rate": audio.frame_rate,
-                "channels": audio.channels,
-                "bit_depth": audio.sample_width * 8,
-                "file_size": len(audio_content),
-                "loudness": audio.dBFS,  # 데시벨 단위
-                "format": "audio/wav"
-            }
-            
-            # 임시 파일 정리
-            os.unlink(temp_file_path)
+            with _local_path(audio_file) as audio_path, PcmStream(audio_path, self.target_sample_rate) as stream:
+                squares = 0.0
+                samples = 0
+                for block in stream:
+                    squares += float(np.dot(block, block))
+                    samples += len(block)
+                info = stream.info
+                file_size = os.path.getsize(audio_path)
             
-            return properties
+            return _audio_properties(info, file_size, squares, samples)
             
         except Exception as e:
             logger.error(f"음성 속성 분석 중 오류: {str(e)}")
-            return {
-                "duration": 0,
-                "sample_rate": 0,
-                "channels": 0,
-                "bit_depth": 0,
-                "file_size": 0,
-                "loudness": 0,
-                "format": "unknown"
-            }
\ No newline at end of file
+            return dict(EMPTY_AUDIO_PROPERTIES)
+
+
+# 음성 속성을 분석할 수 없을 때의 값
+EMPTY_AUDIO_PROPERTIES = {
+    "duration": 0,
+    "sample_rate": 0,
+    "channels": 0,
+    "bit_depth": 0,
+    "file_size": 0,
+    "loudness": 0,
+    "format": "unknown"
+}
+
+
+def _audio_properties(info: Dict[str, any], file_size: int, squares: float, samples: int) -> Dict[str, any]:
+    """디코딩 정보와 샘플 제곱합으로 음성 속성을 만듭니다."""
+    rms = math.sqrt(squares / samples) if samples else 0.0
+    return {
+        "duration": samples / info["sample_rate"] if info["sample_rate"] else 0,  # 초 단위
+        "sample_rate": info["original_sample_rate"],
+        "channels": info["original_channels"],
+        "bit_depth": info["sample_width"] * 8,
+        "file_size": file_size,
+        "loudness": 20 * math.log10(rms) if rms > 0 else -float("inf"),  # 데시벨 단위 (dBFS)
+        "format": f"audio/{info['format']}"
+    }
+
+
+def _is_audible(segment: np.ndarray, sample_rate: int) -> bool:
+    """에너지 최소 임계값을 넘는 프레임이 있는지 여부 (디지털 무음이면 인식하지 않음)"""
+    return bool(len(segment)) and float(frame_energies(segment, sample_rate).max()) > MIN_ENERGY_THRESHOLD
+
+
+@contextmanager
+def local_audio_file(audio_file) -> Iterator[Tuple[str, str]]:
+    """
+    음성 파일의 로컬 경로와 내용 키(file_key)를 반환합니다.
+    파일 객체는 임시 파일로 나누어 복사하면서 같은 읽기로 내용 키를 계산하고(업로드를 한 번만 읽음) 사용 후 지웁니다.
+    """
+    if isinstance(audio_file, str):
+        yield audio_file, file_key(audio_file)
+        return
+    
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.audio') as temp_file:
+        content_key = file_key(audio_file, copy_to=temp_file)
+        temp_file_path = temp_file.name
+    try:
+        yield temp_file_path, content_key
+    finally:
+        os.unlink(temp_file_path)
+
+
+@contextmanager
+def _local_path(audio_file) -> Iterator[str]:
+    """
+    음성 파일의 로컬 경로를 반환합니다.
+    파일 객체는 임시 파일로 나누어 복사하고(메모리에 한 번에 올리지 않음) 사용 후 지웁니다.
+    """
+    if isinstance(audio_file, str):
+        yield audio_file
+        return
+    
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.audio') as temp_file:
+        shutil.copyfileobj(audio_file, temp_file, 1024 * 1024)
+        temp_file_path = temp_file.name
+    try:
+        yield temp_file_path
+    finally:
+        os.unlink(temp_file_path)
@@ -0,0 +1,264 @@
+"""
+한국어 텍스트 정규화 서비스
+띄어쓰기, 한글 자모/호환 문자, 조사를 일정한 형태로 맞춰 키워드 매칭에 사용합니다.
+다른 언어 팩용으로 조사 처리를 하지 않는 정규화기(띄어 쓰지 않는 언어, 단어 단위로 띄어 쓰는 언어)도 제공합니다.
+"""
+
+import re
+import unicodedata
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+
+# 보이지 않는 문자 (폭 없는 공백/결합자, 소프트 하이픈 등 - 단어 경계로 보지 않고 토큰 안에서 지움)
+_INVISIBLE_CHARS = "\u00ad\u200b\u200c\u200d\u2060\ufeff"
+_INVISIBLE_TABLE = str.maketrans("", "", _INVISIBLE_CHARS)
+
+# 정규화 대상 토큰 (기존 전처리와 같이 문자/숫자 연속 구간, 중간의 보이지 않는 문자 포함)
+_TOKEN_PATTERN = re.compile(rf"\w(?:[\w{_INVISIBLE_CHARS}]*\w)?")
+
+# 한글 자모(첫가끝 자모, 호환 자모)가 포함된 토큰만 조합 단계를 거칩니다
+_JAMO_PATTERN = re.compile('[ᄀ-ᇿㄱ-ㆎ]')
+
+# 조사 목록 (긴 조사를 먼저 검사)
+_PARTICLES = tuple(sorted([
+    "에게서", "으로는", "에서는", "께서는",
+    "에서", "에게", "께서", "으로", "부터", "까지", "한테",
+    "은", "는", "이", "가", "을", "를", "에", "의", "도", "만", "로", "와", "과", "랑"
+], key=len, reverse=True))
+
+# 조사를 떼고 남아야 하는 최소 어간 길이
+_MIN_STEM_LENGTH = 2
+
+# 한글 음절 조합 상수
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_LAST = 0xD7A3
+_FINAL_COUNT = 28
+
+# 첫소리(초성) 자모 → 끝소리(종성) 인덱스 테이블
+# NFKC는 호환 자음을 초성으로 바꾸므로 받침 자리에 온 자음을 종성으로 되돌릴 때 사용합니다
+_INITIAL_TO_FINAL: Dict[int, int] = {
+    0x1100: 1, 0x1101: 2, 0x1102: 4, 0x1103: 7, 0x1105: 8, 0x1106: 16,
+    0x1107: 17, 0x1109: 19, 0x110A: 20, 0x110B: 21, 0x110C: 22, 0x110E: 23,
+    0x110F: 24, 0x1110: 25, 0x1111: 26, 0x1112: 27,
+}
+
+
+class NormalizedText(NamedTuple):
+    """정규화 결과"""
+    text: str       # 토큰을 공백으로 이은 정규화 텍스트 (패턴 분석용)
+    compact: str    # 조사를 떼고 공백 없이 이은 텍스트 (키워드 매칭용, 단어 정규화기는 단어 앞뒤에 경계 공백)
+    stem_starts: Tuple[int, ...] = ()               # 토큰별 압축 텍스트 시작 위치
+    raw_spans: Tuple[Tuple[int, int], ...] = ()     # 토큰별 원본 텍스트 구간
+    boundaries: Tuple[int, ...] = ()                # 붙여 쓴 토큰 경계의 압축 텍스트 위치 (경계 문자를 넣는 정규화기는 없음)
+
+    def raw_span(self, start: int, end: int) -> Tuple[int, int]:
+        """
+        압축 텍스트 구간을 원본 텍스트 구간으로 변환합니다.
+        정규화로 토큰 길이가 달라진 경우(자모 조합 등)에는 토큰 범위 안으로 맞춥니다.
+
+        Args:
+            start: 압축 텍스트 시작 위치
+            end: 압축 텍스트 끝 위치 (포함하지 않음)
+
+        Returns:
+            Tuple[int, int]: 원본 텍스트 (시작, 끝) 위치
+        """
+        return self._raw_offset(start, is_end=False), self._raw_offset(end - 1, is_end=True)
+
+    def _raw_offset(self, position: int, is_end: bool) -> int:
+        index = bisect_right(self.stem_starts, position) - 1
+        raw_start, raw_end = self.raw_spans[index]
+        offset = raw_start + (position - self.stem_starts[index])
+        return min(offset + 1, raw_end) if is_end else min(offset, raw_end - 1)
+
+
+class KoreanNormalizer:
+    """
+    한국어 정규화기 클래스
+    토큰 단위 정규화 결과를 LRU 캐시에 저장하므로 반복되는 토큰은 다시 계산하지 않습니다.
+    """
+
+    # 언어 팩/내보내기 파일에서 정규화기를 고르는 이름
+    KIND = "korean"
+    # 떼어낼 조사 목록
+    PARTICLES: Tuple[str, ...] = _PARTICLES
+    # 압축 텍스트에서 토큰 사이에 넣을 경계 문자 (빈 문자열이면 토큰을 붙여 씀)
+    WORD_BOUNDARY = ""
+
+    def __init__(self, protected_words: Iterable[str] = (), cache_size: int = 8192):
+        """
+        정규화기 초기화
+
+        Args:
+            protected_words: 조사를 떼지 않을 단어 목록 (예: 키워드 "시간이 없어", "바로")
+            cache_size: 토큰 정규화 LRU 캐시 크기
+        """
+        # 조사별로 보호할 어미를 미리 모아둡니다 (str.endswith에 튜플로 전달)
+        endings: Dict[str, List[str]] = {}
+        for word in protected_words:
+            for token in self.tokenize(word):
+                for particle in self.PARTICLES:
+                    if token.endswith(particle):
+                        endings.setdefault(particle, []).append(token)
+        self._protected_endings: Dict[str, Tuple[str, ...]] = {
+            particle: tuple(tokens) for particle, tokens in endings.items()
+        }
+
+        self._normalize_token = lru_cache(maxsize=cache_size)(self._normalize_token_uncached)
+
+    def to_state(self) -> Dict[str, any]:
+        """내보내기용 설정 (JSON 직렬화 가능)"""
+        return {
+            "kind": self.KIND,
+            "particles": list(self.PARTICLES),
+            "word_boundary": self.WORD_BOUNDARY,
+            "min_stem_length": _MIN_STEM_LENGTH,
+            "protected_endings": {particle: list(tokens) for particle, tokens in self._protected_endings.items()}
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, any], cache_size: int = 8192) -> "KoreanNormalizer":
+        """
+        내보낸 설정으로 정규화기를 복원합니다 (보호 단어를 다시 토큰화하지 않음).
+
+        Raises:
+            ValueError: 어간 최소 길이가 현재 구현과 다른 경우
+        """
+        if state.get("min_stem_length", _MIN_STEM_LENGTH) != _MIN_STEM_LENGTH:
+            raise ValueError(f"지원하지 않는 어간 최소 길이입니다: {state['min_stem_length']}")
+        normalizer = cls(cache_size=cache_size)
+        normalizer.PARTICLES = tuple(state.get("particles", cls.PARTICLES))
+        normalizer.WORD_BOUNDARY = state.get("word_boundary", cls.WORD_BOUNDARY)
+        normalizer._protected_endings = {
+            particle: tuple(tokens) for particle, tokens in state.get("protected_endings", {}).items()
+        }
+        return normalizer
+
+    def normalize(self, text: str) -> NormalizedText:
+        """
+        텍스트를 정규화합니다.
+
+        Args:
+            text: 원본 텍스트
+
+        Returns:
+            NormalizedText: 정규화 텍스트, 매칭용 압축 텍스트, 원본 위치 정보
+        """
+        boundary = self.WORD_BOUNDARY
+        tokens = []
+        stems = []
+        stem_starts = []
+        raw_spans = []
+        compact_length = len(boundary)
+        for match in _TOKEN_PATTERN.finditer(text):
+            token, stem = self._normalize_token(match.group())
+            tokens.append(token)
+            stems.append(stem)
+            # 매칭 위치를 원본 텍스트로 되돌리기 위한 토큰 위치 (정규화와 같은 순회에서 기록)
+            stem_starts.append(compact_length)
+            raw_spans.append(match.span())
+            compact_length += len(stem) + len(boundary)
+
+        return NormalizedText(
+            text=" ".join(tokens),
+            compact=boundary.join(["", *stems, ""]) if boundary and stems else "".join(stems),
+            stem_starts=tuple(stem_starts),
+            raw_spans=tuple(raw_spans),
+            boundaries=() if boundary else tuple(stem_starts[1:])
+        )
+
+    def normalize_keyword(self, keyword: str) -> str:
+        """
+        키워드를 매칭용 압축 형태로 정규화합니다.
+        "계좌 이체"와 "계좌이체"는 같은 결과가 됩니다.
+
+        Args:
+            keyword: 원본 키워드
+
+        Returns:
+            str: 압축 키워드
+        """
+        return self.normalize(keyword).compact
+
+    def tokenize(self, text: str) -> List[str]:
+        """조사 제거 없이 정규화한 토큰 목록을 반환합니다."""
+        return [self._canonicalize(match.group()) for match in _TOKEN_PATTERN.finditer(text)]
+
+    def cache_info(self):
+        """토큰 정규화 캐시 통계"""
+        return self._normalize_token.cache_info()
+
+    def _normalize_token_uncached(self, raw_token: str) -> Tuple[str, str]:
+        """토큰 하나를 정규화하고 조사를 뗀 어간을 함께 반환합니다."""
+        token = self._canonicalize(raw_token)
+        return token, self._strip_particle(token)
+
+    def _canonicalize(self, token: str) -> str:
+        """전각/호환 문자와 자모를 표준 음절로 바꾸고 소문자로 변환합니다."""
+        if not token.isascii():
+            token = unicodedata.normalize("NFKC", token.translate(_INVISIBLE_TABLE))
+            if _JAMO_PATTERN.search(token):
+                token = self._compose_jamo(token)
+        return token.lower()
+
+    def _compose_jamo(self, token: str) -> str:
+        """
+        NFKC 이후에도 남은 자모를 음절로 조합합니다.
+        받침 없는 음절 뒤에 온 초성 자음(모음이 뒤따르지 않는 경우)을 받침으로 붙입니다.
+        """
+        chars = list(token)
+        result = []
+        for index, char in enumerate(chars):
+            code = ord(char)
+            if result and code in _INITIAL_TO_FINAL:
+                previous = ord(result[-1])
+                next_code = ord(chars[index + 1]) if index + 1 < len(chars) else 0
+                followed_by_vowel = 0x1161 <= next_code <= 0x1175
+                if (_SYLLABLE_BASE <= previous <= _SYLLABLE_LAST
+                        and (previous - _SYLLABLE_BASE) % _FINAL_COUNT == 0
+                        and not followed_by_vowel):
+                    result[-1] = chr(previous + _INITIAL_TO_FINAL[code])
+                    continue
+            result.append(char)
+        return unicodedata.normalize("NFC", "".join(result))
+
+    def _strip_particle(self, token: str) -> str:
+        """토큰 끝의 조사를 제거합니다 (보호 단어와 짧은 어간은 제외)."""
+        for particle in self.PARTICLES:
+            if token.endswith(particle):
+                if len(token) - len(particle) < _MIN_STEM_LENGTH:
+                    return token
+                if token.endswith(self._protected_endings.get(particle, ())):
+                    return token
+                return token[:-len(particle)]
+        return token
+
+
+class UnsegmentedNormalizer(KoreanNormalizer):
+    """
+    띄어 쓰지 않는 언어(중국어 등)용 정규화기
+    한국어와 같이 토큰을 붙여 부분 문자열로 매칭하되 조사는 떼지 않습니다.
+    """
+
+    KIND = "unsegmented"
+    PARTICLES = ()
+
+
+class WordNormalizer(KoreanNormalizer):
+    """
+    단어 단위로 띄어 쓰는 언어(영어 등)용 정규화기
+    압축 텍스트와 키워드 앞뒤에 경계 공백을 두어 단어 단위로만 매칭합니다
+    (키워드 "fee"가 "coffee"에 매칭되지 않음, 매칭 위치에는 앞쪽 경계 공백이 포함됨).
+    """
+
+    KIND = "word"
+    PARTICLES = ()
+    WORD_BOUNDARY = " "
+
+
+# 언어 팩에서 이름으로 고르는 정규화기
+NORMALIZERS = {
+    normalizer.KIND: normalizer for normalizer in (KoreanNormalizer, UnsegmentedNormalizer, WordNormalizer)
+}
@@ -0,0 +1,131 @@
+"""
+분석 워커 풀 서비스
+부모 프로세스에서 만든 사기 탐지기를 fork로 자식 프로세스와 공유하고,
+CPU를 많이 쓰는 텍스트 분석을 여러 코어로 나누어 처리합니다.
+기본 언어 외의 언어 팩 탐지기는 각 워커가 처음 요청받을 때 만들어 자신의 LRU에 둡니다.
+"""
+
+import asyncio
+import gc
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+from loguru import logger
+
+from services.single_flight import SingleFlight, text_key
+
+
+# fork 직전에 설정되는 공유 탐지기 (자식 프로세스는 copy-on-write로 그대로 사용)
+_shared_detector = None
+_shared_language_packs = None
+
+
+def _analyze_in_worker(text: str, language: Optional[str] = None) -> Dict[str, any]:
+    """워커 프로세스에서 텍스트 하나를 분석합니다."""
+    if language is None or _shared_language_packs is None:
+        return _shared_detector.analyze_text(text)
+    return _shared_language_packs.detector(language).analyze_text(text)
+
+
+def _worker_ready(_: int) -> int:
+    """워커 프로세스가 준비되었는지 확인합니다."""
+    return os.getpid()
+
+
+class AnalysisWorkerPool:
+    """
+    분석 워커 풀 클래스
+    키워드 매처, 정규식, 대본 인덱스는 부모에서 한 번만 만들어지며
+    워커 수가 0이거나 fork를 지원하지 않는 환경에서는 현재 프로세스에서 분석합니다.
+    """
+
+    def __init__(self, fraud_detector, num_workers: int = 0, language_packs=None):
+        """
+        워커 풀 초기화
+
+        Args:
+            fraud_detector: 공유할 사기 탐지기 (부모 프로세스에서 생성)
+            num_workers: 워커 프로세스 수 (0이면 현재 프로세스에서 처리)
+            language_packs: 언어별 탐지기 관리자 (LanguagePacks, 없으면 기본 탐지기만 사용)
+        """
+        self.fraud_detector = fraud_detector
+        self.language_packs = language_packs
+        self.num_workers = num_workers
+        self.pending = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # 같은 텍스트가 동시에 들어오면 한 번만 분석 (워커가 없어도 적용)
+        self.in_flight = SingleFlight()
+
+        if num_workers > 0 and "fork" not in multiprocessing.get_all_start_methods():
+            logger.warning("fork를 지원하지 않는 환경입니다. 분석을 현재 프로세스에서 처리합니다.")
+            self.num_workers = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._executor is not None
+
+    def start(self) -> None:
+        """
+        워커 프로세스를 미리 fork합니다.
+        다른 스레드가 생기기 전(서버 시작 시점)에 호출해야 안전합니다.
+        """
+        global _shared_detector, _shared_language_packs
+
+        if self.num_workers <= 0 or self._executor is not None:
+            return
+
+        _shared_detector = self.fraud_detector
+        _shared_language_packs = self.language_packs
+
+        # 지금까지 만든 객체를 GC 추적 대상에서 제외해 자식에서 페이지가 복사되지 않도록 함
+        gc.collect()
+        gc.freeze()
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=multiprocessing.get_context("fork")
+        )
+        pids = set(self._executor.map(_worker_ready, range(self.num_workers)))
+        logger.info(f"분석 워커 {len(pids)}개를 시작했습니다. (공유 탐지기 fork)")
+
+    def shutdown(self) -> None:
+        """워커 프로세스를 종료합니다."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            logger.info("분석 워커를 종료했습니다.")
+
+    async def analyze_text(self, text: str, language: Optional[str] = None) -> Dict[str, any]:
+        """
+        텍스트를 분석합니다 (워커가 있으면 워커 프로세스, 없으면 스레드 풀에서 실행).
+        같은 텍스트의 분석이 진행 중이면 워커 수와 관계없이 새로 분석하지 않고 그 결과를 함께 받습니다.
+
+        Args:
+            text: 분석할 텍스트
+            language: 언어 코드 (LanguagePacks.resolve 결과, 없으면 기본 탐지기)
+
+        Returns:
+            Dict: 사기 분석 결과
+        """
+        key = text_key(text) if language is None else f"{language}:{text_key(text)}"
+        result, _ = await self.in_flight.run(key, lambda: self._analyze_in_executor(text, language))
+        return result
+
+    def detector(self, language: Optional[str] = None):
+        """현재 프로세스에서 사용할 언어별 탐지기"""
+        if language is None or self.language_packs is None:
+            return self.fraud_detector
+        return self.language_packs.detector(language)
+
+    async def _analyze_in_executor(self, text: str, language: Optional[str]) -> Dict[str, any]:
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            if self._executor is None:
+                # 워커가 없으면 기본 스레드 풀에서 분석 (이벤트 루프를 막지 않음)
+                return await loop.run_in_executor(None, self.detector(language).analyze_text, text)
+            return await loop.run_in_executor(self._executor, _analyze_in_worker, text, language)
+        finally:
+            self.pending -= 1
@@ -0,0 +1,378 @@
+"""
+대량 재채점 도구
+보관된 통화 기록(JSONL/CSV/Parquet)을 묶음 단위로 읽어 여러 프로세스에서 채점하고 JSONL로 저장합니다.
+입력 크기와 관계없이 메모리에는 처리 중인 묶음만 올라가며, 체크포인트로 중단된 위치부터 이어서 실행할 수 있습니다.
+
+사용 예 (backend 디렉터리에서):
+    python -m tools.bulk_score transcripts.jsonl -o scores.jsonl --workers 8
+    python -m tools.bulk_score archive.csv -o scores.jsonl --text-field transcript --id-field call_id --resume
+"""
+
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from loguru import logger
+
+
+DEFAULT_FIELDS = ("risk_score", "risk_level", "is_fraud_suspected", "keyword_matches")
+
+# (묶음 번호, ID 목록, 텍스트 목록)
+Chunk = Tuple[int, List[any], List[str]]
+
+# fork 직전에 설정되는 공유 탐지기와 출력 필드 (자식 프로세스는 copy-on-write로 그대로 사용)
+_shared_detector = None
+_shared_fields: Tuple[str, ...] = DEFAULT_FIELDS
+
+
+def _score_chunk(texts: List[str]) -> List[Dict[str, any]]:
+    """텍스트 묶음을 채점하고 필요한 필드만 남깁니다 (프로세스 간 전송량 절감)."""
+    results = []
+    for text in texts:
+        result = _shared_detector.analyze_text(text)
+        results.append({field: result.get(field) for field in _shared_fields})
+    return results
+
+
+def detect_format(path: str) -> str:
+    """파일 확장자로 입력 형식을 판단합니다."""
+    extension = os.path.splitext(path)[1].lower()
+    formats = {".jsonl": "jsonl", ".ndjson": "jsonl", ".json": "jsonl",
+               ".csv": "csv", ".parquet": "parquet", ".pq": "parquet"}
+    if extension not in formats:
+        raise ValueError(f"입력 형식을 알 수 없습니다: {path} (--format으로 지정)")
+    return formats[extension]
+
+
+def read_chunks(path: str, input_format: str, text_field: str, id_field: Optional[str],
+                chunk_size: int, skip: Set[int] = frozenset()) -> Iterator[Chunk]:
+    """
+    입력 파일을 묶음 단위로 읽습니다.
+
+    Args:
+        path: 입력 파일 경로
+        input_format: jsonl, csv, parquet
+        text_field: 텍스트 필드 이름
+        id_field: ID 필드 이름 (없으면 행 번호)
+        chunk_size: 묶음 크기
+        skip: 건너뛸 묶음 번호 (이어서 실행할 때 이미 처리한 묶음)
+
+    Yields:
+        Chunk: (묶음 번호, ID 목록, 텍스트 목록)
+    """
+    if input_format == "jsonl":
+        yield from _read_jsonl_chunks(path, text_field, id_field, chunk_size, skip)
+        return
+
+    if input_format == "csv":
+        import pandas as pd
+        columns = [text_field] + ([id_field] if id_field else [])
+        frames = pd.read_csv(path, usecols=columns, dtype=str, keep_default_na=False, chunksize=chunk_size)
+    elif input_format == "parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet 입력에는 pyarrow가 필요합니다: pip install pyarrow") from None
+        columns = [text_field] + ([id_field] if id_field else [])
+        batches = pq.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=columns)
+        frames = (batch.to_pandas() for batch in batches)
+    else:
+        raise ValueError(f"지원하지 않는 입력 형식입니다: {input_format}")
+
+    row = 0
+    for index, frame in enumerate(frames):
+        count = len(frame)
+        if index not in skip:
+            texts = frame[text_field].fillna("").astype(str).tolist()
+            ids = frame[id_field].tolist() if id_field else list(range(row, row + count))
+            yield index, ids, texts
+        row += count
+
+
+def _read_jsonl_chunks(path: str, text_field: str, id_field: Optional[str],
+                       chunk_size: int, skip: Set[int]) -> Iterator[Chunk]:
+    """JSONL을 묶음 단위로 읽습니다 (건너뛸 묶음은 JSON을 해석하지 않음)."""
+    index = 0
+    row = 0
+    lines: List[str] = []
+
+    def to_chunk() -> Chunk:
+        ids, texts = [], []
+        for offset, line in enumerate(lines):
+            record = json.loads(line)
+            texts.append(str(record.get(text_field) or ""))
+            ids.append(record.get(id_field) if id_field else row - len(lines) + offset)
+        return index, ids, texts
+
+    with open(path, encoding="utf-8") as source:
+        for line in source:
+            if not line.strip():
+                continue
+            lines.append(line)
+            row += 1
+            if len(lines) == chunk_size:
+                if index not in skip:
+                    yield to_chunk()
+                index += 1
+                lines = []
+        if lines and index not in skip:
+            yield to_chunk()
+
+
+class Checkpoint:
+    """
+    체크포인트 클래스
+    완료된 묶음 번호와 출력 파일 크기를 기록합니다. 이어서 실행할 때 출력 파일을 기록된 크기로
+    잘라내므로 체크포인트 이후에 쓰인 불완전한 결과는 중복되지 않습니다.
+    """
+
+    def __init__(self, path: str, input_path: str, chunk_size: int):
+        self.path = path
+        self.input_path = os.path.abspath(input_path)
+        self.chunk_size = chunk_size
+        self.completed: Set[int] = set()
+        self.output_bytes = 0
+        self.rows = 0
+
+    def load(self) -> bool:
+        """저장된 체크포인트를 읽습니다 (없으면 False)."""
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, encoding="utf-8") as checkpoint_file:
+            state = json.load(checkpoint_file)
+        if state["input"] != self.input_path or state["chunk_size"] != self.chunk_size:
+            raise ValueError("체크포인트의 입력 파일 또는 묶음 크기가 다릅니다. 같은 옵션으로 실행하세요.")
+
+        # 연속으로 완료된 묶음은 개수(watermark)로만 저장됨
+        self.completed = set(range(state["watermark"])) | set(state["completed"])
+        self.output_bytes = state["output_bytes"]
+        self.rows = state["rows"]
+        return True
+
+    def save(self, output_bytes: int) -> None:
+        """체크포인트를 저장합니다 (임시 파일에 쓴 뒤 교체)."""
+        self.output_bytes = output_bytes
+        watermark = 0
+        while watermark in self.completed:
+            watermark += 1
+        state = {
+            "input": self.input_path,
+            "chunk_size": self.chunk_size,
+            "watermark": watermark,
+            "completed": sorted(index for index in self.completed if index > watermark),
+            "output_bytes": output_bytes,
+            "rows": self.rows
+        }
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as checkpoint_file:
+            json.dump(state, checkpoint_file)
+        os.replace(temp_path, self.path)
+
+
+def _output_size(path: str) -> int:
+    """출력 파일 크기 (없으면 -1)"""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return -1
+
+
+class _InlineExecutor(Executor):
+    """워커 없이 현재 프로세스에서 실행하는 실행기 (--workers 0)"""
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+def bulk_score(input_path: str, output_path: str, fraud_detector, input_format: Optional[str] = None,
+               text_field: str = "text", id_field: Optional[str] = None, fields: Tuple[str, ...] = DEFAULT_FIELDS,
+               workers: int = 0, chunk_size: int = 1000, ordered: bool = True, resume: bool = False,
+               checkpoint_path: Optional[str] = None, checkpoint_every: float = 5.0,
+               progress_every: float = 10.0) -> Dict[str, any]:
+    """
+    입력 파일 전체를 채점합니다.
+
+    Args:
+        input_path: 입력 파일 경로
+        output_path: 출력 JSONL 경로
+        fraud_detector: 사용할 사기 탐지기 (워커에 fork로 공유)
+        input_format: jsonl, csv, parquet (없으면 확장자로 판단)
+        text_field: 텍스트 필드 이름
+        id_field: ID 필드 이름 (없으면 행 번호)
+        fields: 출력할 분석 결과 필드
+        workers: 워커 프로세스 수 (0이면 현재 프로세스)
+        chunk_size: 묶음 크기
+        ordered: 입력 순서대로 출력할지 여부 (False면 끝난 묶음부터 출력)
+        resume: 체크포인트에서 이어서 실행할지 여부
+        checkpoint_path: 체크포인트 경로 (없으면 출력 경로 + ".ckpt")
+        checkpoint_every: 체크포인트 저장 간격 (초)
+        progress_every: 처리량 보고 간격 (초)
+
+    Returns:
+        Dict: 처리 요약 (행 수, 사기 의심 수, 소요 시간, 초당 처리 건수)
+    """
+    global _shared_detector, _shared_fields
+
+    input_format = input_format or detect_format(input_path)
+    checkpoint = Checkpoint(checkpoint_path or output_path + ".ckpt", input_path, chunk_size)
+
+    resumed = resume and checkpoint.load()
+    if resumed and _output_size(output_path) < checkpoint.output_bytes:
+        # 출력 파일이 지워졌거나 체크포인트보다 짧으면 이어 쓸 수 없으므로 처음부터 다시 실행
+        logger.warning(f"출력 파일이 없거나 체크포인트({checkpoint.output_bytes}바이트)보다 짧아 처음부터 다시 실행합니다: "
+                       f"{output_path}")
+        checkpoint = Checkpoint(checkpoint.path, input_path, chunk_size)
+        resumed = False
+
+    if resumed:
+        output = open(output_path, "r+b")
+        output.truncate(checkpoint.output_bytes)
+        output.seek(checkpoint.output_bytes)
+        logger.info(f"체크포인트에서 이어서 실행합니다: 묶음 {len(checkpoint.completed)}개, {checkpoint.rows}건 완료")
+    else:
+        output = open(output_path, "wb")
+
+    _shared_detector = fraud_detector
+    _shared_fields = tuple(fields)
+
+    if workers > 0 and "fork" in multiprocessing.get_all_start_methods():
+        gc.collect()
+        gc.freeze()
+        executor: Executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"))
+    else:
+        executor = _InlineExecutor()
+
+    # 처리 중인 묶음 + 순서를 기다리는 묶음 수를 제한해 메모리를 일정하게 유지
+    max_in_flight = max(2, workers * 2)
+    pending: Dict[Future, Chunk] = {}
+    finished: Dict[int, Tuple[Chunk, List[Dict[str, any]]]] = {}
+    next_index = 0
+
+    started = time.perf_counter()
+    last_checkpoint = last_progress = started
+    rows_this_run = 0
+    suspected = 0
+
+    def write(chunk: Chunk, results: List[Dict[str, any]]) -> None:
+        nonlocal rows_this_run, suspected
+        index, ids, _ = chunk
+        lines = []
+        for record_id, result in zip(ids, results):
+            lines.append(json.dumps({"id": record_id, **result}, ensure_ascii=False, default=str))
+            if result.get("is_fraud_suspected"):
+                suspected += 1
+        output.write(("\n".join(lines) + "\n").encode("utf-8"))
+        checkpoint.completed.add(index)
+        checkpoint.rows += len(ids)
+        rows_this_run += len(ids)
+
+    def drain(block: bool) -> None:
+        nonlocal next_index, last_checkpoint, last_progress
+        if not pending:
+            return
+        done, _ = wait(list(pending), timeout=None if block else 0, return_when=FIRST_COMPLETED)
+        for future in done:
+            chunk = pending.pop(future)
+            if ordered:
+                finished[chunk[0]] = (chunk, future.result())
+            else:
+                write(chunk, future.result())
+
+        # 순서 유지: 다음 차례 묶음부터 연속으로 출력 (이전 실행에서 끝난 묶음은 건너뜀)
+        while True:
+            while next_index in checkpoint.completed:
+                next_index += 1
+            if next_index not in finished:
+                break
+            write(*finished.pop(next_index))
+
+        now = time.perf_counter()
+        if now - last_checkpoint >= checkpoint_every:
+            output.flush()
+            checkpoint.save(output.tell())
+            last_checkpoint = now
+        if now - last_progress >= progress_every:
+            elapsed = now - started
+            logger.info(f"진행: {checkpoint.rows}건 완료, {rows_this_run / elapsed:.0f}건/초")
+            last_progress = now
+
+    try:
+        for chunk in read_chunks(input_path, input_format, text_field, id_field, chunk_size, checkpoint.completed):
+            while len(pending) + len(finished) >= max_in_flight:
+                drain(block=True)
+            pending[executor.submit(_score_chunk, chunk[2])] = chunk
+            drain(block=False)
+
+        while pending:
+            drain(block=True)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        output.flush()
+        checkpoint.save(output.tell())
+        output.close()
+
+    elapsed = time.perf_counter() - started
+    summary = {
+        "rows": checkpoint.rows,
+        "rows_this_run": rows_this_run,
+        "fraud_suspected_this_run": suspected,
+        "elapsed_seconds": round(elapsed, 2),
+        "docs_per_second": round(rows_this_run / elapsed, 1) if elapsed > 0 else 0.0
+    }
+    logger.info(f"채점 완료: {summary}")
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """보관된 통화 기록을 대량으로 재채점합니다."""
+    parser = argparse.ArgumentParser(description="통화 기록 파일을 사기 탐지기로 대량 재채점합니다.")
+    parser.add_argument("input", help="입력 파일 (JSONL, CSV, Parquet)")
+    parser.add_argument("-o", "--output", required=True, help="출력 JSONL 파일")
+    parser.add_argument("--format", choices=["jsonl", "csv", "parquet"], help="입력 형식 (기본: 확장자로 판단)")
+    parser.add_argument("--text-field", default="text", help="텍스트 필드 이름")
+    parser.add_argument("--id-field", help="ID 필드 이름 (기본: 행 번호)")
+    parser.add_argument("--fields", default=",".join(DEFAULT_FIELDS), help="출력할 분석 결과 필드 (쉼표로 구분)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="워커 프로세스 수 (0이면 현재 프로세스)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="묶음 크기")
+    parser.add_argument("--unordered", action="store_true", help="끝난 묶음부터 출력 (입력 순서 유지 안 함)")
+    parser.add_argument("--resume", action="store_true", help="체크포인트에서 이어서 실행")
+    parser.add_argument("--checkpoint", help="체크포인트 파일 (기본: 출력 파일 + .ckpt)")
+    parser.add_argument("--rules", help="가산점/위험 등급 규칙 파일 (기본: 설정값)")
+    parser.add_argument("--progress-every", type=float, default=10.0, help="처리량 보고 간격 (초)")
+    args = parser.parse_args(argv)
+
+    from api.dependencies import create_fraud_detector
+
+    # 건별 분석 로그는 끄고 진행 상황만 출력
+    logger.disable("services")
+    fraud_detector = create_fraud_detector(scoring_rules_path=args.rules)
+
+    summary = bulk_score(
+        args.input, args.output, fraud_detector,
+        input_format=args.format,
+        text_field=args.text_field,
+        id_field=args.id_field,
+        fields=tuple(field.strip() for field in args.fields.split(",") if field.strip()),
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        ordered=not args.unordered,
+        resume=args.resume,
+        checkpoint_path=args.checkpoint,
+        progress_every=args.progress_every
+    )
+    print(json.dumps(summary, ensure_ascii=False), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""
+라벨 평가 도구
+위험도 라벨이 있는 말뭉치(data/test_scenarios.py, 외부 JSONL)를 여러 채점 엔진으로 분석해
+위험 등급 혼동 행렬, 사기 의심 판정의 정밀도/재현율, 초당 처리 건수를 비교합니다.
+
+사용 예 (backend 디렉터리에서):
+    python -m tools.evaluate
+    python -m tools.evaluate --jsonl labeled.jsonl --engines keyword,ml,combined
+    python -m tools.evaluate --engines keyword,keyword:candidate.json --json report.json
+
+엔진 지정 형식은 "이름" 또는 "이름:인자"이며, keyword 엔진의 인자는 섀도 평가와 같은
+후보 탐지기 설정 파일(JSON)입니다.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import time
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+
+RISK_LEVELS = ["VERY_LOW", "LOW", "MEDIUM", "HIGH", "VERY_HIGH"]
+
+# 라벨에 사기 여부가 없으면 이 등급들을 사기로 봄
+FRAUD_LEVELS = {"HIGH", "VERY_HIGH"}
+
+SCENARIO_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data", "test_scenarios.py")
+
+# 엔진: (텍스트 목록, 사기 여부 라벨, 인자) → risk_score, risk_level, is_fraud_suspected 열을 가진 표
+Engine = Callable[[List[str], np.ndarray, Optional[str]], pd.DataFrame]
+
+ENGINES: Dict[str, Engine] = {}
+
+
+def register_engine(name: str) -> Callable[[Engine], Engine]:
+    """채점 엔진을 등록합니다 (--engines에서 이름으로 사용)."""
+    def decorator(engine: Engine) -> Engine:
+        ENGINES[name] = engine
+        return engine
+    return decorator
+
+
+def load_scenarios(path: str = SCENARIO_PATH) -> pd.DataFrame:
+    """data/test_scenarios.py의 시나리오를 불러옵니다."""
+    spec = importlib.util.spec_from_file_location("test_scenarios", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return pd.DataFrame([
+        {"text": scenario["text"], "expected_risk": scenario["expected_risk"], "source": "scenarios"}
+        for scenario in module.ALL_SCENARIOS
+    ])
+
+
+def load_jsonl(path: str, text_field: str, label_field: str, fraud_field: str) -> pd.DataFrame:
+    """
+    라벨 JSONL을 불러옵니다.
+    각 줄에는 텍스트와 함께 위험 등급 라벨 또는 사기 여부 라벨 중 하나 이상이 있어야 합니다.
+    """
+    frame = pd.read_json(path, lines=True, dtype=False)
+    columns = {text_field: "text", label_field: "expected_risk", fraud_field: "is_fraud"}
+    frame = frame.rename(columns=columns)[[column for column in columns.values() if column in frame]]
+    frame["source"] = os.path.basename(path)
+    return frame
+
+
+def prepare_labels(frame: pd.DataFrame) -> pd.DataFrame:
+    """사기 여부 라벨이 없는 행은 위험 등급 라벨에서 만듭니다."""
+    frame = frame.reset_index(drop=True)
+    if "expected_risk" not in frame:
+        frame["expected_risk"] = None
+    from_level = frame["expected_risk"].isin(FRAUD_LEVELS)
+    if "is_fraud" in frame:
+        frame["is_fraud"] = frame["is_fraud"].where(frame["is_fraud"].notna(), from_level).astype(bool)
+    else:
+        frame["is_fraud"] = from_level
+    frame["text"] = frame["text"].fillna("").astype(str)
+    return frame
+
+
+def _results_frame(results: List[Dict[str, any]]) -> pd.DataFrame:
+    return pd.DataFrame({
+        "risk_score": [result.get("risk_score", 0.0) for result in results],
+        "risk_level": [result.get("risk_level") for result in results],
+        "is_fraud_suspected": [bool(result.get("is_fraud_suspected")) for result in results]
+    })
+
+
+@lru_cache(maxsize=None)
+def _create_detector(config_path: Optional[str]):
+    """탐지기 생성 (엔진 간 공유, 생성 시간은 처리량에서 제외)"""
+    from api.dependencies import create_fraud_detector
+    from services.fraud_detector import FraudDetector
+    from services.shadow import ShadowEvaluator
+
+    if not config_path:
+        return create_fraud_detector()
+    return FraudDetector(**ShadowEvaluator.load_config(config_path))
+
+
+@register_engine("keyword")
+def keyword_engine(texts: List[str], labels: np.ndarray, config_path: Optional[str] = None) -> pd.DataFrame:
+    """키워드/규칙 기반 사기 탐지기 (인자: 후보 탐지기 설정 JSON)"""
+    detector = _create_detector(config_path)
+    return _results_frame([detector.analyze_text(text) for text in texts])
+
+
+@register_engine("ml")
+def ml_engine(texts: List[str], labels: np.ndarray, folds: Optional[str] = None) -> pd.DataFrame:
+    """
+    글자 n-gram TF-IDF + 로지스틱 회귀 (scikit-learn).
+    학습된 모델이 따로 없으므로 평가 말뭉치에서 교차 검증 예측(인자: 폴드 수, 기본 5)을 사용합니다.
+    """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.model_selection import StratifiedKFold, cross_val_predict
+    from sklearn.pipeline import make_pipeline
+
+    minority = int(min(labels.sum(), len(labels) - labels.sum()))
+    n_splits = min(int(folds or 5), minority)
+    if n_splits < 2:
+        raise ValueError("ml 엔진 교차 검증에는 사기/정상 라벨이 각각 2건 이상 필요합니다")
+
+    model = make_pipeline(
+        TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 3), sublinear_tf=True),
+        LogisticRegression(max_iter=1000, class_weight="balanced")
+    )
+    cv = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=0)
+    probabilities = cross_val_predict(model, texts, labels, cv=cv, method="predict_proba")[:, 1]
+    return _scores_to_frame(probabilities * 10.0)
+
+
+@register_engine("combined")
+def combined_engine(texts: List[str], labels: np.ndarray, argument: Optional[str] = None) -> pd.DataFrame:
+    """키워드 엔진과 ml 엔진 점수의 평균 (인자: 후보 탐지기 설정 JSON)"""
+    keyword_scores = keyword_engine(texts, labels, argument)["risk_score"].to_numpy()
+    ml_scores = ml_engine(texts, labels)["risk_score"].to_numpy()
+    return _scores_to_frame((keyword_scores + ml_scores) / 2.0)
+
+
+def _scores_to_frame(scores: np.ndarray) -> pd.DataFrame:
+    """점수만 내는 엔진의 위험 등급/사기 의심 여부를 기본 탐지기 기준으로 정합니다."""
+    detector = _create_detector(None)
+    no_features = {name: False for name in detector.rule_set.features}
+    return pd.DataFrame({
+        "risk_score": scores,
+        "risk_level": [detector.rule_set.level(no_features, float(score)) for score in scores],
+        "is_fraud_suspected": scores >= detector.suspicion_threshold
+    })
+
+
+def evaluate_engine(name: str, argument: Optional[str], frame: pd.DataFrame) -> Dict[str, any]:
+    """
+    엔진 하나를 평가합니다.
+
+    Args:
+        name: 엔진 이름
+        argument: 엔진 인자
+        frame: 라벨 말뭉치 (text, expected_risk, is_fraud)
+
+    Returns:
+        Dict: 혼동 행렬, 정밀도/재현율, 처리량
+    """
+    labels = frame["is_fraud"].to_numpy(dtype=bool)
+    started = time.perf_counter()
+    predictions = ENGINES[name](frame["text"].tolist(), labels, argument)
+    elapsed = time.perf_counter() - started
+
+    predicted = predictions["is_fraud_suspected"].to_numpy(dtype=bool)
+    true_positive = int(np.sum(predicted & labels))
+    false_positive = int(np.sum(predicted & ~labels))
+    false_negative = int(np.sum(~predicted & labels))
+    true_negative = int(np.sum(~predicted & ~labels))
+    precision = true_positive / (true_positive + false_positive) if true_positive + false_positive else 0.0
+    recall = true_positive / (true_positive + false_negative) if true_positive + false_negative else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+
+    # 위험 등급 라벨이 있는 행만 등급 혼동 행렬에 포함
+    has_level = frame["expected_risk"].isin(RISK_LEVELS).to_numpy()
+    expected = pd.Categorical(frame["expected_risk"][has_level], categories=RISK_LEVELS)
+    actual = pd.Categorical(predictions["risk_level"][has_level], categories=RISK_LEVELS)
+    confusion = pd.crosstab(expected, actual, rownames=["expected"], colnames=["predicted"], dropna=False)
+    level_accuracy = float(np.mean(np.asarray(expected) == np.asarray(actual))) if has_level.any() else None
+
+    return {
+        "engine": f"{name}:{argument}" if argument else name,
+        "documents": len(frame),
+        "elapsed_seconds": round(elapsed, 4),
+        "docs_per_second": round(len(frame) / elapsed, 1) if elapsed > 0 else None,
+        "fraud_suspected": {
+            "precision": round(precision, 4),
+            "recall": round(recall, 4),
+            "f1": round(f1, 4),
+            "true_positive": true_positive,
+            "false_positive": false_positive,
+            "false_negative": false_negative,
+            "true_negative": true_negative
+        },
+        "risk_level_accuracy": round(level_accuracy, 4) if level_accuracy is not None else None,
+        "risk_level_confusion": confusion.to_dict(orient="index"),
+        "mean_score_by_label": {
+            "fraud": round(float(predictions["risk_score"][labels].mean()), 3) if labels.any() else None,
+            "normal": round(float(predictions["risk_score"][~labels].mean()), 3) if (~labels).any() else None
+        }
+    }
+
+
+def print_report(report: Dict[str, any]) -> None:
+    """평가 결과를 표로 출력합니다."""
+    fraud = report["fraud_suspected"]
+    print(f"=== {report['engine']} ({report['documents']}건, {report['docs_per_second']}건/초) ===")
+    print(f"사기 의심 판정 - 정밀도 {fraud['precision']:.3f}, 재현율 {fraud['recall']:.3f}, F1 {fraud['f1']:.3f} "
+          f"(TP {fraud['true_positive']}, FP {fraud['false_positive']}, "
+          f"FN {fraud['false_negative']}, TN {fraud['true_negative']})")
+    if report["risk_level_accuracy"] is not None:
+        print(f"위험 등급 정확도: {report['risk_level_accuracy']:.3f}")
+        confusion = pd.DataFrame.from_dict(report["risk_level_confusion"], orient="index")
+        confusion.index.name = "expected \\ predicted"
+        print(confusion.to_string())
+    print()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """라벨 말뭉치로 채점 엔진을 평가합니다."""
+    parser = argparse.ArgumentParser(description="라벨 말뭉치로 사기 탐지 엔진의 정확도와 처리량을 비교합니다.")
+    parser.add_argument("--jsonl", nargs="*", default=[], help="라벨 JSONL 파일")
+    parser.add_argument("--no-scenarios", action="store_true", help="data/test_scenarios.py 제외")
+    parser.add_argument("--engines", default="keyword", help=f"평가할 엔진 (쉼표로 구분, 등록된 엔진: {', '.join(ENGINES)})")
+    parser.add_argument("--text-field", default="text", help="JSONL 텍스트 필드")
+    parser.add_argument("--label-field", default="expected_risk", help="JSONL 위험 등급 라벨 필드")
+    parser.add_argument("--fraud-field", default="is_fraud", help="JSONL 사기 여부 라벨 필드")
+    parser.add_argument("--json", help="평가 결과를 저장할 JSON 파일")
+    args = parser.parse_args(argv)
+
+    frames = [] if args.no_scenarios else [load_scenarios()]
+    frames += [load_jsonl(path, args.text_field, args.label_field, args.fraud_field) for path in args.jsonl]
+    if not frames:
+        parser.error("평가할 말뭉치가 없습니다")
+    frame = prepare_labels(pd.concat(frames, ignore_index=True))
+
+    # 건별 분석 로그는 끄고 결과만 출력
+    logger.disable("services")
+
+    specs = [spec.strip().partition(":")[::2] for spec in args.engines.split(",") if spec.strip()]
+    for name, argument in specs:
+        if name not in ENGINES:
+            parser.error(f"알 수 없는 엔진입니다: {name} (등록된 엔진: {', '.join(ENGINES)})")
+        if name != "ml":
+            _create_detector(argument or None)
+    _create_detector(None)
+
+    reports = []
+    for name, argument in specs:
+        report = evaluate_engine(name, argument or None, frame)
+        print_report(report)
+        reports.append(report)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as output:
+            json.dump(reports, output, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
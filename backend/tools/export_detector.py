@@ -0,0 +1,127 @@
+"""
+탐지기 내보내기 도구
+서버 설정(규칙 파일, 사기 의심 기준)으로 만든 사기 탐지기를 단말용 파일로 내보내고,
+내보낸 파일에서 불러온 탐지기가 원래 탐지기와 같은 결과를 내는지 확인합니다.
+
+사용 예 (backend 디렉터리에서):
+    python -m tools.export_detector -o detector-ko.json.gz --verify
+    python -m tools.export_detector --language en --margin 1.5 -o detector-en.json.gz
+    python -m tools.golden check --engine tools.export_detector:round_trip
+
+round_trip은 기본 설정 탐지기를 내보냈다가 다시 불러오므로, golden 도구로 골든 말뭉치 전체와 비교할 수 있습니다.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from services.detector_export import (
+    DEFAULT_ESCALATE_MARGIN, dumps, export_detector, load_detector, read_artifact, save_detector
+)
+from services.fraud_detector import DEFAULT_LANGUAGE, FraudDetector
+from tools.golden import CORPUS_PATH, diff, golden_output, load_scenarios, read_corpus
+
+
+def round_trip(language_pack: Optional[Dict[str, Any]] = None) -> FraudDetector:
+    """기본 설정 탐지기를 내보내기 형식(JSON 바이트)으로 바꿨다가 다시 불러옵니다 (golden 도구 엔진)."""
+    artifact = json.loads(dumps(export_detector(FraudDetector(language_pack=language_pack))))
+    return load_detector(artifact)
+
+
+def read_language_pack(language: str) -> Optional[Dict[str, Any]]:
+    """
+    언어 팩 파일을 읽습니다 (기본 언어는 None).
+
+    Raises:
+        FileNotFoundError: 언어 팩 파일이 없는 경우
+    """
+    from config import settings
+    from services.language_packs import BUILTIN_PACK_DIR
+
+    if language == DEFAULT_LANGUAGE:
+        return None
+    path = os.path.join(settings.LANGUAGE_PACK_DIR or BUILTIN_PACK_DIR, f"{language}.json")
+    with open(path, encoding="utf-8") as pack_file:
+        pack = json.load(pack_file)
+    pack.setdefault("language", language)
+    return pack
+
+
+def verify(original: FraudDetector, loaded: FraudDetector, corpus_path: str,
+           max_examples: int = 10) -> Dict[str, Any]:
+    """
+    원래 탐지기와 불러온 탐지기의 분석 결과를 시나리오와 골든 말뭉치(같은 언어) 텍스트로 비교합니다.
+    불러온 탐지기는 평판 저장소가 없으므로 원래 탐지기도 신고 번호 조회 없이 비교해야 합니다.
+
+    Args:
+        original: 원래 탐지기 (reputation_store가 None이어야 함)
+        loaded: 내보낸 파일에서 불러온 탐지기
+        corpus_path: 골든 말뭉치 경로 (없으면 시나리오만 비교)
+        max_examples: 보고할 불일치 사례 수
+
+    Returns:
+        Dict: 비교 건수, 불일치 수, 불일치 사례
+    """
+    texts = load_scenarios() if original.language == DEFAULT_LANGUAGE else []
+    if os.path.exists(corpus_path):
+        _, cases = read_corpus(corpus_path)
+        texts.extend(case["text"] for case in cases if case["language"] == original.language)
+
+    mismatched = 0
+    examples: List[Dict[str, Any]] = []
+    for text in texts:
+        differences = diff(golden_output(original.analyze_text(text)),
+                           golden_output(loaded.analyze_text(text)), tolerance=0.0)
+        if not differences:
+            continue
+        mismatched += 1
+        if len(examples) < max_examples:
+            examples.append({"text": text[:200], "differences": differences[:10]})
+
+    return {"cases": len(texts), "mismatched": mismatched, "examples": examples}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """사기 탐지기를 단말용 파일로 내보냅니다."""
+    parser = argparse.ArgumentParser(description="사기 탐지기를 단말에서 쓸 수 있는 파일로 내보냅니다.")
+    parser.add_argument("-o", "--output", help="출력 파일 (.json 또는 .json.gz, 기본: detector-<언어>.json.gz)")
+    parser.add_argument("--language", default=DEFAULT_LANGUAGE, help="언어 코드 (언어 팩 파일 이름)")
+    parser.add_argument("--rules", help="가산점/위험 등급 규칙 파일 (기본: 설정값)")
+    parser.add_argument("--margin", type=float, default=DEFAULT_ESCALATE_MARGIN,
+                        help="사기 의심 기준보다 얼마나 낮은 점수부터 서버로 보낼지")
+    parser.add_argument("--verify", action="store_true", help="내보낸 파일의 결과를 원래 탐지기와 비교")
+    parser.add_argument("--corpus", default=CORPUS_PATH, help="--verify에 사용할 골든 말뭉치")
+    args = parser.parse_args(argv)
+
+    from api.dependencies import create_fraud_detector
+
+    # 건별 분석 로그는 끄고 결과만 출력
+    logger.disable("services")
+    try:
+        language_pack = read_language_pack(args.language.lower())
+    except FileNotFoundError:
+        parser.error(f"언어 팩이 없습니다: {args.language}")
+    fraud_detector = create_fraud_detector(scoring_rules_path=args.rules, language_pack=language_pack)
+
+    output = args.output or f"detector-{fraud_detector.language}.json.gz"
+    info = save_detector(fraud_detector, output, args.margin)
+    info["compressed_size"] = os.path.getsize(output)
+    print(json.dumps(info, ensure_ascii=False))
+    if not args.verify:
+        return
+
+    started = time.perf_counter()
+    fraud_detector.reputation_store = None
+    report = verify(fraud_detector, load_detector(read_artifact(output)), args.corpus)
+    report["seconds"] = round(time.perf_counter() - started, 2)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    sys.exit(1 if report["mismatched"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,517 @@
+"""
+골든 출력 회귀 검사 도구
+현재 사기 탐지기의 분석 결과를 입력 수천 건에 대해 기록해 두고(골든 말뭉치), 탐지기를 고치거나
+새 엔진으로 바꾼 뒤 같은 입력의 결과가 그대로인지 비교합니다. 속도 개선 작업이
+keyword_matches, pattern_analysis, risk_score 등을 조용히 바꾸지 않았는지 확인하는 용도입니다.
+
+입력은 시드로 고정된 난수로 만들며 다음을 포함합니다.
+- 시나리오(data/test_scenarios.py)와 언어별 알려진 사기 대본
+- 키워드를 섞어 만든 문장
+- 무작위 변형 (띄어쓰기 제거/삽입, 자모 분해, 전각 문자, 대소문자, 조사 변경, 문장 섞기, 자르기,
+  번호/URL 삽입, 보이지 않는 문자 삽입 등)
+- 유니코드 경계 사례 (빈 문자열, 이모지, 결합 문자, 다른 문자 체계, 제어 문자 등)
+- 긴 텍스트 (여러 시나리오를 이어 붙인 수천 - 수만 자)
+
+사용 예 (backend 디렉터리에서):
+    python -m tools.golden generate
+    python -m tools.golden check
+    python -m tools.golden check --engine mypackage.fast_detector:FastDetector --json mismatches.json
+
+엔진은 "모듈:호출 가능 객체" 형식이며 language_pack 키워드 인자(기본 언어는 None)로 호출해
+analyze_text(text)를 가진 탐지기를 반환해야 합니다. 기본 엔진은 services.fraud_detector:FraudDetector입니다.
+말뭉치는 설정 파일(규칙, 평판 DB, 임계값)과 무관하도록 기본 설정 탐지기로 기록합니다.
+"""
+
+import argparse
+import gzip
+import importlib
+import importlib.util
+import io
+import json
+import os
+import random
+import sys
+import time
+import unicodedata
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from loguru import logger
+
+
+SCENARIO_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data", "test_scenarios.py")
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data", "golden", "corpus.jsonl.gz")
+
+CORPUS_VERSION = 1
+DEFAULT_ENGINE = "services.fraud_detector:FraudDetector"
+
+# 기록하고 비교하는 분석 결과 필드 (분석 시각과 렌더링된 권장사항 문구는 제외)
+GOLDEN_FIELDS = (
+    "processed_text", "risk_score", "risk_level", "is_fraud_suspected", "keyword_matches",
+    "pattern_analysis", "script_match", "match_spans", "score_breakdown", "recommendation_ids"
+)
+
+# 언어별 기본 생성 건수 (기본 언어는 나머지 전부)
+EXTRA_LANGUAGE_SHARE = 0.1
+
+# 문장을 만들 때 키워드 사이에 넣는 단어
+FILLER_WORDS = {
+    "ko": ["고객님", "안녕하세요", "확인", "부탁드립니다", "오늘", "날씨가", "좋네요", "회의", "점심",
+           "지금은", "담당자", "연락", "드렸습니다", "혹시", "시간", "괜찮으세요", "그리고", "네", "아니요"],
+    "en": ["hello", "sir", "madam", "this", "is", "your", "please", "we", "need", "to", "the", "and",
+           "call", "back", "thank", "you", "about", "meeting", "lunch", "weather"],
+    "zh": ["您好", "先生", "女士", "请", "我们", "需要", "这个", "电话", "谢谢", "今天", "天气", "开会",
+           "午饭", "朋友", "一下", "的", "了"]
+}
+
+# 조사 바꾸기 변형에서 쓰는 조사
+PARTICLES = ["은", "는", "이", "가", "을", "를", "에", "에서", "으로", "로", "의", "도", "만", "에게", "까지"]
+
+# 보이지 않거나 토큰을 끊는 문자
+INVISIBLE_CHARS = ["\u200b", "\u200c", "\u200d", "\ufeff", "\u00ad", "\u2060"]
+
+# 고정된 유니코드 경계 사례
+UNICODE_EDGE_CASES = [
+    "", " ", "\n\t\r ", "\x00", "\ufeff", "\u3164\u3164", "😀", "💰💰💰 송금 💸",
+    "👨‍👩‍👧 가족 사칭", "e\u0301 cafe\u0301", "계좌\u0301이체", "ＯＴＰ　번호", "０１０－１２３４－５６７８",
+    "010\u20111234\u20115678", "010 1234 5678", "①②③ 계좌번호", "ﾡﾢﾣ", "ㄱㅖㅈㅘ ㅇㅣㅊㅔ", "ㄱㅖㅈㅘㅇㅣㅊㅔ",
+    "مرحبا بالحساب البنكي", "שלום חשבון", "สวัสดีครับ โอนเงิน", "Здравствуйте, переведите деньги",
+    "OTP번호를알려주세요", "URL클릭", "https://example.com/login?next=계좌", "http://bit.ly/abc",
+    "금융감독원" * 200, "가" * 5000, "이체 " * 500, "\u202e이체\u202c", "계\u200b좌\u200b이\u200b체",
+    "Ｈｅｌｌｏ　ＩＲＳ", "ARREST WARRANT", "公安局公安局", "銀行帳戶 轉帳", "中國 公安 转账 123-4567-8901",
+    "한국어 English 中文 混合 텍스트 transfer 转账 이체"
+]
+
+
+def load_scenarios(path: str = SCENARIO_PATH) -> List[str]:
+    """data/test_scenarios.py의 시나리오 텍스트를 불러옵니다."""
+    spec = importlib.util.spec_from_file_location("test_scenarios", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return [scenario["text"] for scenario in module.ALL_SCENARIOS]
+
+
+def load_language_packs() -> Dict[str, Optional[Dict[str, Any]]]:
+    """언어 코드 → 언어 팩 (기본 언어는 None, 기본 언어 팩 디렉터리의 파일만 사용)"""
+    from services.fraud_detector import DEFAULT_LANGUAGE
+    from services.language_packs import BUILTIN_PACK_DIR
+
+    packs: Dict[str, Optional[Dict[str, Any]]] = {DEFAULT_LANGUAGE: None}
+    for name in sorted(os.listdir(BUILTIN_PACK_DIR)):
+        code, extension = os.path.splitext(name)
+        if extension == ".json":
+            with open(os.path.join(BUILTIN_PACK_DIR, name), encoding="utf-8") as pack_file:
+                packs[code] = json.load(pack_file)
+    return packs
+
+
+def load_engine(spec: str) -> Callable[..., Any]:
+    """"모듈:이름" 형식의 엔진 생성 함수를 불러옵니다."""
+    module_name, _, attribute = spec.partition(":")
+    if not attribute:
+        raise ValueError(f"엔진은 '모듈:이름' 형식이어야 합니다: {spec}")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def golden_output(result: Dict[str, Any]) -> Dict[str, Any]:
+    """분석 결과에서 비교할 필드만 JSON 형태로 남깁니다 (튜플 등은 목록으로)."""
+    return json.loads(json.dumps({field: result.get(field) for field in GOLDEN_FIELDS}, ensure_ascii=False))
+
+
+class CaseGenerator:
+    """
+    골든 입력 생성기
+    같은 시드와 입력 자료(시나리오, 언어 팩)로는 항상 같은 입력을 같은 순서로 만듭니다.
+    """
+
+    def __init__(self, seed: int, scenarios: List[str], packs: Dict[str, Optional[Dict[str, Any]]],
+                 default_detector):
+        self.random = random.Random(seed)
+        self.scenarios = scenarios
+        self.packs = packs
+        self.default_language = default_detector.language
+
+        # 언어별 기본 문장 (시나리오/대본)과 키워드
+        self.base_texts: Dict[str, List[str]] = {}
+        self.keywords: Dict[str, List[str]] = {}
+        for language, pack in packs.items():
+            if pack is None:
+                texts = scenarios + [script["text"] for script in default_detector._load_known_scripts()]
+                keywords = [kw for kws in default_detector.fraud_keywords.values() for kw in kws]
+                keywords += [word for words in default_detector.pattern_words.values() for word in words]
+            else:
+                texts = [script["text"] for script in pack.get("known_scripts", [])]
+                keywords = [kw for kws in pack["fraud_keywords"].values() for kw in kws]
+                keywords += [word for words in pack.get("pattern_words", {}).values() for word in words]
+            self.base_texts[language] = texts
+            self.keywords[language] = sorted(set(keywords))
+
+        self.mutations: List[Tuple[str, Callable[[str, str], str]]] = [
+            ("no_spaces", lambda text, _: text.replace(" ", "")),
+            ("extra_spaces", self._extra_spaces),
+            ("nfd", lambda text, _: unicodedata.normalize("NFD", text)),
+            ("fullwidth", self._fullwidth),
+            ("case", self._random_case),
+            ("particles", self._swap_particles),
+            ("shuffle_sentences", self._shuffle_sentences),
+            ("drop_tokens", self._drop_tokens),
+            ("truncate", self._truncate),
+            ("numbers", self._inject_numbers),
+            ("invisible", self._inject_invisible),
+            ("punctuation", self._inject_punctuation),
+            ("concat", self._concat),
+            ("keyword_soup", lambda text, language: self._keyword_sentence(language)),
+            ("stacked", self._stacked),
+        ]
+
+    def generate(self, count: int, long_count: int) -> Iterator[Tuple[str, str, str]]:
+        """
+        (종류, 언어, 텍스트)를 차례로 만듭니다.
+
+        Args:
+            count: 무작위 변형/키워드 문장 건수 (언어별로 나눔)
+            long_count: 긴 텍스트 건수
+        """
+        for language, texts in self.base_texts.items():
+            for text in texts:
+                yield "base", language, text
+        for text in UNICODE_EDGE_CASES:
+            yield "unicode", self.default_language, text
+
+        languages = list(self.base_texts)
+        extra = [language for language in languages if language != self.default_language]
+        extra_count = int(count * EXTRA_LANGUAGE_SHARE)
+        plan = [(language, extra_count) for language in extra]
+        plan.insert(0, (self.default_language, count - extra_count * len(extra)))
+        for language, language_count in plan:
+            for _ in range(language_count):
+                if self.random.random() < 0.2:
+                    yield "keywords", language, self._keyword_sentence(language)
+                    continue
+                name, mutate = self.random.choice(self.mutations)
+                yield f"mutation:{name}", language, mutate(self._base(language), language)
+
+        for _ in range(long_count):
+            language = self.random.choice(languages)
+            parts = [self._base(language) for _ in range(self.random.randint(20, 120))]
+            yield "long", language, " ".join(parts)
+
+    def _base(self, language: str) -> str:
+        return self.random.choice(self.base_texts[language])
+
+    def _keyword_sentence(self, language: str) -> str:
+        words = []
+        for _ in range(self.random.randint(3, 25)):
+            pool = self.keywords[language] if self.random.random() < 0.4 else FILLER_WORDS[language]
+            words.append(self.random.choice(pool))
+        separator = "" if language == "zh" else " "
+        return separator.join(words)
+
+    def _extra_spaces(self, text: str, _: str) -> str:
+        chars = []
+        for char in text:
+            chars.append(char)
+            if char != " " and self.random.random() < 0.15:
+                chars.append(" " * self.random.randint(1, 3))
+        return "".join(chars)
+
+    def _fullwidth(self, text: str, _: str) -> str:
+        return "".join(
+            chr(ord(char) + 0xFEE0) if "!" <= char <= "~" and self.random.random() < 0.7 else char
+            for char in text
+        )
+
+    def _random_case(self, text: str, _: str) -> str:
+        return "".join(char.upper() if self.random.random() < 0.5 else char.lower() for char in text)
+
+    def _swap_particles(self, text: str, _: str) -> str:
+        words = text.split(" ")
+        for index, word in enumerate(words):
+            if word and self.random.random() < 0.3:
+                stripped = word.rstrip(".,?!")
+                tail = word[len(stripped):]
+                for particle in sorted(PARTICLES, key=len, reverse=True):
+                    if stripped.endswith(particle) and len(stripped) > len(particle):
+                        stripped = stripped[:-len(particle)]
+                        break
+                words[index] = stripped + self.random.choice(PARTICLES + [""]) + tail
+        return " ".join(words)
+
+    def _shuffle_sentences(self, text: str, _: str) -> str:
+        sentences = [part.strip() for part in text.replace("?", ".").replace("。", ".").split(".") if part.strip()]
+        self.random.shuffle(sentences)
+        return ". ".join(sentences)
+
+    def _drop_tokens(self, text: str, _: str) -> str:
+        words = text.split(" ")
+        return " ".join(word for word in words if self.random.random() > 0.25)
+
+    def _truncate(self, text: str, _: str) -> str:
+        start = self.random.randint(0, max(len(text) // 3, 0))
+        end = self.random.randint(start, len(text))
+        return text[start:end]
+
+    def _inject_numbers(self, text: str, _: str) -> str:
+        samples = [
+            f"010-{self.random.randint(1000, 9999)}-{self.random.randint(1000, 9999)}",
+            f"02.{self.random.randint(100, 9999)}.{self.random.randint(1000, 9999)}",
+            f"{self.random.randint(100, 9999)}-{self.random.randint(10, 999999)}-{self.random.randint(10, 99999999)}",
+            f"https://secure-{self.random.randint(1, 999)}.example.com/login",
+            str(self.random.randint(0, 10 ** 12)),
+        ]
+        words = text.split(" ")
+        for _ in range(self.random.randint(1, 3)):
+            words.insert(self.random.randint(0, len(words)), self.random.choice(samples))
+        return " ".join(words)
+
+    def _inject_invisible(self, text: str, _: str) -> str:
+        return "".join(
+            char + self.random.choice(INVISIBLE_CHARS) if self.random.random() < 0.1 else char
+            for char in text
+        )
+
+    def _inject_punctuation(self, text: str, _: str) -> str:
+        marks = ["-", "_", "/", "~", "·", "…", "!", "😀", "💸", "(", ")", "\n", "\t"]
+        return "".join(
+            char + self.random.choice(marks) if self.random.random() < 0.1 else char
+            for char in text
+        )
+
+    def _concat(self, text: str, language: str) -> str:
+        return text + self.random.choice([" ", "", "\n"]) + self._base(language)
+
+    def _stacked(self, text: str, language: str) -> str:
+        for _ in range(self.random.randint(2, 4)):
+            _, mutate = self.random.choice(self.mutations[:-2])
+            text = mutate(text, language)
+        return text
+
+
+def generate(output_path: str, count: int, long_count: int, seed: int) -> Dict[str, Any]:
+    """
+    골든 말뭉치를 만듭니다 (gzip JSONL, 첫 줄은 메타데이터).
+
+    Args:
+        output_path: 출력 파일 경로
+        count: 무작위 변형/키워드 문장 건수
+        long_count: 긴 텍스트 건수
+        seed: 난수 시드
+
+    Returns:
+        Dict: 메타데이터
+    """
+    from services.fraud_detector import DEFAULT_LANGUAGE, FraudDetector
+
+    packs = load_language_packs()
+    detectors = {language: FraudDetector(language_pack=pack) for language, pack in packs.items()}
+    generator = CaseGenerator(seed, load_scenarios(), packs, detectors[DEFAULT_LANGUAGE])
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    kinds: Dict[str, int] = {}
+    cases = []
+    for index, (kind, language, text) in enumerate(generator.generate(count, long_count)):
+        kinds[kind.split(":")[0]] = kinds.get(kind.split(":")[0], 0) + 1
+        cases.append({
+            "id": index,
+            "kind": kind,
+            "language": language,
+            "text": text,
+            "expected": golden_output(detectors[language].analyze_text(text))
+        })
+
+    meta = {
+        "version": CORPUS_VERSION,
+        "seed": seed,
+        "cases": len(cases),
+        "kinds": kinds,
+        "languages": sorted(packs),
+        "fields": list(GOLDEN_FIELDS)
+    }
+    # 생성 시각을 기록하지 않고 mtime도 고정해, 탐지기 결과가 같으면 같은 파일이 되도록 함
+    with open(output_path, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as compressed:
+        with io.TextIOWrapper(compressed, encoding="utf-8") as output:
+            output.write(json.dumps({"meta": meta}, ensure_ascii=False) + "\n")
+            for case in cases:
+                output.write(json.dumps(case, ensure_ascii=False) + "\n")
+    return meta
+
+
+def read_corpus(path: str) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+    """골든 말뭉치의 메타데이터와 입력/기대 결과를 차례로 읽습니다."""
+    source = gzip.open(path, "rt", encoding="utf-8") if path.endswith(".gz") else open(path, encoding="utf-8")
+    meta = json.loads(source.readline())["meta"]
+    if meta.get("version") != CORPUS_VERSION:
+        source.close()
+        raise ValueError(f"지원하지 않는 말뭉치 버전입니다: {meta.get('version')}")
+
+    def cases() -> Iterator[Dict[str, Any]]:
+        with source:
+            for line in source:
+                if line.strip():
+                    yield json.loads(line)
+
+    return meta, cases()
+
+
+def diff(expected: Any, actual: Any, tolerance: float, path: str = "") -> List[str]:
+    """
+    두 결과의 다른 위치를 찾습니다 (실수는 tolerance 이내면 같음, 사전 키 순서는 무시).
+
+    Returns:
+        List[str]: 다른 위치 목록 (예: "keyword_matches.financial_terms[1]")
+    """
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        differences = []
+        for key in sorted(set(expected) | set(actual), key=str):
+            child = f"{path}.{key}" if path else str(key)
+            if key not in expected or key not in actual:
+                differences.append(child)
+            else:
+                differences.extend(diff(expected[key], actual[key], tolerance, child))
+        return differences
+    if isinstance(expected, list) and isinstance(actual, list):
+        if len(expected) != len(actual):
+            return [f"{path}(len {len(expected)} != {len(actual)})"]
+        differences = []
+        for index, (left, right) in enumerate(zip(expected, actual)):
+            differences.extend(diff(left, right, tolerance, f"{path}[{index}]"))
+        return differences
+    if isinstance(expected, float) or isinstance(actual, float):
+        if (isinstance(expected, (int, float)) and isinstance(actual, (int, float))
+                and not isinstance(expected, bool) and not isinstance(actual, bool)
+                and abs(expected - actual) <= tolerance):
+            return []
+        return [path]
+    return [] if expected == actual else [path]
+
+
+def check(corpus_path: str, engine_spec: str, tolerance: float, fields: List[str],
+          max_examples: int) -> Dict[str, Any]:
+    """
+    엔진을 골든 말뭉치로 실행해 기록된 결과와 비교합니다.
+
+    Args:
+        corpus_path: 골든 말뭉치 경로
+        engine_spec: "모듈:이름" 형식의 엔진 생성 함수
+        tolerance: 실수 비교 허용 오차
+        fields: 비교할 필드
+        max_examples: 보고서에 넣을 불일치 사례 수
+
+    Returns:
+        Dict: 비교 결과 (건수, 필드/종류별 불일치 수, 불일치 사례, 처리량)
+    """
+    meta, cases = read_corpus(corpus_path)
+    packs = load_language_packs()
+    factory = load_engine(engine_spec)
+    engines: Dict[str, Any] = {}
+
+    total = mismatched = 0
+    field_mismatches: Dict[str, int] = {}
+    kind_mismatches: Dict[str, int] = {}
+    examples = []
+    elapsed = 0.0
+    for case in cases:
+        language = case["language"]
+        if language not in engines:
+            engines[language] = factory(language_pack=packs.get(language))
+        engine = engines[language]
+
+        started = time.perf_counter()
+        result = engine.analyze_text(case["text"])
+        elapsed += time.perf_counter() - started
+
+        actual = golden_output(result)
+        total += 1
+        differences = {
+            field: paths for field in fields
+            if (paths := diff(case["expected"].get(field), actual.get(field), tolerance, field))
+        }
+        if not differences:
+            continue
+
+        mismatched += 1
+        for field in differences:
+            field_mismatches[field] = field_mismatches.get(field, 0) + 1
+        kind = case["kind"]
+        kind_mismatches[kind] = kind_mismatches.get(kind, 0) + 1
+        if len(examples) < max_examples:
+            examples.append({
+                "id": case["id"],
+                "kind": kind,
+                "language": language,
+                "text": case["text"][:200],
+                "differences": [path for paths in differences.values() for path in paths][:20],
+                "expected": {field: case["expected"].get(field) for field in differences},
+                "actual": {field: actual.get(field) for field in differences}
+            })
+
+    return {
+        "corpus": os.path.basename(corpus_path),
+        "corpus_seed": meta.get("seed"),
+        "engine": engine_spec,
+        "cases": total,
+        "mismatched": mismatched,
+        "field_mismatches": dict(sorted(field_mismatches.items(), key=lambda item: -item[1])),
+        "kind_mismatches": dict(sorted(kind_mismatches.items(), key=lambda item: -item[1])),
+        "docs_per_second": round(total / elapsed, 1) if elapsed > 0 else None,
+        "examples": examples
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """비교 결과를 출력합니다."""
+    print(f"=== {report['engine']} / {report['corpus']} ({report['cases']}건, {report['docs_per_second']}건/초) ===")
+    if not report["mismatched"]:
+        print("모든 결과가 골든 출력과 같습니다.")
+        return
+    print(f"불일치 {report['mismatched']}건")
+    print("필드별: " + ", ".join(f"{field} {count}" for field, count in report["field_mismatches"].items()))
+    print("종류별: " + ", ".join(f"{kind} {count}" for kind, count in report["kind_mismatches"].items()))
+    for example in report["examples"]:
+        print(f"- #{example['id']} [{example['kind']}, {example['language']}] {example['text'][:60]!r}")
+        for path in example["differences"][:5]:
+            print(f"    {path}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """골든 말뭉치를 만들거나 엔진을 골든 말뭉치와 비교합니다."""
+    parser = argparse.ArgumentParser(description="사기 탐지기 골든 출력 말뭉치 생성/비교 도구")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = subparsers.add_parser("generate", help="현재 탐지기로 골든 말뭉치를 만듭니다")
+    generate_parser.add_argument("-o", "--output", default=CORPUS_PATH, help="출력 파일 (gzip JSONL)")
+    generate_parser.add_argument("--count", type=int, default=4000, help="무작위 변형/키워드 문장 건수")
+    generate_parser.add_argument("--long", type=int, default=60, help="긴 텍스트 건수")
+    generate_parser.add_argument("--seed", type=int, default=20240601, help="난수 시드")
+
+    check_parser = subparsers.add_parser("check", help="엔진 결과를 골든 말뭉치와 비교합니다")
+    check_parser.add_argument("--corpus", default=CORPUS_PATH, help="골든 말뭉치 파일")
+    check_parser.add_argument("--engine", default=DEFAULT_ENGINE, help="엔진 생성 함수 (모듈:이름)")
+    check_parser.add_argument("--tolerance", type=float, default=1e-9, help="실수 비교 허용 오차")
+    check_parser.add_argument("--fields", default=",".join(GOLDEN_FIELDS), help="비교할 필드 (쉼표로 구분)")
+    check_parser.add_argument("--examples", type=int, default=20, help="보고할 불일치 사례 수")
+    check_parser.add_argument("--json", help="비교 결과를 저장할 JSON 파일")
+    args = parser.parse_args(argv)
+
+    # 건별 분석 로그는 끄고 결과만 출력
+    logger.disable("services")
+
+    if args.command == "generate":
+        meta = generate(args.output, args.count, args.long, args.seed)
+        print(f"골든 말뭉치를 만들었습니다: {args.output} ({meta['cases']}건, {meta['kinds']})")
+        return
+
+    fields = [field.strip() for field in args.fields.split(",") if field.strip()]
+    unknown = [field for field in fields if field not in GOLDEN_FIELDS]
+    if unknown:
+        parser.error(f"기록되지 않은 필드입니다: {', '.join(unknown)}")
+
+    report = check(args.corpus, args.engine, args.tolerance, fields, args.examples)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as output:
+            json.dump(report, output, ensure_ascii=False, indent=2)
+    sys.exit(1 if report["mismatched"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+"""
+부하 생성 도구
+data/test_scenarios.py의 시나리오를 바탕으로 텍스트 분석, 합성 음성 업로드, 통화 세션 스트리밍을 섞은
+부하를 만들어 처리량과 지연 시간 분위수를 측정합니다. 인스턴스 크기 산정과 과부하 시 동작 확인용입니다.
+
+기본은 서버를 띄우지 않고 같은 프로세스의 앱에 직접 요청합니다 (httpx ASGITransport).
+--url을 주면 실행 중인 서버로 요청합니다.
+
+사용 예 (backend 디렉터리에서):
+    python -m tools.load_generator --duration 30 --concurrency 32
+    python -m tools.load_generator --rate 200 --mix text=0.8,session=0.2 --url http://127.0.0.1:8000
+    python -m tools.load_generator --requests 500 --mix audio=1 --audio noise --json load.json
+
+--rate를 주면 도착 간격이 지수 분포인 개방형 부하(초당 평균 도착 수)를 만들고, 동시 실행 수가 가득 차면
+요청은 대기합니다. 지연 시간은 예정 도착 시각부터 재므로 대기 시간이 포함됩니다.
+--rate가 없으면 --concurrency개의 사용자가 쉬지 않고 요청하는 폐쇄형 부하입니다.
+
+가상 사용자마다 다른 X-Client-Id를 보내므로(--clients, 기본은 --concurrency) 서버의 클라이언트별 요청 한도는
+사용자마다 따로 적용됩니다. 한도 자체를 측정하려면 --clients 1로 실행합니다.
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import io
+import json
+import os
+import random
+import re
+import time
+import uuid
+import wave
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+import numpy as np
+from loguru import logger
+
+
+SCENARIO_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data", "test_scenarios.py")
+
+DEFAULT_MIX = "text=0.7,session=0.2,audio=0.1"
+PERCENTILES = (50, 90, 95, 99)
+
+# 과부하 응답 (요청 거절로 집계)
+REJECTED_STATUSES = {429, 503}
+
+SAMPLE_RATE = 16000
+
+
+def load_templates(path: str = SCENARIO_PATH) -> List[str]:
+    """부하 템플릿으로 사용할 시나리오 텍스트를 불러옵니다."""
+    spec = importlib.util.spec_from_file_location("test_scenarios", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return [scenario["text"] for scenario in module.ALL_SCENARIOS]
+
+
+def synthesize_wav(kind: str, seconds: float, seed: int = 0) -> bytes:
+    """
+    짧은 합성 음성(WAV, 16kHz 모노 16bit)을 만듭니다.
+
+    Args:
+        kind: "tone" (440Hz 사인파) 또는 "noise" (백색 잡음)
+        seconds: 길이 (초)
+        seed: 잡음 난수 시드
+    """
+    samples = int(SAMPLE_RATE * seconds)
+    if kind == "tone":
+        signal = 0.3 * np.sin(2 * np.pi * 440.0 * np.arange(samples) / SAMPLE_RATE)
+    else:
+        signal = 0.1 * np.random.default_rng(seed).standard_normal(samples)
+    pcm = (np.clip(signal, -1.0, 1.0) * 32767).astype("<i2")
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+
+def split_chunks(text: str) -> List[str]:
+    """세션 스트리밍용으로 텍스트를 문장 단위로 나눕니다."""
+    chunks = [chunk.strip() for chunk in re.split(r'(?<=[.?!])\s+', text) if chunk.strip()]
+    return chunks or [text]
+
+
+class LoadRecorder:
+    """
+    부하 결과 집계기 클래스
+    작업 종류별 지연 시간(밀리초)과 응답 상태를 모읍니다.
+    """
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.queue_waits: List[float] = []
+        self.statuses: Dict[str, Dict[str, int]] = {}
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+
+    def record(self, workload: str, latency_ms: float, status: str) -> None:
+        """작업 하나의 결과를 기록합니다 (status: HTTP 상태 코드 또는 예외 이름)."""
+        self.latencies.setdefault(workload, []).append(latency_ms)
+        counts = self.statuses.setdefault(workload, {})
+        counts[status] = counts.get(status, 0) + 1
+
+    def report(self) -> Dict[str, any]:
+        """
+        처리량과 지연 시간 분위수를 계산합니다.
+
+        Returns:
+            Dict: 전체/작업 종류별 요청 수, 성공/거절/오류 수, 초당 처리량, 지연 시간 분위수
+        """
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        workloads = {name: self._summarize(latencies, self.statuses[name], elapsed)
+                     for name, latencies in sorted(self.latencies.items())}
+        all_latencies = [latency for latencies in self.latencies.values() for latency in latencies]
+        all_statuses: Dict[str, int] = {}
+        for counts in self.statuses.values():
+            for status, count in counts.items():
+                all_statuses[status] = all_statuses.get(status, 0) + count
+
+        report = {
+            "elapsed_seconds": round(elapsed, 3),
+            "total": self._summarize(all_latencies, all_statuses, elapsed),
+            "workloads": workloads
+        }
+        if self.queue_waits:
+            report["queue_wait_ms"] = _percentiles(self.queue_waits)
+        return report
+
+    @staticmethod
+    def _summarize(latencies: List[float], statuses: Dict[str, int], elapsed: float) -> Dict[str, any]:
+        succeeded = sum(count for status, count in statuses.items() if status.startswith("2"))
+        rejected = sum(count for status, count in statuses.items()
+                       if status.isdigit() and int(status) in REJECTED_STATUSES)
+        return {
+            "requests": len(latencies),
+            "succeeded": succeeded,
+            "rejected": rejected,
+            "failed": len(latencies) - succeeded - rejected,
+            "throughput_per_second": round(succeeded / elapsed, 2) if elapsed > 0 else 0.0,
+            "latency_ms": _percentiles(latencies),
+            "statuses": dict(sorted(statuses.items()))
+        }
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    array = np.asarray(values)
+    summary = {f"p{p}": round(float(value), 2) for p, value in zip(PERCENTILES, np.percentile(array, PERCENTILES))}
+    summary["mean"] = round(float(array.mean()), 2)
+    summary["max"] = round(float(array.max()), 2)
+    return summary
+
+
+class LoadGenerator:
+    """
+    부하 생성기 클래스
+    작업 종류별 비율(mix)에 따라 작업을 뽑아 실행하고 LoadRecorder에 기록합니다.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, templates: List[str], mix: Dict[str, float],
+                 audio_kind: str = "tone", audio_seconds: float = 1.0, seed: Optional[int] = None,
+                 num_clients: int = 1):
+        """
+        부하 생성기 초기화
+
+        Args:
+            client: 요청에 사용할 HTTP 클라이언트
+            templates: 시나리오 텍스트 목록
+            mix: 작업 종류별 비율 (text, audio, session)
+            audio_kind: 합성 음성 종류 (tone, noise)
+            audio_seconds: 합성 음성 길이 (초)
+            seed: 작업 선택 난수 시드
+            num_clients: 가상 사용자 수 (사용자마다 X-Client-Id를 따로 보냄)
+        """
+        self.client = client
+        self.templates = templates
+        self.recorder = LoadRecorder()
+        self.random = random.Random(seed)
+        self.client_ids = [f"loadgen-{index}" for index in range(max(num_clients, 1))]
+        self.workloads: Dict[str, Callable[[Dict[str, str]], Awaitable[str]]] = {
+            "text": self._text,
+            "audio": self._audio,
+            "session": self._session
+        }
+        unknown = set(mix) - set(self.workloads)
+        if unknown:
+            raise ValueError(f"알 수 없는 작업 종류입니다: {', '.join(sorted(unknown))}")
+        self.mix_names = [name for name, weight in mix.items() if weight > 0]
+        self.mix_weights = [mix[name] for name in self.mix_names]
+        if not self.mix_names:
+            raise ValueError("작업 비율이 모두 0입니다")
+        # 합성 음성은 미리 만들어 요청마다 재사용
+        self.audio_files = [synthesize_wav(audio_kind, audio_seconds, seed=index) for index in range(4)]
+
+    async def run_closed(self, concurrency: int, duration: Optional[float], total: Optional[int]) -> None:
+        """폐쇄형 부하: concurrency개의 사용자가 응답을 받자마자 다음 요청을 보냅니다."""
+        deadline = time.perf_counter() + duration if duration else None
+        remaining = [total]
+
+        async def user(client_id: str) -> None:
+            while deadline is None or time.perf_counter() < deadline:
+                if remaining[0] is not None:
+                    if remaining[0] <= 0:
+                        return
+                    remaining[0] -= 1
+                await self._run_one(time.perf_counter(), client_id)
+
+        self.recorder.started = time.perf_counter()
+        await asyncio.gather(*(user(self.client_ids[index % len(self.client_ids)]) for index in range(concurrency)))
+        self.recorder.finished = time.perf_counter()
+
+    async def run_open(self, rate: float, concurrency: int, duration: Optional[float], total: Optional[int]) -> None:
+        """개방형 부하: 평균 rate건/초로 요청이 도착하고, 동시 실행 수를 넘는 요청은 대기합니다."""
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks = set()
+
+        async def arrival(scheduled: float, client_id: str) -> None:
+            async with semaphore:
+                self.recorder.queue_waits.append((time.perf_counter() - scheduled) * 1000)
+                await self._run_one(scheduled, client_id)
+
+        self.recorder.started = start = time.perf_counter()
+        scheduled = start
+        sent = 0
+        while (total is None or sent < total) and (duration is None or scheduled - start < duration):
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.create_task(arrival(scheduled, self.random.choice(self.client_ids)))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            sent += 1
+            scheduled += self.random.expovariate(rate)
+
+        await asyncio.gather(*tasks)
+        self.recorder.finished = time.perf_counter()
+
+    async def _run_one(self, scheduled: float, client_id: str) -> None:
+        name = self.random.choices(self.mix_names, self.mix_weights)[0]
+        try:
+            status = await self.workloads[name]({"X-Client-Id": client_id})
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+        self.recorder.record(name, (time.perf_counter() - scheduled) * 1000, status)
+
+    async def _text(self, headers: Dict[str, str]) -> str:
+        response = await self.client.post("/api/voice/analyze-text", params={
+            "text": self.random.choice(self.templates),
+            "confidence": 1.0
+        }, headers=headers)
+        return str(response.status_code)
+
+    async def _audio(self, headers: Dict[str, str]) -> str:
+        content = self.random.choice(self.audio_files)
+        response = await self.client.post(
+            "/api/voice/upload-and-analyze",
+            files={"audio_file": ("load.wav", content, "audio/wav")},
+            headers=headers
+        )
+        return str(response.status_code)
+
+    async def _session(self, headers: Dict[str, str]) -> str:
+        """통화 세션 하나를 시작하고 문장 단위로 추가한 뒤 종료합니다 (하나의 작업으로 집계)."""
+        call_id = f"load-{uuid.uuid4().hex[:12]}"
+        response = await self.client.post("/api/voice/sessions", params={"call_id": call_id}, headers=headers)
+        if response.status_code != 200:
+            return str(response.status_code)
+
+        for chunk in split_chunks(self.random.choice(self.templates)):
+            response = await self.client.post(f"/api/voice/sessions/{call_id}/append", params={"text": chunk},
+                                              headers=headers)
+            if response.status_code != 200:
+                break
+
+        closed = await self.client.post(f"/api/voice/sessions/{call_id}/close", headers=headers)
+        return str(response.status_code if response.status_code != 200 else closed.status_code)
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """"text=0.7,session=0.3" 형식의 작업 비율을 읽습니다."""
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        if name.strip():
+            mix[name.strip()] = float(weight) if weight else 1.0
+    return mix
+
+
+def print_report(report: Dict[str, any]) -> None:
+    """부하 결과를 표로 출력합니다."""
+    print(f"경과 시간: {report['elapsed_seconds']:.1f}초")
+    print(f"{'작업':<8} {'요청':>7} {'성공':>7} {'거절':>6} {'오류':>6} {'초당':>8} "
+          f"{'p50':>8} {'p90':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    rows = list(report["workloads"].items()) + [("total", report["total"])]
+    for name, summary in rows:
+        latency = summary["latency_ms"]
+        print(f"{name:<8} {summary['requests']:>7} {summary['succeeded']:>7} {summary['rejected']:>6} "
+              f"{summary['failed']:>6} {summary['throughput_per_second']:>8.1f} "
+              + " ".join(f"{latency.get(key, 0.0):>8.1f}" for key in ("p50", "p90", "p95", "p99", "max")))
+    if "queue_wait_ms" in report:
+        wait = report["queue_wait_ms"]
+        print(f"대기 시간(ms): p50 {wait['p50']:.1f}, p99 {wait['p99']:.1f}, max {wait['max']:.1f}")
+    for name, summary in rows:
+        unexpected = {status: count for status, count in summary["statuses"].items() if status != "200"}
+        if unexpected and name != "total":
+            print(f"{name} 응답 상태: {unexpected}")
+
+
+async def run(args: argparse.Namespace) -> Dict[str, any]:
+    """부하를 실행하고 결과를 반환합니다."""
+    if args.url:
+        transport = None
+        base_url = args.url.rstrip("/")
+    else:
+        from api import dependencies
+        from main import app
+
+        # 서비스 준비 시간은 측정에서 제외
+        await dependencies.warm_up()
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://loadgen"
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(transport=transport, base_url=base_url,
+                                 timeout=args.timeout, limits=limits) as client:
+        generator = LoadGenerator(client, load_templates(), parse_mix(args.mix),
+                                  audio_kind=args.audio, audio_seconds=args.audio_seconds, seed=args.seed,
+                                  num_clients=args.clients or args.concurrency)
+        try:
+            if args.rate:
+                await generator.run_open(args.rate, args.concurrency, args.duration, args.requests)
+            else:
+                await generator.run_closed(args.concurrency, args.duration, args.requests)
+        finally:
+            if transport is not None:
+                dependencies.shutdown()
+
+    return generator.recorder.report()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """합성 부하를 실행합니다."""
+    parser = argparse.ArgumentParser(description="시나리오 기반 합성 부하로 처리량과 지연 시간을 측정합니다.")
+    parser.add_argument("--url", help="대상 서버 주소 (없으면 같은 프로세스의 앱에 직접 요청)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"작업 종류별 비율 (기본: {DEFAULT_MIX})")
+    parser.add_argument("--concurrency", type=int, default=16, help="최대 동시 요청 수")
+    parser.add_argument("--clients", type=int, help="가상 사용자(X-Client-Id) 수 (기본: --concurrency)")
+    parser.add_argument("--rate", type=float, help="초당 평균 도착 수 (개방형 부하)")
+    parser.add_argument("--duration", type=float, help="실행 시간 (초)")
+    parser.add_argument("--requests", type=int, help="총 작업 수")
+    parser.add_argument("--audio", choices=("tone", "noise"), default="tone", help="합성 음성 종류")
+    parser.add_argument("--audio-seconds", type=float, default=1.0, help="합성 음성 길이 (초)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청 제한 시간 (초)")
+    parser.add_argument("--seed", type=int, help="작업 선택 난수 시드")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args(argv)
+
+    if args.duration is None and args.requests is None:
+        args.duration = 10.0
+    if args.concurrency < 1 or (args.rate is not None and args.rate <= 0):
+        parser.error("--concurrency와 --rate는 0보다 커야 합니다")
+
+    # 요청별 로그는 끄고 결과만 출력
+    logger.disable("services")
+    logger.disable("api")
+
+    report = asyncio.run(run(args))
+    print_report(report)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as output:
+            json.dump(report, output, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
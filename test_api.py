@@ -3,10 +3,30 @@ API 테스트 스크립트
 음성 분석 API의 기본 기능을 테스트합니다.
 """
 
+import asyncio
+import os
+import sys
+import tempfile
+import wave
+
+import numpy as np
 import requests
 import json
 from data.test_scenarios import ALL_SCENARIOS
 
+# 백엔드 서비스 모듈을 직접 불러오기 위한 경로 (backend 디렉터리 기준 import)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+
+from services.audio_resample import StreamingResampler, decode_pcm, downmix
+from services.audio_stream import PcmStream
+from services.fraud_detector import FraudDetector
+from services.rate_limiter import MemoryBucketStore, RateLimiter
+from services.scheduler import PriorityScheduler, SchedulerDeadlineExceeded
+from services.single_flight import SingleFlight, file_key, text_key
+from services.scoring_rules import RuleSet, RuleSyntaxError
+
+RULE_FEATURES = ["a", "b", "c"]
+
 def test_text_analysis():
     """텍스트 분석 API 테스트"""
     url = "http://127.0.0.1:8000/api/voice/analyze-text"
@@ -90,7 +110,357 @@ def test_analysis_stats():
     else:
         print(f"[ERROR] 오류 발생: {response.status_code}")
 
+def _fired(source, **features):
+    """규칙 하나를 컴파일해 주어진 특징에서 적용되는지 확인"""
+    rule_set = RuleSet(source, RULE_FEATURES)
+    values = {name: features.get(name, False) for name in RULE_FEATURES}
+    return bool(rule_set.fired_rules(values, features.get("near", ())))
+
+def _rejected(source):
+    """규칙 컴파일이 RuleSyntaxError로 거절되는지 확인"""
+    try:
+        RuleSet(source, RULE_FEATURES)
+    except RuleSyntaxError:
+        return True
+    return False
+
+def test_scoring_rules():
+    """점수 규칙 문법 테스트 (연산자 우선순위, WITHIN 검증, 잘못된 규칙 거절)"""
+    print("\n[TEST] 점수 규칙 문법 테스트")
+    print("=" * 60)
+
+    # AND가 OR보다, NOT이 AND보다 먼저 결합
+    assert _fired("a OR b AND c => +1.0", a=True)
+    assert not _fired("a OR b AND c => +1.0", b=True)
+    assert not _fired("(a OR b) AND c => +1.0", a=True)
+    assert _fired("(a OR b) AND c => +1.0", b=True, c=True)
+    assert _fired("NOT a AND b => +1.0", b=True)
+    assert not _fired("NOT a AND b => +1.0", a=True, b=True)
+    assert _fired("NOT (a AND b) => +1.0", a=True)
+
+    # 등급 규칙은 위에서부터 처음 맞는 등급, 없으면 VERY_LOW
+    levels = RuleSet("score >= 7.0 => level HIGH\na AND score >= 3 => level MEDIUM", RULE_FEATURES)
+    no_features = {name: False for name in RULE_FEATURES}
+    assert levels.level(no_features, 8.0) == "HIGH"
+    assert levels.level({**no_features, "a": True}, 4.0) == "MEDIUM"
+    assert levels.level(no_features, 4.0) == "VERY_LOW"
+
+    # WITHIN은 특징을 AND로 이은 조건에만, 근접 조건이 충족된 경우에만 적용
+    within = RuleSet("a AND b WITHIN 50 => +1.0\nb AND a WITHIN 50 => +1.0", RULE_FEATURES)
+    assert within.proximity_groups == [(("a", "b"), 50), (("b", "a"), 50)]
+    assert not _fired("a AND b WITHIN 50 => +1.0", a=True, b=True)
+    assert _fired("a AND b WITHIN 50 => +1.0", a=True, b=True, near={0})
+    for source in ["a WITHIN 50 => +1.0", "a OR b WITHIN 50 => +1.0", "a AND NOT b WITHIN 50 => +1.0",
+                   "a AND (b) AND c WITHIN x => +1.0", "a AND b WITHIN 5.5 => +1.0", "a AND b WITHIN => +1.0"]:
+        assert _rejected(source), source
+
+    # 알 수 없는 특징(파이썬 이름 포함)과 가산점 규칙의 score 비교는 거절
+    for source in ["unknown => +1.0", "a AND __import__ => +1.0", "a AND b.c => +1.0",
+                   "score >= 5.0 => +1.0", "a OR score > 1 => +1.0", "a => level high", "a => 1.0", "=> +1.0"]:
+        assert _rejected(source), source
+
+    print("[OK] 점수 규칙 문법 테스트 통과")
+
+def _keywords(fraud_detector, text):
+    """텍스트에서 매칭된 키워드 (카테고리 구분 없이)"""
+    matches = fraud_detector.analyze_text(text)["keyword_matches"]
+    return {keyword for keywords in matches.values() for keyword in keywords}
+
+def test_keyword_spacing():
+    """키워드 띄어쓰기 테스트 (띄어 쓴 키워드만 토큰 경계를 넘어 매칭)"""
+    print("\n[TEST] 키워드 띄어쓰기 테스트")
+    print("=" * 60)
+    fraud_detector = FraudDetector()
+
+    # "계좌 이체"/"계좌이체"는 띄어쓰기, 조사, 보이지 않는 문자와 관계없이 매칭
+    for text in ["계좌 이체 해주세요", "계좌이체 해주세요", "계좌를 이체해 주세요", "계좌\u200b이체 해주세요"]:
+        assert "계좌이체" in _keywords(fraud_detector, text), text
+    assert {"지금", "바로", "이체"} <= _keywords(fraud_detector, "지금 바로 이체하세요")
+
+    # 띄어 쓰지 않은 키워드는 단어 경계를 넘어 매칭하지 않음
+    for text, keyword in [("우리 이 체육관 가자", "이체"), ("내일 사지 금요일에", "지금"),
+                          ("계 좌이체", "계좌이체")]:
+        assert keyword not in _keywords(fraud_detector, text), text
+    everyday = fraud_detector.analyze_text("우리 이 체육관 가자")
+    assert everyday["risk_score"] == 0.0 and everyday["risk_level"] == "VERY_LOW"
+
+    print("[OK] 키워드 띄어쓰기 테스트 통과")
+
+async def _scheduler_order(scheduler, requests):
+    """슬롯 하나를 잡아 둔 채 요청을 모두 줄 세운 뒤, 자리를 받은 순서를 반환"""
+    order = []
+    holder_entered, holder_release = asyncio.Event(), asyncio.Event()
+
+    async def holder():
+        async with scheduler.slot("interactive", "holder"):
+            holder_entered.set()
+            await holder_release.wait()
+
+    async def worker(client_id, name):
+        async with scheduler.slot("interactive", client_id):
+            order.append(name)
+
+    holding = asyncio.create_task(holder())
+    await holder_entered.wait()
+    workers = [asyncio.create_task(worker(client_id, name)) for client_id, name in requests]
+    await asyncio.sleep(0)
+    assert scheduler.status()["classes"]["interactive"]["queued"] == len(requests)
+    holder_release.set()
+    await asyncio.gather(holding, *workers)
+    return order
+
+async def _scheduler_deadlines():
+    scheduler = PriorityScheduler(concurrency=1)
+    release = asyncio.Event()
+
+    async def holder():
+        async with scheduler.slot("interactive", "holder"):
+            await release.wait()
+
+    # 대기 중 기한이 지나면 거절되고 대기 수에서 빠짐
+    holding = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    try:
+        async with scheduler.slot("interactive", "late", deadline_ms=20):
+            raise AssertionError("기한이 지난 작업이 실행되었습니다")
+    except SchedulerDeadlineExceeded:
+        pass
+    interactive = scheduler.status()["classes"]["interactive"]
+    assert interactive["dropped_deadline"] == 1 and interactive["queued"] == 0
+
+    # 평균 서비스 시간(약 50ms)을 안 뒤에는 기한보다 오래 기다려야 하는 작업을 줄 세우지 않고 바로 거절
+    release.set()
+    await holding
+    async with scheduler.slot("interactive", "slow"):
+        await asyncio.sleep(0.05)
+    release.clear()
+    holding = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    try:
+        async with scheduler.slot("interactive", "hurry", deadline_ms=5):
+            raise AssertionError("기한 안에 시작할 수 없는 작업이 실행되었습니다")
+    except SchedulerDeadlineExceeded:
+        pass
+    interactive = scheduler.status()["classes"]["interactive"]
+    assert interactive["dropped_deadline"] == 2 and interactive["queued"] == 0
+
+    # 기다리다 취소된 작업도 대기 수에서 빠지고 자리를 차지하지 않음
+    waiting = asyncio.create_task(scheduler.slot("interactive", "gone").__aenter__())
+    await asyncio.sleep(0)
+    assert scheduler.queued == 1
+    waiting.cancel()
+    await asyncio.gather(waiting, return_exceptions=True)
+    release.set()
+    await holding
+    status = scheduler.status()
+    assert scheduler.queued == 0 and status["running"] == 0 and status["classes"]["interactive"]["running"] == 0
+
+def test_scheduler():
+    """작업 스케줄러 테스트 (가중 공정 큐 순서, 기한 초과 거절)"""
+    print("\n[TEST] 작업 스케줄러 테스트")
+    print("=" * 60)
+
+    # 같은 등급 안에서는 종료 태그 순: 가중치 2인 b는 a보다 두 배 자주 자리를 받음 (같은 태그면 먼저 온 순)
+    scheduler = PriorityScheduler(concurrency=1, client_weights={"b": 2.0})
+    requests_in = [("a", "a1"), ("a", "a2"), ("a", "a3"), ("b", "b1"), ("b", "b2"), ("b", "b3")]
+    assert asyncio.run(_scheduler_order(scheduler, requests_in)) == ["b1", "a1", "b2", "b3", "a2", "a3"]
+    # 한 클라이언트가 먼저 몰아 보내도 다른 클라이언트와 번갈아 실행
+    scheduler = PriorityScheduler(concurrency=1)
+    requests_in = [("a", "a1"), ("a", "a2"), ("a", "a3"), ("b", "b1"), ("b", "b2")]
+    assert asyncio.run(_scheduler_order(scheduler, requests_in)) == ["a1", "b1", "a2", "b2", "a3"]
+    assert scheduler.status()["classes"]["interactive"]["completed"] == 6
+
+    asyncio.run(_scheduler_deadlines())
+
+    print("[OK] 작업 스케줄러 테스트 통과")
+
+def test_rate_limiter():
+    """요청 한도 테스트 (토큰 버킷 보충, 되돌림/정산, 저장소 행 재사용)"""
+    print("\n[TEST] 요청 한도 테스트")
+    print("=" * 60)
+
+    # 초당 1개 보충, 최대 2개 적립 (시각을 직접 넘겨 보충량 확인)
+    rates, bursts = np.array([1.0, 0.0]), np.array([2.0, 0.0])
+    store = MemoryBucketStore(max_clients=2)
+    assert store.take("a", 0, 2.0, rates, bursts, now=0.0, check=True) == (True, 0.0)
+    assert store.take("a", 0, 1.0, rates, bursts, now=0.5, check=True) == (False, 0.5)
+    assert store.take("a", 0, 1.0, rates, bursts, now=1.0, check=True) == (True, 0.0)
+    # 오래 쉬어도 최대 적립량까지만 보충
+    assert store.take("a", 0, 0.0, rates, bursts, now=100.0, check=True) == (True, 2.0)
+
+    # 가득 차면 가장 오래 사용하지 않은 클라이언트(b)의 행을 새 클라이언트(c)가 가득 찬 버킷으로 재사용
+    store.take("b", 0, 2.0, rates, bursts, now=50.0, check=True)
+    store.take("a", 0, 1.0, rates, bursts, now=101.0, check=True)
+    assert store.take("c", 0, 2.0, rates, bursts, now=101.0, check=True) == (True, 0.0)
+    assert set(store.usage()) == {"a", "c"}
+    assert store.usage()["c"] == ([2.0, 0.0], [0, 0])
+
+    # 음성 분당 60초(초당 1초), 최대 10초 적립: 선차감 후 되돌림/정산
+    limiter = RateLimiter({"audio": (60.0, 10.0)})
+    assert limiter.acquire("client", "text", 1000.0) == (True, 0.0)
+    assert limiter.acquire("client", "audio", 10.0)[0]
+    allowed, retry_after = limiter.acquire("client", "audio", 1.0)
+    assert not allowed and 0.9 < retry_after < 1.1
+    limiter.refund("client", "audio", 4.0)
+    assert limiter.acquire("client", "audio", 4.0)[0]
+    # 4초를 예약했는데 실제로는 1초였으면 3초를 되돌리고, 예약보다 길었으면 모자란 만큼 더 차감
+    limiter.settle("client", "audio", reserved=4.0, actual=1.0)
+    assert limiter.acquire("client", "audio", 3.0)[0]
+    limiter.settle("client", "audio", reserved=0.0, actual=2.0)
+    allowed, retry_after = limiter.acquire("client", "audio", 0.0)
+    assert not allowed and 1.9 < retry_after < 2.1
+
+    status = limiter.status()
+    assert status["rejected"] == {"text": 0, "audio": 2}
+    assert status["top_clients"][0]["audio_seconds"] == 12.0
+
+    print("[OK] 요청 한도 테스트 통과")
+
+def _resample_blocks(signal, source_rate, target_rate, block_sizes):
+    """신호를 주어진 크기의 블록으로 나누어 리샘플링한 결과"""
+    resampler = StreamingResampler(source_rate, target_rate)
+    outputs, start = [], 0
+    for size in block_sizes:
+        outputs.append(resampler.process(signal[start:start + size]))
+        start += size
+    outputs.append(resampler.process(signal[start:]))
+    outputs.append(resampler.flush())
+    return np.concatenate(outputs)
+
+def test_resampler():
+    """리샘플러 테스트 (블록 경계와 관계없이 한 번에 처리한 결과와 같음)"""
+    print("\n[TEST] 리샘플러 테스트")
+    print("=" * 60)
+    rng = np.random.default_rng(0)
+
+    for source_rate, target_rate in [(44100, 16000), (48000, 16000), (22050, 16000)]:
+        signal = (0.5 * np.sin(2 * np.pi * 440 * np.arange(source_rate) / source_rate)
+                  + 0.1 * rng.standard_normal(source_rate)).astype(np.float32)
+        whole = _resample_blocks(signal, source_rate, target_rate, [])
+        assert len(whole) == -(-len(signal) * target_rate // source_rate)
+        for block_sizes in [[1] * 500, [7] * 300, [160] * 100, [4410] * 5, rng.integers(0, 3000, 20).tolist()]:
+            blocks = _resample_blocks(signal, source_rate, target_rate, block_sizes)
+            assert len(blocks) == len(whole)
+            assert np.allclose(blocks, whole, atol=1e-5), (source_rate, block_sizes[:3])
+
+    # 저역 신호는 목표 샘플레이트에서 본래 파형 그대로 (필터가 0으로 채우는 앞뒤 구간 제외)
+    tone = np.sin(2 * np.pi * 440 * np.arange(48000) / 48000).astype(np.float32)
+    resampled = _resample_blocks(tone, 48000, 16000, [1000] * 10)
+    expected = np.sin(2 * np.pi * 440 * np.arange(len(resampled)) / 16000)
+    assert np.abs(resampled[100:-100] - expected[100:-100]).max() < 1e-2
+
+    # 목표가 더 높으면 그대로 통과
+    assert np.array_equal(_resample_blocks(tone, 8000, 16000, [333] * 10), tone)
+
+    # 16bit 스테레오 PCM 디코딩과 모노 변환
+    stereo = np.array([[0, 16384], [-32768, 32767]], dtype="<i2")
+    samples = decode_pcm(stereo.tobytes(), 2, 2)
+    assert samples.shape == (2, 2) and samples[1, 0] == -1.0
+    assert np.allclose(downmix(samples), [0.25, (-32768 + 32767) / 65536])
+
+    # WAV 스트림을 블록 단위로 읽어도 한 번에 리샘플링한 결과와 같음
+    pcm = (np.stack([tone, tone * 0.5], axis=1) * 32767).astype("<i2")
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
+        path = temp_file.name
+    try:
+        with wave.open(path, "wb") as wav:
+            wav.setnchannels(2)
+            wav.setsampwidth(2)
+            wav.setframerate(48000)
+            wav.writeframes(pcm.tobytes())
+        with PcmStream(path, 16000, block_seconds=0.07) as stream:
+            assert stream.info["sample_rate"] == 16000 and stream.info["original_channels"] == 2
+            streamed = np.concatenate(list(stream))
+        whole = _resample_blocks(downmix(decode_pcm(pcm.tobytes(), 2, 2)), 48000, 16000, [])
+        assert len(streamed) == len(whole) and np.allclose(streamed, whole, atol=1e-5)
+    finally:
+        os.remove(path)
+
+    print("[OK] 리샘플러 테스트 통과")
+
+async def _single_flight_calls():
+    single_flight = SingleFlight()
+    started = asyncio.Event()
+    finish = asyncio.Event()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        started.set()
+        await finish.wait()
+        return {"risk_score": 0.5}
+
+    # 같은 키로 동시에 들어온 요청은 한 번만 계산하고, 나누어 받은 쪽은 복사본을 받음
+    first = asyncio.create_task(single_flight.run("same", compute))
+    await started.wait()
+    others = [asyncio.create_task(single_flight.run("same", compute)) for _ in range(4)]
+    await asyncio.sleep(0)
+    assert single_flight.in_flight == 1
+    finish.set()
+    (result, shared), *rest = await asyncio.gather(first, *others)
+    assert len(calls) == 1 and not shared and all(other_shared for _, other_shared in rest)
+    assert all(other == result and other is not result for other, _ in rest)
+    assert single_flight.status() == {"in_flight": 0, "executed": 1, "shared": 4}
+
+    # 계산이 끝난 뒤 같은 키는 다시 계산 (결과를 보관하지 않음)
+    await single_flight.run("same", compute)
+    assert len(calls) == 2
+
+    # 예외는 기다리던 요청 모두에게 전달되고 키는 정리됨
+    failing = asyncio.Event()
+
+    async def fail():
+        await failing.wait()
+        raise ValueError("분석 실패")
+
+    waiters = [asyncio.create_task(single_flight.run("broken", fail)) for _ in range(3)]
+    await asyncio.sleep(0)
+    failing.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert all(isinstance(error, ValueError) for error in results)
+    assert single_flight.in_flight == 0
+
+    # 먼저 요청한 쪽이 취소되어도 기다리던 요청은 결과를 받음
+    finish.clear()
+    first = asyncio.create_task(single_flight.run("cancel", compute))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(single_flight.run("cancel", compute))
+    await asyncio.sleep(0)
+    first.cancel()
+    finish.set()
+    assert (await second) == ({"risk_score": 0.5}, True)
+
+def test_single_flight():
+    """동시 중복 요청 합치기 테스트 (결과 공유, 예외 전달, 내용 키)"""
+    print("\n[TEST] 동시 중복 요청 합치기 테스트")
+    print("=" * 60)
+
+    asyncio.run(_single_flight_calls())
+
+    # 파일 키는 경로/파일 객체 모두 내용 기준이고, 파일 객체는 처음 위치로 되돌림
+    assert text_key("계좌 이체") == text_key("계좌 이체") != text_key("계좌이체")
+    content = b"RIFF" + bytes(range(256)) * 20
+    with tempfile.NamedTemporaryFile(delete=False) as named_file:
+        named_file.write(content)
+    try:
+        with tempfile.TemporaryFile() as audio_file, tempfile.TemporaryFile() as copy_file:
+            audio_file.write(content)
+            assert file_key(audio_file, chunk_size=1000, copy_to=copy_file) == file_key(named_file.name)
+            assert audio_file.tell() == 0
+            copy_file.seek(0)
+            assert copy_file.read() == content
+    finally:
+        os.remove(named_file.name)
+
+    print("[OK] 동시 중복 요청 합치기 테스트 통과")
+
 if __name__ == "__main__":
+    test_scoring_rules()
+    test_keyword_spacing()
+    test_scheduler()
+    test_rate_limiter()
+    test_resampler()
+    test_single_flight()
     try:
         test_text_analysis()
         test_fraud_keywords()